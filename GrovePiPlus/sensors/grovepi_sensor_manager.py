@@ -3,6 +3,7 @@ import os
 import sys
 import random
 import time
+import collections
 from datetime import datetime
 from PyQt5.QtCore import pyqtSignal, QObject
 
@@ -23,6 +24,13 @@ except ImportError:
     GROVEPI_AVAILABLE = False
     print("WARNING: grovepi library not found. Running in MOCK mode only.")
 
+# One complete set of sensor readings, emitted by SensorWorker once per read cycle.
+# Immutable, so it can be handed across threads without being changed underneath a reader.
+# timestamp is the datetime the readings were taken.
+SensorReading = collections.namedtuple(
+    "SensorReading",
+    ("temperature", "humidity", "ultrasonic", "sound", "light", "button", "rotary_angle", "timestamp"))
+
 class GrovePiSensorManager(QObject):
     """
     Manages all GrovePi+ sensor interactions, including reading values
@@ -135,18 +143,20 @@ class GrovePiSensorManager(QObject):
     def log_sensor_data(self, data):
         """
         Logs sensor data to a CSV file.
+        :param data: A SensorReading; its own timestamp is written, so readings queued
+                     for logging keep the time they were taken.
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = data.timestamp.strftime("%Y-%m-%d %H:%M:%S")
         try:
             line = "{},{},{},{},{},{},{},{}\n".format(
                 timestamp,
-                data.get("temperature", ""),
-                data.get("humidity", ""),
-                data.get("ultrasonic", ""),
-                data.get("sound", ""),
-                data.get("light", ""),
-                data.get("button", ""),
-                data.get("rotary_angle", "")
+                data.temperature,
+                data.humidity,
+                data.ultrasonic,
+                data.sound,
+                data.light,
+                data.button,
+                data.rotary_angle
             )
             with open(self.sensor_log_file, 'a') as f:
                 f.write(line)
@@ -155,6 +165,24 @@ class GrovePiSensorManager(QObject):
 
     # --- Sensor Reading Functions ---
 
+    def read_all(self):
+        """
+        Reads every sensor in one call.
+        :return: A SensorReading stamped with the time the reads started.
+        """
+        timestamp = datetime.now()
+        temp, hum = self.read_dht_sensor()
+        return SensorReading(
+            temperature=temp,
+            humidity=hum,
+            ultrasonic=self.read_ultrasonic_sensor(),
+            sound=self.read_sound_sensor(),
+            light=self.read_light_sensor(),
+            button=self.read_button_sensor(),
+            rotary_angle=self.read_rotary_angle_sensor(),
+            timestamp=timestamp
+        )
+
     def read_dht_sensor(self):
         """Reads temperature and humidity from DHT sensor on D2."""
         if self.mock_sensors:
@@ -99,10 +99,16 @@ class BasicAnalogSensorsTab(QWidget):
             self.sound_gauge = GaugeWidget("Sound", "raw", 0, 1023, config_manager=self.config)
             self.light_gauge = GaugeWidget("Light", "raw", 0, 1023, config_manager=self.config)
         elif sensor_display_type == "Gauge Widget One":
+            # Resolve the theme once for the whole batch instead of once per gauge
+            GaugeWidgetOne.set_current_theme(self.config.get_setting("current_theme", "dark_theme"))
             # Pass config_manager to GaugeWidgetOne for theme awareness
             self.ultrasonic_gauge = GaugeWidgetOne("Ultrasonic", 0, 300, "cm", config_manager=self.config)
             self.sound_gauge = GaugeWidgetOne("Sound", 0, 1023, "Raw", config_manager=self.config)
             self.light_gauge = GaugeWidgetOne("Light", 0, 1023, "Raw", config_manager=self.config)
+            GaugeWidgetOne.set_current_theme(None) # Don't let the batch theme outlive a theme change
+            # All three are set from each sensor payload; repaint them together in one pass
+            for gauge in (self.ultrasonic_gauge, self.sound_gauge, self.light_gauge):
+                gauge.COALESCE_INTERVAL_MS = 50
         elif sensor_display_type == "Gauge Widget Multi Ring":
             # Pass config_manager to GaugeWidgetMultiRing for theme awareness
             self.ultrasonic_gauge = GaugeWidgetMultiRing("Ultrasonic", 0, 300, "cm", config_manager=self.config)
@@ -137,6 +143,15 @@ class BasicAnalogSensorsTab(QWidget):
         self._set_theme_colors()
 
 
+    def update_from_payload(self, payload):
+        """
+        Updates the tab from one SensorWorker reading.
+        This slot is connected to the SensorWorker's sensor_data_updated signal.
+        """
+        self.update_ultrasonic_data(payload.ultrasonic)
+        self.update_sound_data(payload.sound)
+        self.update_light_data(payload.light)
+
     def update_ultrasonic_data(self, distance):
         """Updates the Ultrasonic gauge."""
         if self.ultrasonic_gauge:
@@ -354,6 +369,14 @@ class BasicAnalogSensorsTab(QWidget):
         self.set_style()
 
 
+    def apply_theme(self):
+        """
+        Re-applies the current theme: the tab stylesheet, then the gauge colors.
+        Called by MainWindow._apply_theme.
+        """
+        self.set_style()
+        self._set_theme_colors()
+
     def set_style(self):
         """Applies specific styling for the tab using themed colors."""
         self.setStyleSheet("""
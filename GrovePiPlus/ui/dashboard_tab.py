@@ -229,15 +229,15 @@ class DashboardTab(QWidget):
         Receives comprehensive sensor data and updates all relevant gauges and labels.
         This slot is connected to the SensorWorker's sensor_data_updated signal.
         """
-        self.dht_temp_gauge.set_value(data.get("temperature", 0))
-        self.dht_hum_gauge.set_value(data.get("humidity", 0))
-        self.ultrasonic_gauge.set_value(data.get("ultrasonic", 0))
-        self.sound_gauge.set_value(data.get("sound", 0))
-        self.light_gauge.set_value(data.get("light", 0))
-        self.rotary_angle_gauge.set_value(data.get("rotary_angle", 0))
+        self.dht_temp_gauge.set_value(data.temperature)
+        self.dht_hum_gauge.set_value(data.humidity)
+        self.ultrasonic_gauge.set_value(data.ultrasonic)
+        self.sound_gauge.set_value(data.sound)
+        self.light_gauge.set_value(data.light)
+        self.rotary_angle_gauge.set_value(data.rotary_angle)
 
         # Update button status
-        button_state = data.get("button", 0)
+        button_state = data.button
         self.button_label.setText("Button: {}".format("ON" if button_state == 1 else "OFF"))
 
         # Relay and LED Bar status are updated via separate signals in main_window.py
@@ -263,6 +263,14 @@ class DashboardTab(QWidget):
         self.led_bar_dashboard_widget.set_lit_segments(level)
 
 
+    def apply_theme(self):
+        """
+        Re-applies the current theme: the tab stylesheet, then the gauge colors.
+        Called by MainWindow._apply_theme.
+        """
+        self.set_style()
+        self._set_theme_colors_for_gauges()
+
     def set_style(self):
         """Applies specific styling for the dashboard tab."""
         self.setStyleSheet("""
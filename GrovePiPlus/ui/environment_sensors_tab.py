@@ -116,8 +116,11 @@ class EnvironmentSensorsTab(QWidget):
             self.temp_gauge = GaugeWidget("Temperature", "°C", 0, 50, config_manager=self.config)
             self.hum_gauge = GaugeWidget("Humidity", "%", 0, 100, config_manager=self.config)
         elif sensor_display_type == "Gauge Widget One":
+            # Resolve the theme once for the whole batch instead of once per gauge
+            GaugeWidgetOne.set_current_theme(self.config.get_setting("current_theme", "dark_theme"))
             self.temp_gauge = GaugeWidgetOne("Temperature", 0, 50, "°C", sensor_thresholds=temp_thresholds, config_manager=self.config)
             self.hum_gauge = GaugeWidgetOne("Humidity", 0, 100, "%", sensor_thresholds=hum_thresholds, config_manager=self.config)
+            GaugeWidgetOne.set_current_theme(None) # Don't let the batch theme outlive a theme change
         elif sensor_display_type == "Gauge Widget Multi Ring":
             self.temp_gauge = GaugeWidgetMultiRing("Temperature", 0, 50, "°C", sensor_thresholds=temp_thresholds, config_manager=self.config)
             self.hum_gauge = GaugeWidgetMultiRing("Humidity", 0, 100, "%", sensor_thresholds=hum_thresholds, config_manager=self.config)
@@ -139,10 +142,16 @@ class EnvironmentSensorsTab(QWidget):
         # Apply current theme colors to the newly created gauges
         self._set_theme_colors()
 
+    def update_from_payload(self, payload):
+        """
+        Updates the tab from one SensorWorker reading.
+        This slot is connected to the SensorWorker's sensor_data_updated signal.
+        """
+        self.update_dht_data(payload.temperature, payload.humidity)
+
     def update_dht_data(self, temperature, humidity):
         """
         Updates the Temperature and Humidity gauges.
-        This slot is connected to the SensorWorker's dht_data_updated signal.
         """
         # Ensure gauges exist before attempting to update their values
         if self.temp_gauge and self.hum_gauge:
@@ -356,6 +365,14 @@ class EnvironmentSensorsTab(QWidget):
         # Re-apply the overall QSS for the tab and its content frame to ensure colors are updated
         self.set_style()
 
+    def apply_theme(self):
+        """
+        Re-applies the current theme: the tab stylesheet, then the gauge and frame colors.
+        Called by MainWindow._apply_theme.
+        """
+        self.set_style()
+        self._set_theme_colors()
+
     def set_style(self):
         """Applies specific styling for the tab using themed colors."""
         self.setStyleSheet("""
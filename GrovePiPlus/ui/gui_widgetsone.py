@@ -1,16 +1,35 @@
-from PyQt5.QtWidgets import QWidget, QLabel, QSizePolicy
-from PyQt5.QtGui import QFont, QColor, QPainter, QPen
-from PyQt5.QtCore import Qt, QRect, QSize # Import QSize
+from PyQt5.QtWidgets import QWidget, QLabel, QSizePolicy, QApplication
+from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QStaticText, QTransform
+from PyQt5.QtCore import Qt, QRectF, QPointF, QSize, QTimer # Import QSize
 
-import math # For math.isnan
 from utils.config_manager import ConfigManager # Import ConfigManager for theme access
 
+# Shared cache of parsed colors so repeated theme applications don't re-parse the same strings
+_COLOR_CACHE = {}
+
+def _qc(color_str):
+    """Returns a cached QColor for the given color string, parsing it only once."""
+    color = _COLOR_CACHE.get(color_str)
+    return color if color is not None else _COLOR_CACHE.setdefault(color_str, QColor(color_str))
+
 class GaugeWidgetOne(QWidget):
     """
     A custom PyQt5 widget designed to display a sensor value as a gauge.
     It shows a circular gauge with a value display in the center and a title.
     The outer ring changes color based on the value's proximity to defined thresholds.
     """
+    # Shared repaint driver: gauges changed within the same interval are repainted
+    # together in one event-loop pass instead of each scheduling its own update.
+    # Off (0) by default, so set_value repaints immediately; a tab showing many gauges
+    # fed from the same payload opts in by setting COALESCE_INTERVAL_MS on its gauges.
+    COALESCE_INTERVAL_MS = 0
+    _dirty = set()
+    _timer = None
+
+    # Theme name for gauges built next (set via set_current_theme) so that building
+    # many gauges needs a single config lookup; None falls back to the ConfigManager.
+    _current_theme = None
+
     def __init__(self, title, min_val, max_val, unit="", sensor_thresholds=None, config_manager=None, parent=None):
         """
         Initializes the GaugeWidgetOne.
@@ -34,20 +53,42 @@ class GaugeWidgetOne(QWidget):
         self._value = float('nan') # Initialize current value to NaN for "no data" state
         self._alert_level = "NORMAL" # Initialize alert level
 
+        # Units in this list are shown in the title instead of next to the value
+        units_to_move = ("Raw", "cm", "%", "°C", "°F")
+
+        # Value text formats are fixed per gauge, so build them once instead of in paintEvent
+        if self.original_unit in units_to_move:
+            self._fmt_with_unit = "{:.1f}"
+            self._nan_text = "--"
+        else:
+            self._fmt_with_unit = "{:.1f}" + self.original_unit
+            self._nan_text = "--{0}".format(self.original_unit)
+
+        # Adjust title based on original unit, appending the unit in parentheses if applicable
+        self._displayed_title = self.title
+        if self.original_unit in units_to_move:
+            self._displayed_title = "{0} ({1})".format(self.title, self.original_unit)
+        self._title_static = QStaticText(self._displayed_title) # Glyph layout cached between paints
+
         # Store the actual sensor-specific thresholds
         self.sensor_thresholds = sensor_thresholds if sensor_thresholds is not None else {}
 
-        self.config = config_manager if config_manager else ConfigManager.get_instance() # Get config instance
+        self.config = config_manager # Resolved lazily, only needed when no shared theme is set
         self._set_theme_colors_internal() # Set initial theme colors based on current config
 
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding) # Changed to Expanding for full responsiveness
+        self._update_geometry() # Compute initial drawing geometry; refreshed in resizeEvent
 
     def _set_theme_colors_internal(self):
         """
         Sets internal color attributes based on the current theme from ConfigManager.
         This method is called internally or when the theme changes.
         """
-        current_theme = self.config.get_setting("current_theme", "dark_theme")
+        current_theme = GaugeWidgetOne._current_theme
+        if current_theme is None:
+            if self.config is None:
+                self.config = ConfigManager.get_instance() # Get config instance
+            current_theme = self.config.get_setting("current_theme", "dark_theme")
         theme_palettes = {
             "dark_theme": {
                 "background_color": QColor("#3A3A3A"), # Dark gray for the main filled background circle
@@ -166,9 +207,22 @@ class GaugeWidgetOne(QWidget):
             "WARNING_LOW": palette["warning_color"],
             "NORMAL": palette["accent_color"] # For GaugeWidgetOne, "NORMAL" uses accent_color for the fill
         }
+        self._theme_color_strings = None # Colors no longer match the last set_theme_colors() call
         self.update() # Trigger repaint
 
 
+    @classmethod
+    def set_current_theme(cls, theme_name):
+        """
+        Sets the theme used by GaugeWidgetOne instances constructed from now on. Call it
+        before constructing a batch of gauges and with None afterwards, so later gauges
+        read the theme from the config again. Existing gauges are left alone: their tabs
+        give them colors through set_theme_colors() and re-theme them in apply_theme().
+
+        :param theme_name: The name of the theme (e.g., "dark_theme"), or None.
+        """
+        cls._current_theme = theme_name
+
     def set_theme_colors(self, bg_color: str, border_color: str, text_color: str,
                          accent_color: str, critical_color: str, warning_color: str,
                          normal_color: str, gauge_fill_color: str):
@@ -176,18 +230,24 @@ class GaugeWidgetOne(QWidget):
         Public method to set the theme-specific colors for the gauge widget from external calls.
         This allows external components like tabs to update the gauge's colors.
         """
-        self.background_color = QColor(bg_color)
-        self.border_color = QColor(border_color)
-        self.text_color = QColor(text_color)
-        self.fill_color = QColor(gauge_fill_color) # Corresponds to the unfilled part of the track
-        self.accent_color = QColor(accent_color) # Corresponds to the filled part of the track
+        color_strings = (bg_color, border_color, text_color, accent_color,
+                         critical_color, warning_color, normal_color, gauge_fill_color)
+        if color_strings == self._theme_color_strings:
+            return # Same colors already applied, nothing to repaint
+        self._theme_color_strings = color_strings
+
+        self.background_color = _qc(bg_color)
+        self.border_color = _qc(border_color)
+        self.text_color = _qc(text_color)
+        self.fill_color = _qc(gauge_fill_color) # Corresponds to the unfilled part of the track
+        self.accent_color = _qc(accent_color) # Corresponds to the filled part of the track
         
         # Explicitly set alert colors based on the passed parameters
-        self.threshold_colors["CRITICAL_HIGH"] = QColor(critical_color)
-        self.threshold_colors["CRITICAL_LOW"] = QColor(critical_color)
-        self.threshold_colors["WARNING_HIGH"] = QColor(warning_color)
-        self.threshold_colors["WARNING_LOW"] = QColor(warning_color)
-        self.threshold_colors["NORMAL"] = QColor(normal_color) # Use normal_color passed in
+        self.threshold_colors["CRITICAL_HIGH"] = _qc(critical_color)
+        self.threshold_colors["CRITICAL_LOW"] = _qc(critical_color)
+        self.threshold_colors["WARNING_HIGH"] = _qc(warning_color)
+        self.threshold_colors["WARNING_LOW"] = _qc(warning_color)
+        self.threshold_colors["NORMAL"] = _qc(normal_color) # Use normal_color passed in
 
         self.update() # Trigger repaint
 
@@ -198,19 +258,53 @@ class GaugeWidgetOne(QWidget):
 
         :param value: The new sensor value.
         """
-        if value is not None and not math.isnan(value):
+        old_value, old_alert_level = self._value, self._alert_level
+        if value is not None and value == value: # value != value only for NaN
             self._value = value
             self._update_alert_level() # Update alert level based on new value
         else:
             self._value = float('nan') # Use NaN to indicate no valid data
             self._alert_level = "NORMAL" # Reset to normal if no data
-        self.update() # Trigger a repaint of the widget
+
+        # Skip the repaint if nothing visible changed (NaN -> NaN compares unequal, so check explicitly)
+        if self._alert_level == old_alert_level and (
+                self._value == old_value or (self._value != self._value and old_value != old_value)):
+            return
+        self._schedule_update()
+
+    def _schedule_update(self):
+        """
+        Queues this gauge for the next shared repaint pass. Falls back to an
+        immediate update() when coalescing is disabled or no QApplication exists.
+        """
+        cls = GaugeWidgetOne
+        if self.COALESCE_INTERVAL_MS <= 0 or QApplication.instance() is None:
+            self.update() # Trigger a repaint of the widget
+            return
+        cls._dirty.add(self)
+        if cls._timer is None:
+            cls._timer = QTimer()
+            cls._timer.setSingleShot(True)
+            cls._timer.timeout.connect(cls._flush_dirty)
+        if not cls._timer.isActive():
+            cls._timer.start(self.COALESCE_INTERVAL_MS)
+
+    @staticmethod
+    def _flush_dirty():
+        """Repaints every gauge queued since the last flush."""
+        dirty = GaugeWidgetOne._dirty
+        GaugeWidgetOne._dirty = set()
+        for gauge in dirty:
+            try:
+                gauge.update()
+            except RuntimeError:
+                pass # Gauge was deleted (e.g. display type changed) before the flush
 
     def _update_alert_level(self):
         """
         Determines the current alert level based on the sensor's actual thresholds.
         """
-        if math.isnan(self._value):
+        if self._value != self._value: # NaN
             self._alert_level = "NORMAL" # Default to normal if no valid data
             return
 
@@ -233,34 +327,64 @@ class GaugeWidgetOne(QWidget):
             self._alert_level = "NORMAL" # Value is within normal operating range
 
 
+    def resizeEvent(self, event):
+        """
+        Recomputes the cached drawing geometry whenever the widget is resized.
+        """
+        super().resizeEvent(event)
+        self._update_geometry()
+
+    def _update_geometry(self):
+        """
+        Computes the arc, center circle and title rectangles, the pen width and the
+        fonts in physical pixel coordinates. The layout is designed on a virtual
+        200x200 canvas centered in the widget, so everything is scaled by side / 200.
+        Caching this here lets paintEvent draw without any painter transform.
+        """
+        rect = self.rect()
+        side = min(rect.width(), rect.height()) # Get the smaller side to keep it square
+        s = side / 200.0
+        center = QRectF(rect).center()
+        cx, cy = center.x(), center.y()
+
+        self._arc_rect_px = QRectF(cx - 90 * s, cy - 90 * s, 180 * s, 180 * s) # Centered 180x180 arc
+        self._center_rect_px = QRectF(cx - 50 * s, cy - 50 * s, 100 * s, 100 * s) # Center circle / value text
+        title_vertical_offset_from_bottom = 25
+        self._title_rect_px = QRectF(cx - 100 * s, cy + (100 - title_vertical_offset_from_bottom) * s,
+                                     200 * s, title_vertical_offset_from_bottom * s) # Full width, bottom band
+        self._pen_width = max(1, int(12 * s))
+
+        # Fonts are specified in virtual canvas points, so scale them to the physical size
+        self._value_font = QFont("Arial")
+        self._value_font.setPointSizeF(max(1.0, 20 * s))
+        self._value_font.setBold(True)
+        self._title_font = QFont("Arial")
+        self._title_font.setPointSizeF(max(1.0, 10 * s))
+        self._title_font.setBold(False)
+        self._title_static.prepare(QTransform(), self._title_font) # Re-layout only when the font changes
+
     def paintEvent(self, event):
         """
         Paints the gauge widget, including the background arc, active value arc,
         center circle, current value text, and title text. The active arc's
         color is determined by the current alert level.
+        All geometry is precomputed in physical pixels by _update_geometry().
         """
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        rect = self.rect()
-        side = min(rect.width(), rect.height()) # Get the smaller side to keep it square
-
-        # Scale the painter to a virtual 200x200 canvas.
-        # This allows all drawing coordinates to be defined relative to a 200x200 square,
-        # and they will automatically scale to the actual widget size.
-        painter.translate(rect.center())
-        painter.scale(side / 200.0, side / 200.0)
-        painter.translate(-100, -100) # Translate back so (0,0) is top-left of virtual 200x200 canvas
-
-        # Define the bounding rectangle for the arc
-        arc_rect = QRectF(10, 10, 180, 180) # Virtual 200x200 canvas, centered 180x180 arc
+        arc_rect = self._arc_rect_px
+        is_nan = self._value != self._value # Single NaN test for the whole paint
 
         # Draw the background track (unfilled part)
-        painter.setPen(QPen(self.fill_color, 12, Qt.SolidLine, Qt.RoundCap))
+        painter.setPen(QPen(self.fill_color, self._pen_width, Qt.SolidLine, Qt.RoundCap))
         painter.drawArc(arc_rect, 135 * 16, -270 * 16) # Arc from 135 to -135 (270 degrees total)
 
-        # Draw the filled arc based on the current value
-        if not math.isnan(self._value):
+        if is_nan:
+            # No data: skip the filled arc entirely
+            display_value_text = self._nan_text
+        else:
+            # Draw the filled arc based on the current value
             angle_range = 270 # Total degrees for the gauge
             value_range = self.max_val - self.min_val
             
@@ -276,64 +400,26 @@ class GaugeWidgetOne(QWidget):
 
             # Get color based on alert level
             active_arc_color = self.threshold_colors.get(self._alert_level, self.accent_color)
-            painter.setPen(QPen(active_arc_color, 12, Qt.SolidLine, Qt.RoundCap))
+            painter.setPen(QPen(active_arc_color, self._pen_width, Qt.SolidLine, Qt.RoundCap))
             painter.drawArc(arc_rect, 135 * 16, fill_angle * 16)
+            display_value_text = self._fmt_with_unit.format(self._value)
 
         # Draw the central circle (background for value text)
         painter.setBrush(self.background_color)
         painter.setPen(Qt.NoPen)
-        painter.drawEllipse(QRectF(50, 50, 100, 100)) # Center circle in virtual 200x200 canvas
+        painter.drawEllipse(self._center_rect_px)
 
         # Prepare font for value
-        value_font = QFont("Arial", 20)
-        value_font.setBold(True)
-        painter.setFont(value_font)
+        painter.setFont(self._value_font)
         painter.setPen(self.text_color)
 
-        # Define units that should be moved to the title
-        units_to_move = ["Raw", "cm", "%", "°C", "°F"]
-
-        # Modify display_value_text based on whether the original unit is in the list
-        display_value_text = ""
-        if math.isnan(self._value):
-            if self.original_unit in units_to_move:
-                display_value_text = "--"
-            else:
-                display_value_text = "--{0}".format(self.original_unit)
-        else:
-            if self.original_unit in units_to_move:
-                display_value_text = "{:.1f}".format(self._value)
-            else:
-                display_value_text = "{:.1f}{0}".format(self._value, self.original_unit)
-
         # Draw the value text
-        value_text_draw_rect = QRect(50, 50, 100, 100)
-        painter.drawText(value_text_draw_rect, Qt.AlignCenter, display_value_text)
+        painter.drawText(self._center_rect_px, Qt.AlignCenter, display_value_text)
 
-        # Draw the gauge title below the value
-        title_font = QFont("Arial", 10)
-        title_font.setBold(False)
-        painter.setFont(title_font)
-        painter.setPen(self.text_color)
-
-        # Adjust title based on original unit, appending the unit in parentheses if applicable
-        displayed_title = self.title
-        if self.original_unit == "Raw":
-            displayed_title = "{0} (Raw)".format(self.title)
-        elif self.original_unit == "cm":
-            displayed_title = "{0} (cm)".format(self.title)
-        elif self.original_unit == "%":
-            displayed_title = "{0} (%)".format(self.title)
-        elif self.original_unit == "°C":
-            displayed_title = "{0} (°C)".format(self.title)
-        elif self.original_unit == "°F":
-            displayed_title = "{0} (°F)".format(self.title)
-
-        title_vertical_offset_from_bottom = 25
-        title_y_pos = 200 - title_vertical_offset_from_bottom
-        
-        title_draw_rect = QRect(0, int(title_y_pos), 200, title_vertical_offset_from_bottom) # Full width (0-200)
-        painter.drawText(title_draw_rect, Qt.AlignHCenter | Qt.AlignTop, displayed_title)
+        # Draw the gauge title below the value (pen is still text_color from the value draw)
+        painter.setFont(self._title_font)
+        title_x = self._title_rect_px.center().x() - self._title_static.size().width() / 2.0
+        painter.drawStaticText(QPointF(title_x, self._title_rect_px.top()), self._title_static)
 
     def minimumSizeHint(self):
         """
@@ -1,26 +1,129 @@
 # ui/interactive_control_sensors_tab.py
 import os
-import sys
+import json
+import functools
+import collections
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QSlider, QFrame, QSizePolicy # Import QSizePolicy
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QSignalBlocker
 from PyQt5.QtGui import QFont, QColor # Import QColor
 
-# Ensure SensorApp root is in path for imports
-script_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.abspath(os.path.join(script_dir, os.pardir))
-if project_root not in sys.path:
-    sys.path.append(project_root)
-
-from ui.gauge_widget import GaugeWidget
-from ui.led_bar_widget import LEDBarWidget
+# The project root is put on sys.path once by main.py; sibling widgets are imported
+# relative to the ui package
+from .gauge_widget import GaugeWidget
+from .led_bar_widget import LEDBarWidget
 from utils.logger import Logger
 from utils.config_manager import ConfigManager # Import ConfigManager
 
+# Theme palettes for this tab live in a JSON file next to the .qss themes
+_PALETTES_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'themes', 'interactive_control_palettes.json')
+
+# Color keys every theme in _PALETTES_FILE defines
+_PALETTE_KEYS = (
+    "title_color", "label_color", "frame_border", "frame_bg", "tab_background",
+    "button_bg", "button_hover_bg", "button_pressed_bg", "button_text",
+    "slider_groove_border", "slider_groove_bg", "slider_handle_bg", "slider_handle_border",
+    "slider_subpage_bg", "warning_text", "success_text",
+)
+
+# One resolved theme: each key holds its QColor and "<key>_name" its "#rrggbb" string,
+# so stylesheets can be built without calling QColor.name(). A namedtuple keeps the
+# fields in slots rather than a per-palette dict.
+ThemePalette = collections.namedtuple(
+    "ThemePalette", _PALETTE_KEYS + tuple(key + "_name" for key in _PALETTE_KEYS))
+
+@functools.lru_cache(maxsize=1)
+def _load_themes():
+    """
+    Reads the theme palettes from _PALETTES_FILE and returns them as
+    {theme_name: ThemePalette}. Cached, so the file is parsed once per process.
+    """
+    with open(_PALETTES_FILE, "r") as f:
+        palette_defs = json.load(f)
+    palettes = {}
+    for theme_name, theme_defs in palette_defs.items():
+        colors = [QColor(theme_defs[key]) for key in _PALETTE_KEYS]
+        palettes[theme_name] = ThemePalette(*(colors + [color.name() for color in colors]))
+    return palettes
+
+# Stylesheet template for the tab; rendered once per theme and cached in
+# InteractiveControlSensorsTab._shared_qss.
+_QSS_TEMPLATE = """
+    QWidget#InteractiveControlSensorsTab {{
+        background-color: {tab_background_color}; /* Ensure the entire tab background is themed */
+    }}
+    QLabel {{ /* General QLabel style within this tab */
+        color: {label_color};
+    }}
+    QLabel#buttonReadLabel[state="on"] {{ /* Button read label, driven by its "state" property */
+        color: {success_text_color};
+    }}
+    QLabel#buttonReadLabel[state="off"] {{
+        color: {warning_text_color};
+    }}
+    QFrame#contentFrame {{
+        border: 1px solid {frame_border_color};
+        border-radius: 15px;
+        background-color: {frame_bg_color};
+        padding: 20px;
+        /* Removed min-width and max-width for responsiveness */
+    }}
+    QPushButton#relayButton {{
+        background-color: {button_bg_color}; /* Default/OFF color */
+        color: {button_text_color};
+        border-radius: 10px;
+        padding: 10px 20px;
+        font-size: 14px;
+        border: none;
+    }}
+    QPushButton#relayButton[state="on"] {{ /* Relay state rules; unset until the first status update */
+        background-color: {button_bg_color};
+    }}
+    QPushButton#relayButton[state="off"] {{
+        background-color: {warning_text_color}; /* Use warning color for OFF */
+    }}
+    QPushButton#relayButton:hover {{ /* After the state rules, so hover/pressed feedback wins */
+        background-color: {button_hover_bg_color};
+    }}
+    QPushButton#relayButton:pressed {{
+        background-color: {button_pressed_bg_color};
+    }}
+    QSlider#ledBarSlider::groove:horizontal {{
+        border: 1px solid {slider_groove_border_color};
+        height: 8px; /* the groove height */
+        border-radius: 4px;
+        background: {slider_groove_bg_color};
+    }}
+    QSlider#ledBarSlider::handle:horizontal {{
+        background: {slider_handle_bg_color};
+        border: 1px solid {slider_handle_border_color};
+        width: 24px;
+        margin: -8px 0; /* handle is 16px wide, so -8px from each side to make it 24px total */
+        border-radius: 12px;
+    }}
+    QSlider#ledBarSlider::sub-page:horizontal {{
+        background: {slider_subpage_bg_color}; /* DodgerBlue for filled part */
+        border-radius: 4px;
+    }}
+"""
+
 class InteractiveControlSensorsTab(QWidget):
     """
     Separate tab to display and control interactive sensors:
     Button, Relay, LED Bar, and Rotary Angle.
     """
+    # The theme is process-wide, so the resolved palette and rendered stylesheets are
+    # kept on the class and shared by all instances
+    _shared_theme_name = None # Theme _shared_palette was resolved for
+    _shared_palette = None
+    _shared_qss = {} # Rendered stylesheet per theme name
+
+    # Fonts shared by all instances; created on first _setup_ui (needs a QApplication)
+    _FONT_TITLE = None
+    _FONT_GROUP = None
+    _FONT_READ = None
+    _FONT_BUTTON = None
+
     def __init__(self, sensor_manager, parent=None):
         # Corrected: Use InteractiveControlSensorsTab instead of InteractiveControlSensors in super()
         super(InteractiveControlSensorsTab, self).__init__(parent)
@@ -30,230 +133,48 @@ class InteractiveControlSensorsTab(QWidget):
 
         self.main_layout = QVBoxLayout(self)
         self.setLayout(self.main_layout)
-        
-        self._set_theme_colors() # Set initial theme colors
+
+        self._palette_theme = None # Theme the color attributes were last resolved for
+        self._applied_theme = None # Theme whose stylesheet is currently applied
+
+        # Last values shown by the status slots, used to drop no-op updates
+        self._last_button_state = -1
+        self._last_relay_state = -1
+        self._last_led_level = -1
+
+        # Theme colors and the tab stylesheet are resolved on the first showEvent, so a
+        # tab the user never opens never pays for a style pass
+        self._style_applied = False
+
         self._setup_ui()
-        self.set_style()
         self.logger.info("InteractiveControlSensorsTab initialized.")
 
     def _set_theme_colors(self):
-        """Sets internal color attributes based on the current theme for dynamic elements."""
+        """Resolves the palette for the current theme and applies it to the dynamic elements."""
+        if not self._style_applied:
+            return # Deferred until the tab is first shown (see showEvent)
         current_theme = self.config.get_setting("current_theme", "dark_theme")
+        if current_theme == self._palette_theme:
+            return # Colors (and the stylesheet) are already up to date for this theme
+        self._palette_theme = current_theme
 
-        # Define color palettes for various themes
-        theme_palettes = {
-            "dark_theme": {
-                "title_color": QColor("#ADD8E6"), # Light Blue
-                "label_color": QColor("#abb2bf"),
-                "frame_border": QColor("#666"),
-                "frame_bg": QColor("rgba(30, 30, 30, 0.7)"),
-                "tab_background": QColor("#21252b"), # Matches QTabWidget::pane for dark theme
-                "button_bg": QColor("#4CAF50"), # Green
-                "button_hover_bg": QColor("#45a049"),
-                "button_pressed_bg": QColor("#367c39"),
-                "button_text": QColor("white"),
-                "slider_groove_border": QColor("#999999"),
-                "slider_groove_bg": QColor("#555"),
-                "slider_handle_bg": QColor("#DDD"),
-                "slider_handle_border": QColor("#AAA"),
-                "slider_subpage_bg": QColor("#1E90FF"), # DodgerBlue
-                "warning_text": QColor("#FF4500"), # OrangeRed
-                "success_text": QColor("#7CFC00"), # LimeGreen
-            },
-            "light_theme": {
-                "title_color": QColor("#007bff"),
-                "label_color": QColor("#333333"),
-                "frame_border": QColor("#ccc"),
-                "frame_bg": QColor("rgba(255, 255, 255, 0.7)"),
-                "tab_background": QColor("#ffffff"), # Matches QTabWidget::pane for light theme
-                "button_bg": QColor("#28a745"),
-                "button_hover_bg": QColor("#218838"),
-                "button_pressed_bg": QColor("#1e7e34"),
-                "button_text": QColor("white"),
-                "slider_groove_border": QColor("#ccc"),
-                "slider_groove_bg": QColor("#eee"),
-                "slider_handle_bg": QColor("#6c757d"),
-                "slider_handle_border": QColor("#5a6268"),
-                "slider_subpage_bg": QColor("#007bff"),
-                "warning_text": QColor("#dc3545"),
-                "success_text": QColor("#28a745"),
-            },
-             "blue_theme": {
-                "title_color": QColor("#87CEEB"),
-                "label_color": QColor("#e0f2f7"),
-                "frame_border": QColor("#3c6595"),
-                "frame_bg": QColor("rgba(26, 42, 64, 0.7)"),
-                "tab_background": QColor("#152535"), # Matches QTabWidget::pane for blue theme
-                "button_bg": QColor("#4682B4"),
-                "button_hover_bg": QColor("#3a719d"),
-                "button_pressed_bg": QColor("#306080"),
-                "button_text": QColor("white"),
-                "slider_groove_border": QColor("#3c6595"),
-                "slider_groove_bg": QColor("#2b4a68"),
-                "slider_handle_bg": QColor("#87CEEB"),
-                "slider_handle_border": QColor("#4682B4"),
-                "slider_subpage_bg": QColor("#4682B4"),
-                "warning_text": QColor("#FF6347"),
-                "success_text": QColor("#3CB371"),
-            },
-            "dark_gray_theme": {
-                "title_color": QColor("#79c0ff"),
-                "label_color": QColor("#fdfdfd"),
-                "frame_border": QColor("#666"),
-                "frame_bg": QColor("rgba(60, 63, 65, 0.7)"),
-                "tab_background": QColor("#333333"), # Matches QTabWidget::pane for dark gray theme
-                "button_bg": QColor("#6a737d"),
-                "button_hover_bg": QColor("#586069"),
-                "button_pressed_bg": QColor("#4d5358"),
-                "button_text": QColor("white"),
-                "slider_groove_border": QColor("#505050"),
-                "slider_groove_bg": QColor("#444"),
-                "slider_handle_bg": QColor("#fdfdfd"),
-                "slider_handle_border": QColor("#888"),
-                "slider_subpage_bg": QColor("#6a737d"),
-                "warning_text": QColor("#FF6347"),
-                "success_text": QColor("#3CB371"),
-            },
-            "forest_green_theme": {
-                "title_color": QColor("#A5D6A7"),
-                "label_color": QColor("#FFFFFF"),
-                "frame_border": QColor("#66BB6A"),
-                "frame_bg": QColor("rgba(34, 139, 34, 0.7)"),
-                "tab_background": QColor("#1B5E20"), # Matches QTabWidget::pane for forest green theme
-                "button_bg": QColor("#66BB6A"),
-                "button_hover_bg": QColor("#4CAF50"),
-                "button_pressed_bg": QColor("#388E3C"),
-                "button_text": QColor("white"),
-                "slider_groove_border": QColor("#4CAF50"),
-                "slider_groove_bg": QColor("#388E3C"),
-                "slider_handle_bg": QColor("#FFFFFF"),
-                "slider_handle_border": QColor("#A5D6A7"),
-                "slider_subpage_bg": QColor("#66BB6A"),
-                "warning_text": QColor("#FF6347"),
-                "success_text": QColor("#9ACD32"),
-            },
-            "warm_sepia_theme": {
-                "title_color": QColor("#DEB887"),
-                "label_color": QColor("#F5DEB3"),
-                "frame_border": QColor("#A0522D"),
-                "frame_bg": QColor("rgba(112, 66, 20, 0.7)"),
-                "tab_background": QColor("#5A2D0C"), # Matches QTabWidget::pane for warm sepia theme
-                "button_bg": QColor("#A0522D"),
-                "button_hover_bg": QColor("#8B4513"),
-                "button_pressed_bg": QColor("#7C4F2A"),
-                "button_text": QColor("white"),
-                "slider_groove_border": QColor("#A0522D"),
-                "slider_groove_bg": QColor("#8B4513"),
-                "slider_handle_bg": QColor("#F5DEB3"),
-                "slider_handle_border": QColor("#DEB887"),
-                "slider_subpage_bg": QColor("#A0522D"),
-                "warning_text": QColor("#CD5C5C"),
-                "success_text": QColor("#6B8E23"),
-            },
-            "ocean_blue_theme": {
-                "title_color": QColor("#87CEEB"),
-                "label_color": QColor("#E0FFFF"),
-                "frame_border": QColor("#0066CC"),
-                "frame_bg": QColor("rgba(0, 51, 102, 0.7)"),
-                "tab_background": QColor("#002244"), # Matches QTabWidget::pane for ocean blue theme
-                "button_bg": QColor("#4682B4"),
-                "button_hover_bg": QColor("#3A719D"),
-                "button_pressed_bg": QColor("#2A6080"),
-                "button_text": QColor("white"),
-                "slider_groove_border": QColor("#005099"),
-                "slider_groove_bg": QColor("#004488"),
-                "slider_handle_bg": QColor("#E0FFFF"),
-                "slider_handle_border": QColor("#87CEEB"),
-                "slider_subpage_bg": QColor("#4682B4"),
-                "warning_text": QColor("#FF6347"),
-                "success_text": QColor("#66CDAA"),
-            },
-            "vibrant_purple_theme": {
-                "title_color": QColor("#DDA0DD"),
-                "label_color": QColor("#E6E6FA"),
-                "frame_border": QColor("#8A2BE2"),
-                "frame_bg": QColor("rgba(75, 0, 130, 0.7)"),
-                "tab_background": QColor("#300050"), # Matches QTabWidget::pane for vibrant purple theme
-                "button_bg": QColor("#8A2BE2"),
-                "button_hover_bg": QColor("#7B1BE0"),
-                "button_pressed_bg": QColor("#6A0DAD"),
-                "button_text": QColor("white"),
-                "slider_groove_border": QColor("#8A2BE2"),
-                "slider_groove_bg": QColor("#6A0DAD"),
-                "slider_handle_bg": QColor("#E6E6FA"),
-                "slider_handle_border": QColor("#DDA0DD"),
-                "slider_subpage_bg": QColor("#8A2BE2"),
-                "warning_text": QColor("#FF6347"),
-                "success_text": QColor("#7FFF00"),
-            },
-            "light_modern_theme": {
-                "title_color": QColor("#555555"),
-                "label_color": QColor("#333333"),
-                "frame_border": QColor("#A0A0A0"),
-                "frame_bg": QColor("rgba(248, 248, 248, 0.9)"),
-                "tab_background": QColor("#F8F8F8"), # Matches QTabWidget::pane for light modern theme
-                "button_bg": QColor("#607D8B"),
-                "button_hover_bg": QColor("#455A64"),
-                "button_pressed_bg": QColor("#37474F"),
-                "button_text": QColor("white"),
-                "slider_groove_border": QColor("#C0C0C0"),
-                "slider_groove_bg": QColor("#E8E8E8"),
-                "slider_handle_bg": QColor("#FFFFFF"),
-                "slider_handle_border": QColor("#90A4AE"),
-                "slider_subpage_bg": QColor("#607D8B"),
-                "warning_text": QColor("#FF4500"),
-                "success_text": QColor("#28A745"),
-            },
-            "high_contrast_theme": {
-                "title_color": QColor("#FF0000"),
-                "label_color": QColor("#FFFF00"),
-                "frame_border": QColor("#00FFFF"),
-                "frame_bg": QColor("rgba(0, 0, 0, 0.9)"),
-                "tab_background": QColor("#111111"), # Matches QTabWidget::pane for high contrast theme
-                "button_bg": QColor("#FF00FF"),
-                "button_hover_bg": QColor("#CC00CC"),
-                "button_pressed_bg": QColor("#990099"),
-                "button_text": QColor("#000000"),
-                "slider_groove_border": QColor("#FF00FF"),
-                "slider_groove_bg": QColor("#333333"),
-                "slider_handle_bg": QColor("#FFFF00"),
-                "slider_handle_border": QColor("#00FFFF"),
-                "slider_subpage_bg": QColor("#FFFF00"),
-                "warning_text": QColor("#FF0000"),
-                "success_text": QColor("#00FF00"),
-            }
-        }
-
-        self.theme_palette = theme_palettes.get(current_theme, theme_palettes["dark_theme"])
+        cls = InteractiveControlSensorsTab
+        if cls._shared_theme_name != current_theme:
+            # First instance to see this theme resolves it for everyone
+            palettes = _load_themes()
+            cls._shared_palette = palettes.get(current_theme, palettes["dark_theme"])
+            cls._shared_theme_name = current_theme
+        self.theme_palette = cls._shared_palette
         
-        self.title_color = self.theme_palette["title_color"]
-        self.label_color = self.theme_palette["label_color"]
-        self.frame_border_color = self.theme_palette["frame_border"]
-        self.frame_bg_color = self.theme_palette["frame_bg"]
-        self.tab_background_color = self.theme_palette["tab_background"] # New attribute for tab background
-        self.button_bg_color = self.theme_palette["button_bg"]
-        self.button_hover_bg_color = self.theme_palette["button_hover_bg"]
-        self.button_pressed_bg_color = self.theme_palette["button_pressed_bg"]
-        self.button_text_color = self.theme_palette["button_text"]
-        self.slider_groove_border_color = self.theme_palette["slider_groove_border"]
-        self.slider_groove_bg_color = self.theme_palette["slider_groove_bg"]
-        self.slider_handle_bg_color = self.theme_palette["slider_handle_bg"]
-        self.slider_handle_border_color = self.theme_palette["slider_handle_border"]
-        self.slider_subpage_bg_color = self.theme_palette["slider_subpage_bg"]
-        self.warning_text_color = self.theme_palette["warning_text"]
-        self.success_text_color = self.theme_palette["success_text"]
-
-        # Apply colors to existing widgets
+        # All colors are read straight from the ThemePalette in self.theme_palette
+        p = self.theme_palette
+
+        # Apply colors to existing widgets, repainting once at the end rather than per widget
+        self.setUpdatesEnabled(False)
         if hasattr(self, 'title_label'):
-            self.title_label.setStyleSheet("color: {};".format(self.title_color.name()))
-        if hasattr(self, 'button_read_label'):
-            # Update button_read_label based on its current state (if applicable)
-            button_state_color = self.success_text_color if self.button_read_label.text() == "ON" else self.warning_text_color
-            self.button_read_label.setStyleSheet("color: {};".format(button_state_color.name()))
-        if hasattr(self, 'relay_button'):
-             # Update relay button background based on its current state
-            relay_button_bg_color = self.success_text_color if self.relay_state == 1 else self.warning_text_color
-            self.relay_button.setStyleSheet("background-color: {}; color: {};".format(relay_button_bg_color.name(), self.button_text_color.name()))
+            self.title_label.setStyleSheet("color: {};".format(p.title_color_name))
+        # button_read_label and relay_button are colored by the tab stylesheet's
+        # [state="on"/"off"] rules, so they follow the theme through set_style()
         if hasattr(self, 'led_bar_widget'):
             self.led_bar_widget._set_theme_colors() # Call its own theme setter
         if hasattr(self, 'rotary_angle_gauge'):
@@ -261,12 +182,30 @@ class InteractiveControlSensorsTab(QWidget):
 
         # Re-apply stylesheet to ensure all QSS rules with dynamic colors are updated
         self.set_style()
+        self.setUpdatesEnabled(True)
+        self.update()
+
 
+    def showEvent(self, event):
+        """Applies the theme the first time the tab becomes visible."""
+        super(InteractiveControlSensorsTab, self).showEvent(event)
+        if not self._style_applied:
+            self._style_applied = True
+            self._set_theme_colors()
 
     def _setup_ui(self):
         """Sets up the UI elements for the interactive control sensors tab."""
+        # Hold off repaints while ~20 widgets are added, so Qt lays the tab out once
+        self.setUpdatesEnabled(False)
+        cls = InteractiveControlSensorsTab
+        if cls._FONT_TITLE is None:
+            cls._FONT_TITLE = QFont("Inter", 20, QFont.Bold)
+            cls._FONT_GROUP = QFont("Inter", 16, QFont.Bold)
+            cls._FONT_READ = QFont("Inter", 36, QFont.Bold)
+            cls._FONT_BUTTON = QFont("Inter", 14, QFont.Bold)
+
         self.title_label = QLabel("Interactive Controls: Button, Relay, LED Bar, Rotary Angle")
-        self.title_label.setFont(QFont("Inter", 20, QFont.Bold))
+        self.title_label.setFont(self._FONT_TITLE)
         self.title_label.setAlignment(Qt.AlignCenter)
         self.title_label.setContentsMargins(0, 20, 0, 20)
         self.main_layout.addWidget(self.title_label)
@@ -288,18 +227,12 @@ class InteractiveControlSensorsTab(QWidget):
 
 
         # Button Status
-        button_group_layout = QVBoxLayout()
-        button_group_label = QLabel("Button Status")
-        button_group_label.setFont(QFont("Inter", 16, QFont.Bold))
-        button_group_label.setAlignment(Qt.AlignCenter)
-        button_group_layout.addWidget(button_group_label)
         self.button_read_label = QLabel("OFF")
-        self.button_read_label.setFont(QFont("Inter", 36, QFont.Bold))
+        self.button_read_label.setFont(self._FONT_READ)
         self.button_read_label.setAlignment(Qt.AlignCenter)
         self.button_read_label.setObjectName("buttonReadLabel") # Add object name for styling
-        button_group_layout.addWidget(self.button_read_label)
-        button_group_layout.addStretch(1) # Allows button status to push up
-        row1_layout.addLayout(button_group_layout)
+        self.button_read_label.setProperty("state", "off") # Selects the OFF rule in the tab stylesheet
+        row1_layout.addLayout(self._make_group("Button Status", self.button_read_label, alignment=Qt.Alignment()))
         row1_layout.addSpacing(50)
 
         # Rotary Angle Gauge
@@ -320,35 +253,21 @@ class InteractiveControlSensorsTab(QWidget):
         row2_layout.setStretch(1, 1)
 
         # Relay Control
-        relay_group_layout = QVBoxLayout()
-        relay_group_label = QLabel("Relay Control")
-        relay_group_label.setFont(QFont("Inter", 16, QFont.Bold))
-        relay_group_label.setAlignment(Qt.AlignCenter)
-        relay_group_layout.addWidget(relay_group_label)
-        
         self.relay_button = QPushButton("Toggle Relay (OFF)")
-        self.relay_button.setFont(QFont("Inter", 14, QFont.Bold))
+        self.relay_button.setFont(self._FONT_BUTTON)
         self.relay_button.setFixedSize(200, 60) # Keep fixed size for buttons for consistency
-        self.relay_button.clicked.connect(self._toggle_relay)
+        # Flip 0 to 1, or 1 to 0; the UI is updated by `update_relay_status` via the sensor manager's signal
+        self.relay_button.clicked.connect(lambda: self.sensor_manager.control_relay(1 - self.relay_state))
         self.relay_button.setObjectName("relayButton") # Add object name for styling
         self.relay_state = 0 # 0: OFF, 1: ON
-        relay_group_layout.addWidget(self.relay_button, alignment=Qt.AlignCenter)
-        relay_group_layout.addStretch(1) # Allows relay control to push up
-        row2_layout.addLayout(relay_group_layout)
+        row2_layout.addLayout(self._make_group("Relay Control", self.relay_button))
         row2_layout.addSpacing(50)
 
         # LED Bar Control
-        led_bar_group_layout = QVBoxLayout()
-        led_bar_group_label = QLabel("LED Bar Control (0-10)")
-        led_bar_group_label.setFont(QFont("Inter", 16, QFont.Bold))
-        led_bar_group_label.setAlignment(Qt.AlignCenter)
-        led_bar_group_layout.addWidget(led_bar_group_label)
-        
         self.led_bar_widget = LEDBarWidget("LED Bar Visual", segments=10, config_manager=self.config) # Pass config_manager
         self.led_bar_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.led_bar_widget.setMinimumSize(200, 80) # Reduced minimum width
         self.led_bar_widget.setMaximumHeight(150) # Increased maximum height
-        led_bar_group_layout.addWidget(self.led_bar_widget, alignment=Qt.AlignCenter)
 
         self.led_bar_slider = QSlider(Qt.Horizontal)
         self.led_bar_slider.setMinimum(0)
@@ -359,38 +278,59 @@ class InteractiveControlSensorsTab(QWidget):
         self.led_bar_slider.setSingleStep(1)
         # self.led_bar_slider.setFixedSize(300, 40) # Removed fixed size for responsiveness
         self.led_bar_slider.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed) # Allow horizontal expansion
-        self.led_bar_slider.valueChanged.connect(self._control_led_bar) # Reverted to valueChanged
+        self.led_bar_slider.setTracking(False) # Emit valueChanged on release only, not on every drag step
+        # Drive the sensor manager directly; the bar itself is updated by `update_led_bar_status`
+        self.led_bar_slider.valueChanged.connect(self.sensor_manager.control_led_bar)
         self.led_bar_slider.setObjectName("ledBarSlider") # Add object name for styling
-        led_bar_group_layout.addWidget(self.led_bar_slider, alignment=Qt.AlignCenter)
-        led_bar_group_layout.addStretch(1) # Allows LED bar controls to push up
-        row2_layout.addLayout(led_bar_group_layout)
+        row2_layout.addLayout(self._make_group("LED Bar Control (0-10)", self.led_bar_widget, self.led_bar_slider))
 
         content_layout.addLayout(row2_layout)
         
         self.main_layout.addWidget(self.content_frame, alignment=Qt.AlignCenter) 
         self.main_layout.addStretch(1) # Add a stretch to the main layout to push content to top if needed,
                                         # but also allows content_frame to expand.
+        self.setUpdatesEnabled(True)
+        self.update()
 
-    def _toggle_relay(self):
-        """Toggles the state of the relay."""
-        new_state = 1 - self.relay_state # Flip 0 to 1, or 1 to 0
-        self.sensor_manager.control_relay(new_state)
-        # The actual UI update happens via `update_relay_status` signal connected from sensor_manager
+    def _make_group(self, title, *widgets, **kwargs):
+        """
+        Builds a control group: a centered bold title label above the given widgets,
+        followed by a stretch so the group pushes up.
 
-    def _control_led_bar(self, level):
-        """Controls the LED bar based on slider value."""
-        self.sensor_manager.control_led_bar(level)
-        # The actual UI update for the custom widget happens via `update_led_bar_status`
+        :param title: Text for the group's title label.
+        :param widgets: Widgets to stack below the title, in order.
+        :param alignment: Keyword-only; alignment each widget is added with (default Qt.AlignCenter).
+        :return: The group's QVBoxLayout.
+        """
+        alignment = kwargs.get("alignment", Qt.AlignCenter)
+        group_layout = QVBoxLayout()
+        group_label = QLabel(title)
+        group_label.setFont(self._FONT_GROUP)
+        group_label.setAlignment(Qt.AlignCenter)
+        group_layout.addWidget(group_label)
+        for widget in widgets:
+            group_layout.addWidget(widget, alignment=alignment)
+        group_layout.addStretch(1)
+        return group_layout
+
+    def update_from_payload(self, payload):
+        """
+        Updates the tab from one SensorWorker reading.
+        This slot is connected to the SensorWorker's sensor_data_updated signal.
+        """
+        self.update_button_status(payload.button)
+        self.update_rotary_angle_data(payload.rotary_angle)
 
     def update_button_status(self, state):
         """
         Updates the Button status label.
-        This slot is connected to the SensorWorker's button_status_updated signal.
         """
+        if state == self._last_button_state:
+            return # Nothing changed; avoid a text/stylesheet refresh
+        self._last_button_state = state
         self.button_read_label.setText("ON" if state == 1 else "OFF")
-        # Update color based on state using theme palette
-        color = self.success_text_color if state == 1 else self.warning_text_color
-        self.button_read_label.setStyleSheet("color: {};".format(color.name()))
+        # Update color based on state via the stylesheet's state rules
+        self._set_state_property(self.button_read_label, state == 1)
 
 
     def update_relay_status(self, state):
@@ -398,93 +338,85 @@ class InteractiveControlSensorsTab(QWidget):
         Updates the Relay button text and internal state.
         This slot is connected to the SensorManager's relay_status_changed signal.
         """
+        if state == self._last_relay_state:
+            return # Nothing changed; avoid a text/stylesheet refresh
+        self._last_relay_state = state
         self.relay_state = state
         self.relay_button.setText("Toggle Relay ({})".format("ON" if state == 1 else "OFF"))
-        # Update button background based on state using theme palette
-        bg_color = self.button_bg_color if state == 1 else self.warning_text_color # Use warning color for OFF
-        self.relay_button.setStyleSheet("background-color: {}; color: {};".format(bg_color.name(), self.button_text_color.name()))
+        # Update button background based on state via the stylesheet's state rules
+        self._set_state_property(self.relay_button, state == 1)
 
 
+    @staticmethod
+    def _set_state_property(widget, on):
+        """
+        Sets the widget's "state" dynamic property and re-polishes it, so only the
+        tab stylesheet's matching [state=...] rule is re-evaluated instead of parsing
+        a new inline stylesheet.
+        """
+        widget.setProperty("state", "on" if on else "off")
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
     def update_led_bar_status(self, level):
         """
         Updates the LED Bar custom widget and slider value.
         This slot is connected to the SensorManager's led_bar_status_changed signal.
         """
+        if level == self._last_led_level:
+            return # Nothing changed; avoid repainting the bar
+        self._last_led_level = level
         self.led_bar_widget.set_lit_segments(level)
-        self.led_bar_slider.setValue(level) # Keep slider in sync
+        # Keep slider in sync without re-emitting valueChanged back to the sensor manager;
+        # the blocker restores the slider's signals when the block exits
+        with QSignalBlocker(self.led_bar_slider):
+            self.led_bar_slider.setValue(level)
 
     def update_rotary_angle_data(self, raw_value):
         """
         Updates the Rotary Angle gauge.
-        This slot is connected to the SensorWorker's rotary_angle_data_updated signal.
         """
         self.rotary_angle_gauge.set_value(raw_value)
 
+    def apply_theme(self):
+        """
+        Re-applies the current theme: the tab stylesheet, then the palette for the
+        state-dependent widgets. Called by MainWindow._apply_theme.
+        """
+        self.set_style()
+        self._set_theme_colors()
+
     def set_style(self):
-        """Applies specific styling for the tab."""
-        self.setStyleSheet("""
-            QWidget#InteractiveControlSensorsTab {{
-                background-color: {tab_background_color}; /* Ensure the entire tab background is themed */
-            }}
-            QLabel {{ /* General QLabel style within this tab */
-                color: {label_color};
-            }}
-            QLabel#buttonReadLabel {{ /* Specific styling for the button read label */
-                color: {warning_text_color}; /* Initial color for OFF */
-            }}
-            QFrame#contentFrame {{
-                border: 1px solid {frame_border_color};
-                border-radius: 15px;
-                background-color: {frame_bg_color};
-                padding: 20px;
-                /* Removed min-width and max-width for responsiveness */
-            }}
-            QPushButton#relayButton {{
-                background-color: {button_bg_color}; /* Default/OFF color */
-                color: {button_text_color};
-                border-radius: 10px;
-                padding: 10px 20px;
-                font-size: 14px;
-                border: none;
-            }}
-            QPushButton#relayButton:hover {{
-                background-color: {button_hover_bg_color};
-            }}
-            QPushButton#relayButton:pressed {{
-                background-color: {button_pressed_bg_color};
-            }}
-            QSlider#ledBarSlider::groove:horizontal {{
-                border: 1px solid {slider_groove_border_color};
-                height: 8px; /* the groove height */
-                border-radius: 4px;
-                background: {slider_groove_bg_color};
-            }}
-            QSlider#ledBarSlider::handle:horizontal {{
-                background: {slider_handle_bg_color};
-                border: 1px solid {slider_handle_border_color};
-                width: 24px;
-                margin: -8px 0; /* handle is 16px wide, so -8px from each side to make it 24px total */
-                border-radius: 12px;
-            }}
-            QSlider#ledBarSlider::sub-page:horizontal {{
-                background: {slider_subpage_bg_color}; /* DodgerBlue for filled part */
-                border-radius: 4px;
-            }}
-        """.format(
-            tab_background_color=self.tab_background_color.name(), # Pass the new color
-            title_color=self.title_color.name(),
-            label_color=self.label_color.name(),
-            frame_border_color=self.frame_border_color.name(),
-            frame_bg_color=self.frame_bg_color.name(),
-            button_bg_color=self.button_bg_color.name(),
-            button_hover_bg_color=self.button_hover_bg_color.name(),
-            button_pressed_bg_color=self.button_pressed_bg_color.name(),
-            button_text_color=self.button_text_color.name(),
-            slider_groove_border_color=self.slider_groove_border_color.name(),
-            slider_groove_bg_color=self.slider_groove_bg_color.name(),
-            slider_handle_bg_color=self.slider_handle_bg_color.name(),
-            slider_handle_border_color=self.slider_handle_border_color.name(),
-            slider_subpage_bg_color=self.slider_subpage_bg_color.name(),
-            warning_text_color=self.warning_text_color.name(),
-            success_text_color=self.success_text_color.name()
-        ))
+        """
+        Applies specific styling for the tab. Uses the theme the color attributes were
+        resolved for, and does nothing if that theme's stylesheet is already applied,
+        since setStyleSheet re-polishes the whole widget subtree.
+        """
+        current_theme = self._palette_theme
+        if current_theme is None or current_theme == self._applied_theme:
+            return
+        qss = InteractiveControlSensorsTab._shared_qss.get(current_theme)
+        if qss is None:
+            p = self.theme_palette
+            qss = _QSS_TEMPLATE.format(
+                tab_background_color=p.tab_background_name, # Pass the new color
+                title_color=p.title_color_name,
+                label_color=p.label_color_name,
+                frame_border_color=p.frame_border_name,
+                frame_bg_color=p.frame_bg_name,
+                button_bg_color=p.button_bg_name,
+                button_hover_bg_color=p.button_hover_bg_name,
+                button_pressed_bg_color=p.button_pressed_bg_name,
+                button_text_color=p.button_text_name,
+                slider_groove_border_color=p.slider_groove_border_name,
+                slider_groove_bg_color=p.slider_groove_bg_name,
+                slider_handle_bg_color=p.slider_handle_bg_name,
+                slider_handle_border_color=p.slider_handle_border_name,
+                slider_subpage_bg_color=p.slider_subpage_bg_name,
+                warning_text_color=p.warning_text_name,
+                success_text_color=p.success_text_name
+            )
+            InteractiveControlSensorsTab._shared_qss[current_theme] = qss
+        self.setStyleSheet(qss)
+        self._applied_theme = current_theme
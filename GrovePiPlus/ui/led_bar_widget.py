@@ -1,19 +1,89 @@
 # ui/led_bar_widget.py
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel
-from PyQt5.QtGui import QPainter, QColor, QBrush, QPen, QFont
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QPainter, QColor, QBrush, QPen, QFont, QPixmap, QPainterPath
+from PyQt5.QtCore import Qt, QSize, QRect, QRectF
 
 from utils.config_manager import ConfigManager # Import ConfigManager
 
+# Off-segment, border and title colors per theme, built once at import
+_THEME_PALETTES = {
+    "dark_theme": {
+        "off_led": QColor(50, 50, 50),
+        "border": QColor(30, 30, 30),
+        "text": QColor(171, 178, 191)
+    },
+    "light_theme": {
+        "off_led": QColor(200, 200, 200),
+        "border": QColor(150, 150, 150),
+        "text": QColor(51, 51, 51)
+    },
+    "blue_theme": {
+        "off_led": QColor(40, 60, 80),
+        "border": QColor(20, 30, 40),
+        "text": QColor(224, 242, 247)
+    },
+    "dark_gray_theme": {
+        "off_led": QColor(60, 60, 60),
+        "border": QColor(40, 40, 40),
+        "text": QColor(240, 240, 240)
+    },
+    "forest_green_theme": {
+        "off_led": QColor(30, 80, 30),
+        "border": QColor(20, 50, 20),
+        "text": QColor(255, 255, 255)
+    },
+    "warm_sepia_theme": {
+        "off_led": QColor(90, 70, 50),
+        "border": QColor(70, 50, 30),
+        "text": QColor(240, 230, 210)
+    },
+    "ocean_blue_theme": {
+        "off_led": QColor(30, 70, 110),
+        "border": QColor(10, 40, 80),
+        "text": QColor(200, 230, 255)
+    },
+    "vibrant_purple_theme": {
+        "off_led": QColor(70, 30, 100),
+        "border": QColor(40, 10, 60),
+        "text": QColor(255, 200, 255)
+    },
+    "light_modern_theme": {
+        "off_led": QColor(200, 200, 200),
+        "border": QColor(150, 150, 150),
+        "text": QColor(50, 50, 50)
+    },
+    "high_contrast_theme": {
+        "off_led": QColor(30, 30, 30),
+        "border": QColor(10, 10, 10),
+        "text": QColor(255, 255, 0)
+    }
+}
+
+
 class LEDBarWidget(QWidget):
     """
     A custom widget to visually represent an LED bar with 10 segments.
     """
+    # Lit colors (green for lower, yellow for mid, red for higher segments), shared by all instances
+    _GREEN_BRUSH = QBrush(QColor(60, 200, 60))
+    _YELLOW_BRUSH = QBrush(QColor(255, 200, 0))
+    _RED_BRUSH = QBrush(QColor(255, 60, 60))
+    _TITLE_FONT = None # Shared title font; created on first init (needs a QApplication)
+
     def __init__(self, title="LED Bar", segments=10, config_manager=None, parent=None): # Added config_manager
         super(LEDBarWidget, self).__init__(parent)
         self.segments = segments
         self.lit_segments = 0 # Number of currently lit segments (0-10)
         self.title = title
+        # Brush for each segment when lit, so paintEvent only indexes into it
+        self._lit_brushes = [self._GREEN_BRUSH if i < 4 else self._YELLOW_BRUSH if i < 7 else self._RED_BRUSH
+                             for i in range(segments)]
+        # All-off bar rendered once per size/theme (see _rebuild_background_pixmap), plus the
+        # segment rects it was drawn with so lit segments can be painted on top
+        self._bg_pixmap = None
+        self._segment_qrects = [] # Pixel-aligned segment rects
+        self._segment_rects = [] # The same rects as QRectF, for QPainterPath
+        self._segment_dirty_rects = [] # Integer bounds (incl. border) for dirty-region tests
 
         self.config = config_manager if config_manager else ConfigManager.get_instance() # Get config instance
 
@@ -23,7 +93,9 @@ class LEDBarWidget(QWidget):
         self.layout = QVBoxLayout(self)
         self.title_label = QLabel(self.title)
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setFont(QFont("Inter", 12))
+        if LEDBarWidget._TITLE_FONT is None:
+            LEDBarWidget._TITLE_FONT = QFont("Inter", 12)
+        self.title_label.setFont(LEDBarWidget._TITLE_FONT)
         self.layout.addWidget(self.title_label)
 
         self.led_layout = QHBoxLayout()
@@ -32,69 +104,20 @@ class LEDBarWidget(QWidget):
 
         self.setToolTip(self.title)
         self._set_theme_colors() # Set initial theme colors
+        self._update_geometry()
 
     def _set_theme_colors(self):
         """Sets internal color attributes based on the current theme."""
         current_theme = self.config.get_setting("current_theme", "dark_theme")
+        palette = _THEME_PALETTES.get(current_theme, _THEME_PALETTES["dark_theme"]) # Fallback to dark
 
-        theme_palettes = {
-            "dark_theme": {
-                "off_led": QColor(50, 50, 50),
-                "border": QColor(30, 30, 30),
-                "text": QColor(171, 178, 191)
-            },
-            "light_theme": {
-                "off_led": QColor(200, 200, 200),
-                "border": QColor(150, 150, 150),
-                "text": QColor(51, 51, 51)
-            },
-            "blue_theme": {
-                "off_led": QColor(40, 60, 80),
-                "border": QColor(20, 30, 40),
-                "text": QColor(224, 242, 247)
-            },
-            "dark_gray_theme": {
-                "off_led": QColor(60, 60, 60),
-                "border": QColor(40, 40, 40),
-                "text": QColor(240, 240, 240)
-            },
-            "forest_green_theme": {
-                "off_led": QColor(30, 80, 30),
-                "border": QColor(20, 50, 20),
-                "text": QColor(255, 255, 255)
-            },
-            "warm_sepia_theme": {
-                "off_led": QColor(90, 70, 50),
-                "border": QColor(70, 50, 30),
-                "text": QColor(240, 230, 210)
-            },
-            "ocean_blue_theme": {
-                "off_led": QColor(30, 70, 110),
-                "border": QColor(10, 40, 80),
-                "text": QColor(200, 230, 255)
-            },
-            "vibrant_purple_theme": {
-                "off_led": QColor(70, 30, 100),
-                "border": QColor(40, 10, 60),
-                "text": QColor(255, 200, 255)
-            },
-            "light_modern_theme": {
-                "off_led": QColor(200, 200, 200),
-                "border": QColor(150, 150, 150),
-                "text": QColor(50, 50, 50)
-            },
-            "high_contrast_theme": {
-                "off_led": QColor(30, 30, 30),
-                "border": QColor(10, 10, 10),
-                "text": QColor(255, 255, 0)
-            }
-        }
-
-        palette = theme_palettes.get(current_theme, theme_palettes["dark_theme"]) # Fallback to dark
-        
         self.off_led_color = palette["off_led"]
         self.led_border_color = palette["border"]
         text_color = palette["text"]
+        # Theme-aware brush and pen reused by every paint
+        self._off_brush = QBrush(self.off_led_color)
+        self._border_pen = QPen(self.led_border_color, 1)
+        self._bg_pixmap = None # Off segments must be redrawn in the new colors
 
         self.title_label.setStyleSheet("color: {};".format(text_color.name()))
 
@@ -106,52 +129,89 @@ class LEDBarWidget(QWidget):
         self.lit_segments = max(0, min(self.segments, count))
         self.update() # Trigger repaint
 
-    def paintEvent(self, event):
+    def resizeEvent(self, event):
+        """Recomputes the LED geometry for the new size and drops the cached background."""
+        super(LEDBarWidget, self).resizeEvent(event)
+        self._update_geometry()
+
+    def _update_geometry(self):
         """
-        Paints the individual LED segments.
+        Computes the LED layout for the current size, once per resize rather than per
+        paint, and caches it along with each segment's rect.
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        rect = self.rect()
-        
         # Calculate available width for LEDs
         padding = 10
-        available_width = rect.width() - (2 * padding)
+        available_width = self.width() - (2 * padding)
         
         # Calculate LED size based on available width and number of segments
         led_spacing = 5 # Space between LEDs
+        # Whole-pixel LED width, so every segment is the same size and lands on exact pixels
         # Ensure led_width is not negative if available_width is too small
         if self.segments > 0:
-            led_width = (available_width - (self.segments - 1) * led_spacing) / float(self.segments)
+            self._led_w = max(0, (available_width - (self.segments - 1) * led_spacing) // self.segments)
         else:
-            led_width = 0 # No segments to draw
+            self._led_w = 0 # No segments to draw
 
-        led_height = self.height() * 0.3 # Make LEDs a percentage of widget height
+        self._led_h = int(self.height() * 0.3) # Make LEDs a percentage of widget height
 
-        start_x = padding
+        # Split the pixels left over from rounding the width evenly on both sides
+        leftover = available_width - self.segments * self._led_w - (self.segments - 1) * led_spacing
+        self._start_x0 = padding + max(0, leftover) // 2
+        self._step = self._led_w + led_spacing
         # Vertically center the LEDs
-        start_y = (rect.height() / 2) - (led_height / 2) + 10 # Offset for title label
-
-        for i in range(self.segments):
-            # Determine LED color
-            if i < self.lit_segments:
-                # Lit color (e.g., green for lower, yellow for mid, red for higher)
-                if i < 4:
-                    led_color = QColor(60, 200, 60) # Green
-                elif i < 7:
-                    led_color = QColor(255, 200, 0) # Yellow
-                else:
-                    led_color = QColor(255, 60, 60) # Red
-            else:
-                led_color = self.off_led_color # Use theme-aware off color
-
-            # Draw the LED rectangle
-            painter.setBrush(QBrush(led_color))
-            painter.setPen(QPen(self.led_border_color, 1)) # Use theme-aware border color
-            
+        self._start_y = int(self.height() / 2 - self._led_h / 2 + 10) # Offset for title label
+
+        self._segment_qrects = [QRect(self._start_x0 + i * self._step, self._start_y, self._led_w, self._led_h)
+                                for i in range(self.segments)]
+        self._segment_rects = [QRectF(segment_qrect) for segment_qrect in self._segment_qrects]
+        self._segment_dirty_rects = [segment_qrect.adjusted(-1, -1, 1, 1) for segment_qrect in self._segment_qrects]
+
+        self._bg_pixmap = None # Redrawn for the new geometry on the next paint
+
+    def _rebuild_background_pixmap(self):
+        """Renders every segment in its "off" state into self._bg_pixmap."""
+        # Render at device resolution so the cached bar stays sharp on high-DPI screens
+        dpr = self.devicePixelRatioF()
+        self._bg_pixmap = QPixmap(self.size() * dpr)
+        self._bg_pixmap.setDevicePixelRatio(dpr)
+        self._bg_pixmap.fill(Qt.transparent)
+        painter = QPainter(self._bg_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._border_pen) # Use theme-aware border color
+        painter.setBrush(self._off_brush) # Use theme-aware off color
+        for segment_qrect in self._segment_qrects:
             # Make the LEDs rounded
-            painter.drawRoundedRect(start_x, start_y, led_width, led_height, 5, 5)
+            painter.drawRoundedRect(segment_qrect, 5, 5)
+        painter.end()
 
-            # Move to the next LED position
-            start_x += led_width + led_spacing
+    def paintEvent(self, event):
+        """
+        Paints the individual LED segments: the cached all-off bar, then the lit
+        segments on top of it.
+        """
+        if self._bg_pixmap is None:
+            self._rebuild_background_pixmap()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._border_pen) # Use theme-aware border color
+        # Qt clips to the damaged region anyway; skip lit segments outside it entirely
+        region = event.region()
+        # Consecutive segments share a lit color, so collect each color run into one
+        # path and fill it with a single setBrush/drawPath
+        runs = []
+        run_brush = None
+        for i in range(self.lit_segments):
+            if not region.intersects(self._segment_dirty_rects[i]):
+                continue
+            brush = self._lit_brushes[i]
+            if brush is not run_brush:
+                run_brush = brush
+                run_path = QPainterPath()
+                runs.append((brush, run_path))
+            run_path.addRoundedRect(self._segment_rects[i], 5, 5)
+        for brush, path in runs:
+            painter.setBrush(brush)
+            painter.drawPath(path)
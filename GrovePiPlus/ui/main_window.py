@@ -1,9 +1,9 @@
 # ui/main_window.py
 import os
 import sys
-import time # Import time for time.sleep
+import queue
 from PyQt5.QtWidgets import QMainWindow, QTabWidget, QVBoxLayout, QWidget, QLabel, QApplication, QSizePolicy # Added QApplication, QSizePolicy
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QMutex, QWaitCondition
 from PyQt5.QtGui import QFont, QIcon
 
 # Ensure SensorApp root is in path for imports
@@ -31,21 +31,25 @@ class SensorWorker(QThread):
     Worker thread to continuously read sensor data without blocking the UI.
     Emits signals with sensor readings.
     """
-    sensor_data_updated = pyqtSignal(dict)
-    dht_data_updated = pyqtSignal(float, float) # Temperature, Humidity
-    ultrasonic_data_updated = pyqtSignal(float) # Distance in cm
-    sound_data_updated = pyqtSignal(int) # Raw analog value
-    light_data_updated = pyqtSignal(int) # Raw analog value
-    button_data_updated = pyqtSignal(int) # 0 or 1
-    rotary_angle_data_updated = pyqtSignal(int) # Raw analog value
-
-    def __init__(self, sensor_manager, config_manager, read_interval=2): # Added config_manager
+    # One signal per read cycle carrying a SensorReading; tabs pick out the fields they use.
+    # Connect it with Qt.QueuedConnection: slots must run on the GUI thread.
+    sensor_data_updated = pyqtSignal(object)
+
+    def __init__(self, sensor_manager, config_manager, read_interval=2, log_queue=None): # Added config_manager
         super().__init__()
         self.sensor_manager = sensor_manager
         self.config = config_manager # Store config manager
         self.read_interval = read_interval
+        # Readings to be written to CSV by a SensorLogWriter; when None they are logged inline
+        self.log_queue = log_queue
+        # Cached "enable_sensor_logging" setting; MainWindow refreshes it when settings change
+        self.enable_logging = self.config.get_setting("enable_sensor_logging", True)
         self.running = True
         self.logger = Logger.get_logger()
+        # The loop waits on this condition between reads instead of sleeping, so stop()
+        # can wake it immediately rather than after up to read_interval seconds
+        self._mutex = QMutex()
+        self._cond = QWaitCondition()
 
     def run(self):
         """
@@ -53,52 +57,76 @@ class SensorWorker(QThread):
         """
         self.logger.info("SensorWorker started.")
         while self.running:
-            sensor_data = {}
-            
-            # DHT Sensor
-            temp, hum = self.sensor_manager.read_dht_sensor()
-            sensor_data["temperature"] = temp
-            sensor_data["humidity"] = hum
-            self.dht_data_updated.emit(temp, hum)
-
-            # Ultrasonic Sensor
-            ultrasonic_distance = self.sensor_manager.read_ultrasonic_sensor()
-            sensor_data["ultrasonic"] = ultrasonic_distance
-            self.ultrasonic_data_updated.emit(ultrasonic_distance)
-
-            # Sound Sensor
-            sound_value = self.sensor_manager.read_sound_sensor()
-            sensor_data["sound"] = sound_value
-            self.sound_data_updated.emit(sound_value)
-
-            # Light Sensor
-            light_value = self.sensor_manager.read_light_sensor()
-            sensor_data["light"] = light_value
-            self.light_data_updated.emit(light_value)
-
-            # Button Sensor
-            button_state = self.sensor_manager.read_button_sensor()
-            sensor_data["button"] = button_state
-            self.button_data_updated.emit(button_state)
-
-            # Rotary Angle Sensor
-            rotary_angle_value = self.sensor_manager.read_rotary_angle_sensor()
-            sensor_data["rotary_angle"] = rotary_angle_value
-            self.rotary_angle_data_updated.emit(rotary_angle_value)
-            
-            # Emit combined data for DashboardTab and logging
-            self.sensor_data_updated.emit(sensor_data)
-
-            # Log data if enabled
-            if self.config.get_setting("enable_sensor_logging", True):
-                self.sensor_manager.log_sensor_data(sensor_data)
-            
-            time.sleep(self.read_interval)
+            self._read_once()
+
+            self._mutex.lock()
+            if self.running: # stop() may have been called during the read
+                self._cond.wait(self._mutex, int(self.read_interval * 1000))
+            self._mutex.unlock()
         self.logger.info("SensorWorker stopped.")
 
+    def _read_once(self):
+        """Reads every sensor once, emits the readings and logs them if enabled."""
+        sensor_data = self.sensor_manager.read_all()
+
+        # Emit the combined data once for all tabs
+        self.sensor_data_updated.emit(sensor_data)
+
+        # Log data if enabled
+        if self.enable_logging:
+            if self.log_queue is None:
+                self.sensor_manager.log_sensor_data(sensor_data)
+            else:
+                # Never block the read cadence on disk I/O: if the writer has fallen
+                # behind, drop the oldest pending reading to make room
+                try:
+                    self.log_queue.put_nowait(sensor_data)
+                except queue.Full:
+                    try:
+                        self.log_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self.log_queue.put_nowait(sensor_data)
+
+    def set_interval(self, read_interval):
+        """
+        Changes the time between reads. Wakes the worker so the new interval takes
+        effect now instead of after the current wait.
+        :param read_interval: Seconds between sensor reads.
+        """
+        self._mutex.lock()
+        self.read_interval = read_interval
+        self._cond.wakeAll()
+        self._mutex.unlock()
+
     def stop(self):
-        """Stops the sensor worker thread."""
+        """Stops the sensor worker thread, waking it if it is waiting between reads."""
+        self._mutex.lock()
         self.running = False
+        self._cond.wakeAll()
+        self._mutex.unlock()
+
+
+class SensorLogWriter(QThread):
+    """
+    Writes sensor readings queued by SensorWorker to the CSV log, so a slow disk
+    never delays sensor reads. Put None on the queue to stop it.
+    """
+    def __init__(self, sensor_manager, log_queue):
+        super().__init__()
+        self.sensor_manager = sensor_manager
+        self.log_queue = log_queue
+        self.logger = Logger.get_logger()
+
+    def run(self):
+        """Writes queued readings until the None sentinel arrives."""
+        self.logger.info("SensorLogWriter started.")
+        while True:
+            sensor_data = self.log_queue.get()
+            if sensor_data is None:
+                break
+            self.sensor_manager.log_sensor_data(sensor_data)
+        self.logger.info("SensorLogWriter stopped.")
 
 
 class MainWindow(QMainWindow):
@@ -144,9 +172,14 @@ class MainWindow(QMainWindow):
         # 3. Now that both self.sensor_worker and all tabs exist, connect all signals.
         self._connect_signals()
 
+        # Settings read on every worker cycle / system check, refreshed on settings_updated
+        self._reload_cached_settings()
+
         # 4. Setup System Monitor
         self._setup_system_monitor()
 
+        self._qss_cache = {} # Theme stylesheet text by theme name, read from disk once
+        self._current_theme_applied = None # Theme _apply_theme last applied successfully
         self._apply_theme(self.config.get_setting("current_theme", "dark_theme"))
         self.logger.info("Main Window initialized.")
 
@@ -187,11 +220,27 @@ class MainWindow(QMainWindow):
         self.ui_customization_tab = UICustomizationTab(self, parent=self) # Pass self (MainWindow) as reference
         self.tabs.addTab(self.ui_customization_tab, "UI Customization")
 
+        # Tabs restyled by _apply_theme, in tab order; each implements apply_theme()
+        self._themeable_tabs = [
+            self.dashboard_tab,
+            self.environment_sensors_tab,
+            self.basic_analog_sensors_tab,
+            self.interactive_control_sensors_tab,
+            self.weather_tab,
+            self.plots_tab,
+            self.settings_tab,
+            self.ui_customization_tab,
+        ]
+
     def _setup_sensor_worker(self):
         """Sets up the worker thread for continuous sensor reading."""
         read_interval = self.config.get_setting("sensor_read_interval", 2)
+        # CSV logging runs on its own thread, fed through a bounded queue
+        self.log_queue = queue.Queue(maxsize=256)
+        self.sensor_log_writer = SensorLogWriter(self.sensor_manager, self.log_queue)
+        self.sensor_log_writer.start()
         # Pass self.config to the SensorWorker
-        self.sensor_worker = SensorWorker(self.sensor_manager, self.config, read_interval) 
+        self.sensor_worker = SensorWorker(self.sensor_manager, self.config, read_interval, self.log_queue)
         # Worker is started here, but signals are connected in _connect_signals
         self.sensor_worker.start()
         self.logger.info("SensorWorker thread started.")
@@ -199,13 +248,12 @@ class MainWindow(QMainWindow):
     def _connect_signals(self):
         """Connects all signals between various components after they are initialized."""
         # Connections from sensor_worker to respective tabs
-        self.sensor_worker.sensor_data_updated.connect(self.dashboard_tab.update_sensor_data)
-        self.sensor_worker.dht_data_updated.connect(self.environment_sensors_tab.update_dht_data)
-        self.sensor_worker.ultrasonic_data_updated.connect(self.basic_analog_sensors_tab.update_ultrasonic_data)
-        self.sensor_worker.sound_data_updated.connect(self.basic_analog_sensors_tab.update_sound_data)
-        self.sensor_worker.light_data_updated.connect(self.basic_analog_sensors_tab.update_light_data)
-        self.sensor_worker.button_data_updated.connect(self.interactive_control_sensors_tab.update_button_status)
-        self.sensor_worker.rotary_angle_data_updated.connect(self.interactive_control_sensors_tab.update_rotary_angle_data)
+        # Explicitly queued: the worker emits from its own thread, and the readings are
+        # immutable SensorReading tuples, so nothing is shared mutably across threads
+        self.sensor_worker.sensor_data_updated.connect(self.dashboard_tab.update_sensor_data, Qt.QueuedConnection)
+        self.sensor_worker.sensor_data_updated.connect(self.environment_sensors_tab.update_from_payload, Qt.QueuedConnection)
+        self.sensor_worker.sensor_data_updated.connect(self.basic_analog_sensors_tab.update_from_payload, Qt.QueuedConnection)
+        self.sensor_worker.sensor_data_updated.connect(self.interactive_control_sensors_tab.update_from_payload, Qt.QueuedConnection)
 
         # Connections for theme changes
         self.ui_customization_tab.theme_changed.connect(self._apply_theme)
@@ -215,8 +263,8 @@ class MainWindow(QMainWindow):
         # Connections from settings_tab to other components
         # Changed _fetch_and_update_weather to fetch_and_update_weather (public method)
         self.settings_tab.settings_updated.connect(self.weather_tab.fetch_and_update_weather) 
-        self.settings_tab.settings_updated.connect(self.sensor_worker.stop) # Stop worker to apply new interval
-        self.settings_tab.settings_updated.connect(self._restart_sensor_worker) # Restart with new interval
+        self.settings_tab.settings_updated.connect(self._reload_cached_settings)
+        self.settings_tab.settings_updated.connect(self._update_sensor_read_interval) # Apply new interval to the running worker
         self.settings_tab.settings_updated.connect(self.plots_tab._apply_theme_colors_to_plot) # In case theme changed
         
         # Connect sensor manager relay and LED bar signals to interactive controls tab
@@ -227,28 +275,31 @@ class MainWindow(QMainWindow):
         self.sensor_manager.relay_status_changed.connect(self.dashboard_tab.update_relay_status)
         self.sensor_manager.led_bar_status_changed.connect(self.dashboard_tab.update_led_bar_status)
 
-    def _restart_sensor_worker(self):
-        """Restarts the sensor worker with updated settings (e.g., read interval)."""
-        if self.sensor_worker.isRunning():
-            self.sensor_worker.stop()
-            self.sensor_worker.wait() # Wait for the thread to finish cleanly
-        
-        # Re-initialize worker with new interval from config
-        new_read_interval = self.config.get_setting("sensor_read_interval", 2)
-        self.sensor_worker = SensorWorker(self.sensor_manager, self.config, new_read_interval) # Pass self.config
-
-        # Reconnect signals for the new worker instance
-        # It's important to re-establish these connections as the old worker is gone
-        self.sensor_worker.sensor_data_updated.connect(self.dashboard_tab.update_sensor_data)
-        self.sensor_worker.dht_data_updated.connect(self.environment_sensors_tab.update_dht_data)
-        self.sensor_worker.ultrasonic_data_updated.connect(self.basic_analog_sensors_tab.update_ultrasonic_data)
-        self.sensor_worker.sound_data_updated.connect(self.basic_analog_sensors_tab.update_sound_data)
-        self.sensor_worker.light_data_updated.connect(self.basic_analog_sensors_tab.update_light_data)
-        self.sensor_worker.button_data_updated.connect(self.interactive_control_sensors_tab.update_button_status)
-        self.sensor_worker.rotary_angle_data_updated.connect(self.interactive_control_sensors_tab.update_rotary_angle_data)
+    def _reload_cached_settings(self):
+        """Re-reads the settings used in hot paths and pushes them to the sensor worker."""
+        self._min_free_space_gb = self.config.get_setting("min_free_space_gb", 1.0)
+        self._log_enabled = self.config.get_setting("enable_sensor_logging", True)
+        self.sensor_worker.enable_logging = self._log_enabled
+
+        # Directories watched by _check_system_status, resolved once against the project root:
+        # (description, absolute path, setting disabled when space is critically low, what that disables)
+        self._monitored_dirs = (
+            ("log directory",
+             os.path.join(project_root, self.config.get_setting("log_directory", "Debug_Logs")),
+             None, None),
+            ("archive directory",
+             os.path.join(project_root, self.config.get_setting("archive_directory", "Archive_Sensor_Logs")),
+             "enable_archive", "archiving"),
+            ("sensor log directory",
+             os.path.join(project_root, self.config.get_setting("sensor_log_directory", "Sensor_Logs")),
+             "enable_sensor_logging", "sensor CSV logging"),
+        )
 
-        self.sensor_worker.start()
-        self.logger.info("SensorWorker thread restarted with new interval: {}s.".format(new_read_interval))
+    def _update_sensor_read_interval(self):
+        """Applies the configured read interval to the running sensor worker."""
+        new_read_interval = self.config.get_setting("sensor_read_interval", 2)
+        self.sensor_worker.set_interval(new_read_interval)
+        self.logger.info("SensorWorker read interval set to {}s.".format(new_read_interval))
 
     def _update_sensor_display_style(self):
         """
@@ -276,46 +327,32 @@ class MainWindow(QMainWindow):
     def _check_system_status(self):
         """Checks system parameters like disk space and logs warnings/critical messages."""
         self.logger.debug("Performing system status check.")
-        
-        # Get project root for relative paths
-        project_root_abs = os.path.abspath(os.path.join(script_dir, os.pardir))
-
-        # Check debug log directory space
-        log_dir = self.config.get_setting("log_directory", "Debug_Logs")
-        log_abs_path = os.path.join(project_root_abs, log_dir)
-        free_space_log_gb = self.storage_monitor.get_free_space_gb(log_abs_path)
-        if free_space_log_gb < self.config.get_setting("min_free_space_gb", 1.0):
-            self.logger.warning("Low disk space in log directory ({}): {:.2f} GB available.".format(log_abs_path, free_space_log_gb))
-
-        # Check archive directory space
-        archive_dir = self.config.get_setting("archive_directory", "Archive_Sensor_Logs")
-        archive_abs_path = os.path.join(project_root_abs, archive_dir)
-        free_space_archive_gb = self.storage_monitor.get_free_space_gb(archive_abs_path)
-        if free_space_archive_gb < self.config.get_setting("min_free_space_gb", 1.0):
-            self.logger.warning("Low disk space in archive directory ({}): {:.2f} GB available.".format(archive_abs_path, free_space_archive_gb))
-            if free_space_archive_gb < 0.1: # Very critical threshold
-                self.config.set_setting("enable_archive", False)
-                self.logger.critical("Extremely low disk space. Disabling archiving.")
-
-        # Check sensor log directory space
-        sensor_log_dir = self.config.get_setting("sensor_log_directory", "Sensor_Logs")
-        sensor_log_abs_path = os.path.join(project_root_abs, sensor_log_dir)
-        free_space_sensor_log_gb = self.storage_monitor.get_free_space_gb(sensor_log_abs_path)
-        if free_space_sensor_log_gb < self.config.get_setting("min_free_space_gb", 1.0):
-            self.logger.warning("Low disk space in sensor log directory ({}): {:.2f} GB available.".format(sensor_log_abs_path, free_space_sensor_log_gb))
-            if free_space_sensor_log_gb < 0.1: # Very critical threshold
-                self.config.set_setting("enable_sensor_logging", False)
-                self.logger.critical("Extremely low disk space. Disabling sensor CSV logging.")
+
+        for description, abs_path, disable_key, disabled_feature in self._monitored_dirs:
+            free_space_gb = self.storage_monitor.get_free_space_gb(abs_path)
+            if free_space_gb < self._min_free_space_gb:
+                self.logger.warning("Low disk space in {} ({}): {:.2f} GB available.".format(description, abs_path, free_space_gb))
+                if disable_key and free_space_gb < 0.1: # Very critical threshold
+                    self.config.set_setting(disable_key, False)
+                    if disable_key == "enable_sensor_logging":
+                        self._log_enabled = self.sensor_worker.enable_logging = False
+                    self.logger.critical("Extremely low disk space. Disabling {}.".format(disabled_feature))
 
 
     def closeEvent(self, event):
         """
         Handles the close event for the main window, stopping the sensor thread.
         """
+        if self.settings_tab._save_timer.isActive():
+            # Save text field edits still waiting on the settings tab's debounce
+            self.settings_tab._flush_pending_saves()
         self.logger.info("Main Window closing. Stopping sensor worker...")
         if self.sensor_worker.isRunning():
             self.sensor_worker.stop()
             self.sensor_worker.wait() # Wait for the thread to finish
+        if self.sensor_log_writer.isRunning():
+            self.log_queue.put(None) # Sentinel: write what is queued, then exit
+            self.sensor_log_writer.wait()
         self.logger.info("Sensor worker stopped. Application exiting.")
         event.accept()
 
@@ -324,47 +361,28 @@ class MainWindow(QMainWindow):
         Applies the selected theme stylesheet to the application.
         :param theme_name: The name of the theme (e.g., "dark_theme", "light_theme").
         """
+        if theme_name == self._current_theme_applied:
+            return # Already applied; restyling the whole widget tree again would change nothing
         self.logger.info("Applying theme: {}".format(theme_name))
         theme_path = os.path.join(project_root, 'themes', "{}.qss".format(theme_name))
         
-        if os.path.exists(theme_path):
+        if theme_name in self._qss_cache or os.path.exists(theme_path):
             try:
-                with open(theme_path, "r") as f:
-                    self.setStyleSheet(f.read())
+                qss = self._qss_cache.get(theme_name)
+                if qss is None:
+                    with open(theme_path, "r") as f:
+                        qss = f.read()
+                    self._qss_cache[theme_name] = qss
+                self.setStyleSheet(qss)
+                self._current_theme_applied = theme_name
                 self.config.set_setting("current_theme", theme_name) # Save the applied theme
                 self.logger.info("Theme '{}' applied successfully.".format(theme_name))
                 
                 # Manually trigger style updates for custom widgets that don't auto-update
                 # This is crucial for GaugeWidget and LEDBarWidget which draw custom elements.
-                for tab_idx in range(self.tabs.count()):
-                    tab = self.tabs.widget(tab_idx)
-                    if hasattr(tab, 'set_style'):
-                        tab.set_style()
-                    
-                    # For custom widgets within tabs, call their _set_theme_colors method
-                    # (assuming they have one, like GaugeWidget does).
-                    # This might require iterating over specific widgets.
-                    # For now, we'll call set_style on tabs which then should propagate.
-                    # Explicitly call _set_theme_colors on gauge widgets within dashboard
-                    if isinstance(tab, DashboardTab):
-                        self.dashboard_tab._set_theme_colors_for_gauges()
-                    if isinstance(tab, EnvironmentSensorsTab):
-                        self.environment_sensors_tab._set_theme_colors()
-                    if isinstance(tab, BasicAnalogSensorsTab):
-                        self.basic_analog_sensors_tab._set_theme_colors()
-                    if isinstance(tab, InteractiveControlSensorsTab):
-                        self.interactive_control_sensors_tab._set_theme_colors()
-                    if isinstance(tab, WeatherTab):
-                        # WeatherTab handles its own theme colors through _set_theme_colors
-                        tab._set_theme_colors() # Update internal QColors for dynamic elements
-                        # Changed _fetch_and_update_weather to fetch_and_update_weather (public method)
-                        if hasattr(tab, 'fetch_and_update_weather'):
-                            tab.fetch_and_update_weather() 
-                        else:
-                            self.logger.warning("WeatherTab does not have 'fetch_and_update_weather' method.")
-                    if isinstance(tab, PlotsTab):
-                        tab._apply_theme_colors_to_plot()
-
+                # Each tab knows how to restyle itself through its apply_theme() method.
+                for tab in self._themeable_tabs:
+                    tab.apply_theme()
 
             except Exception as e:
                 self.logger.error("Error applying theme '{}': {}".format(theme_name, e))
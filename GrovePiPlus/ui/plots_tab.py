@@ -1,12 +1,13 @@
 # ui/plots_tab.py
 import os
 import sys
+import functools
+import hashlib
 from datetime import datetime, timedelta
-import pandas as pd # Used for data handling (pip install pandas)
-import pyqtgraph as pg # Used for plotting (pip install pyqtgraph)
+import numpy as np
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QCheckBox, QSizePolicy, QLineEdit, QFileDialog, QMessageBox, QTableWidget, QTableWidgetItem, QFrame
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QApplication, QGraphicsItem, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QCheckBox, QSizePolicy, QLineEdit, QFileDialog, QMessageBox, QTableView, QFrame
+from PyQt5.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QFont, QColor
 
 # Ensure SensorApp root is in path for imports
@@ -17,6 +18,368 @@ if project_root not in sys.path:
 
 from utils.logger import Logger
 from utils.config_manager import ConfigManager
+from utils.fastmath import minmax_downsample
+
+# Conditional import of pyarrow: a faster CSV parser, and a parquet engine for the
+# sensor log cache (pip install pyarrow); fastparquet also works for the cache
+try:
+    import pyarrow # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+if PYARROW_AVAILABLE:
+    PARQUET_AVAILABLE = True
+else:
+    try:
+        import fastparquet # noqa: F401
+        PARQUET_AVAILABLE = True
+    except ImportError:
+        PARQUET_AVAILABLE = False
+
+# Column types of the sensor log written by GrovePiSensorManager.log_sensor_data. Narrower
+# than pandas' float64/int64 defaults, which halves the memory every later pass reads.
+_CSV_DTYPES = {
+    "Temperature_C": "float32",
+    "Humidity_perc": "float32",
+    "Ultrasonic_cm": "float32",
+    "Sound_raw": "int32",
+    "Light_raw": "int32",
+    "Button_state": "int8",
+    "RotaryAngle_raw": "int32"
+}
+
+# pandas and pyqtgraph are slow to import (seconds on a Raspberry Pi), so they are only
+# imported once the Plots tab is first shown; see _import_plotting_modules
+pd = None # Used for data handling (pip install pandas)
+pg = None # Used for plotting (pip install pyqtgraph)
+
+
+def _import_plotting_modules():
+    """Imports pandas and pyqtgraph into this module on first call."""
+    global pd, pg
+    if pd is None:
+        import pandas
+        import pyqtgraph
+        pd = pandas
+        pg = pyqtgraph
+
+# QImage.save quality for exported PNGs. Qt maps it to a zlib level of (100 - quality) * 9 / 91,
+# so 80 gives level 1: several times faster to write than the default level, slightly larger file
+_PNG_SAVE_QUALITY = 80
+# QImage.save quality for exported JPEGs: smaller and faster to encode, lossy
+_JPEG_SAVE_QUALITY = 90
+
+# Plot color palettes for the various themes, built once at import
+_THEME_PALETTES = {
+    "dark_theme": {
+        "plot_bg": QColor(40, 44, 52),      # Dark background
+        "axis_text": QColor(171, 178, 191), # Light gray
+        "grid_line": QColor(60, 65, 75),    # Slightly lighter dark gray
+        "title_text": QColor(97, 175, 239), # Blue
+        "legend_text": QColor(171, 178, 191),
+        "export_button_bg": QColor(97, 175, 239),
+        "export_button_text": QColor(255, 255, 255),
+        "warning_text_color": QColor(255, 100, 100), # Red for warnings
+        "combo_bg": QColor("#3e4451"), # ComboBox background
+        "combo_text": QColor("#abb2bf"), # ComboBox text
+        "combo_border": QColor("#5c6370"), # ComboBox border
+        "line_colors": { # Ensure enough distinct colors for all sensors
+            "Temperature_C": QColor(224, 108, 117),  # Reddish
+            "Humidity_perc": QColor(97, 175, 239),   # Bluish
+            "Ultrasonic_cm": QColor(152, 195, 121),  # Greenish
+            "Sound_raw": QColor(229, 192, 123),      # Yellowish
+            "Light_raw": QColor(86, 182, 194),       # Cyan
+            "Button_state": QColor(198, 120, 221),   # Purplish
+            "RotaryAngle_raw": QColor(255, 255, 255) # White
+        }
+    },
+    "light_theme": {
+        "plot_bg": QColor(240, 240, 240),
+        "axis_text": QColor(51, 51, 51),
+        "grid_line": QColor(200, 200, 200),
+        "title_text": QColor(0, 123, 255),
+        "legend_text": QColor(51, 51, 51),
+        "export_button_bg": QColor(0, 123, 255),
+        "export_button_text": QColor(255, 255, 255),
+        "warning_text_color": QColor(220, 53, 69), # Red for warnings
+        "combo_bg": QColor("#f8f8f8"),
+        "combo_text": QColor("#333"),
+        "combo_border": QColor("#ccc"),
+        "line_colors": {
+            "Temperature_C": QColor(220, 53, 69),
+            "Humidity_perc": QColor(0, 123, 255),
+            "Ultrasonic_cm": QColor(40, 167, 69),
+            "Sound_raw": QColor(255, 193, 7),
+            "Light_raw": QColor(23, 162, 184),
+            "Button_state": QColor(108, 117, 125),
+            "RotaryAngle_raw": QColor(0, 0, 0)
+        }
+    },
+    "blue_theme": {
+        "plot_bg": QColor(26, 42, 64),
+        "axis_text": QColor(224, 242, 247),
+        "grid_line": QColor(43, 74, 104),
+        "title_text": QColor(135, 206, 235),
+        "legend_text": QColor(224, 242, 247),
+        "export_button_bg": QColor(70, 130, 180),
+        "export_button_text": QColor(255, 255, 255),
+        "warning_text_color": QColor(255, 99, 71), # Tomato
+        "combo_bg": QColor("#223f5b"),
+        "combo_text": QColor("#e0f2f7"),
+        "combo_border": QColor("#4a6c8e"),
+        "line_colors": {
+            "Temperature_C": QColor(255, 99, 71),
+            "Humidity_perc": QColor(100, 149, 237),
+            "Ultrasonic_cm": QColor(60, 179, 113),
+            "Sound_raw": QColor(255, 215, 0),
+            "Light_raw": QColor(123, 104, 238),
+            "Button_state": QColor(218, 112, 214),
+            "RotaryAngle_raw": QColor(255, 250, 205)
+        }
+    },
+    "dark_gray_theme": {
+        "plot_bg": QColor(50, 50, 50),
+        "axis_text": QColor(240, 240, 240),
+        "grid_line": QColor(80, 80, 80),
+        "title_text": QColor(121, 197, 255), # Lighter blue
+        "legend_text": QColor(240, 240, 240),
+        "export_button_bg": QColor(106, 115, 125),
+        "export_button_text": QColor(255, 255, 255),
+        "warning_text_color": QColor(255, 100, 100), # Red
+        "combo_bg": QColor("#4b4f52"),
+        "combo_text": QColor("#fdfdfd"),
+        "combo_border": QColor("#6c7072"),
+        "line_colors": {
+            "Temperature_C": QColor(255, 100, 100),
+            "Humidity_perc": QColor(100, 150, 255),
+            "Ultrasonic_cm": QColor(100, 255, 100),
+            "Sound_raw": QColor(255, 255, 100),
+            "Light_raw": QColor(100, 255, 255),
+            "Button_state": QColor(255, 100, 255),
+            "RotaryAngle_raw": QColor(200, 200, 200)
+        }
+    },
+    "forest_green_theme": {
+        "plot_bg": QColor(34, 139, 34), # Forest Green
+        "axis_text": QColor(255, 255, 255),
+        "grid_line": QColor(76, 175, 80),
+        "title_text": QColor(165, 214, 167),
+        "legend_text": QColor(255, 255, 255),
+        "export_button_bg": QColor(102, 187, 106),
+        "export_button_text": QColor(255, 255, 255),
+        "warning_text_color": QColor(255, 120, 120), # Red
+        "combo_bg": QColor("#339933"),
+        "combo_text": QColor("#FFFFFF"),
+        "combo_border": QColor("#4CAF50"),
+        "line_colors": {
+            "Temperature_C": QColor(255, 120, 120),
+            "Humidity_perc": QColor(120, 120, 255),
+            "Ultrasonic_cm": QColor(255, 255, 120),
+            "Sound_raw": QColor(120, 255, 255),
+            "Light_raw": QColor(255, 120, 255),
+            "Button_state": QColor(255, 160, 120),
+            "RotaryAngle_raw": QColor(200, 200, 200)
+        }
+    },
+    "warm_sepia_theme": {
+        "plot_bg": QColor(112, 66, 20), # Sepia Brown
+        "axis_text": QColor(245, 222, 179), # Wheat
+        "grid_line": QColor(139, 69, 19),
+        "title_text": QColor(222, 184, 135), # BurlyWood
+        "legend_text": QColor(245, 222, 179),
+        "export_button_bg": QColor(160, 82, 45),
+        "export_button_text": QColor(255, 255, 255),
+        "warning_text_color": QColor(205, 92, 92), # IndianRed
+        "combo_bg": QColor("#7C4F2A"),
+        "combo_text": QColor("#F5DEB3"),
+        "combo_border": QColor("#A0522D"),
+        "line_colors": {
+            "Temperature_C": QColor(205, 92, 92), # IndianRed
+            "Humidity_perc": QColor(100, 149, 237), # CornflowerBlue
+            "Ultrasonic_cm": QColor(107, 142, 35), # OliveDrab
+            "Sound_raw": QColor(255, 215, 0), # Gold
+            "Light_raw": QColor(188, 143, 143), # RosyBrown
+            "Button_state": QColor(210, 105, 30), # Chocolate
+            "RotaryAngle_raw": QColor(240, 230, 140) # Khaki
+        }
+    },
+    "ocean_blue_theme": {
+        "plot_bg": QColor(0, 51, 102), # Dark Ocean Blue
+        "axis_text": QColor(224, 255, 255), # Light Cyan
+        "grid_line": QColor(0, 80, 153),
+        "title_text": QColor(135, 206, 250), # Light Sky Blue
+        "legend_text": QColor(224, 255, 255),
+        "export_button_bg": QColor(70, 130, 180),
+        "export_button_text": QColor(255, 255, 255),
+        "warning_text_color": QColor(255, 99, 71), # Tomato
+        "combo_bg": QColor("#004080"),
+        "combo_text": QColor("#E0FFFF"),
+        "combo_border": QColor("#005099"),
+        "line_colors": {
+            "Temperature_C": QColor(255, 99, 71), # Tomato
+            "Humidity_perc": QColor(100, 149, 237), # CornflowerBlue
+            "Ultrasonic_cm": QColor(95, 158, 160), # CadetBlue
+            "Sound_raw": QColor(255, 255, 0), # Yellow
+            "Light_raw": QColor(0, 255, 255), # Cyan
+            "Button_state": QColor(255, 0, 255), # Magenta
+            "RotaryAngle_raw": QColor(255, 255, 255) # White
+        }
+    },
+    "vibrant_purple_theme": {
+        "plot_bg": QColor(75, 0, 130), # Indigo
+        "axis_text": QColor(230, 230, 250), # Lavender
+        "grid_line": QColor(106, 13, 173),
+        "title_text": QColor(221, 160, 221), # Plum
+        "legend_text": QColor(230, 230, 250),
+        "export_button_bg": QColor(138, 43, 226),
+        "export_button_text": QColor(255, 255, 255),
+        "warning_text_color": QColor(255, 69, 0), # OrangeRed
+        "combo_bg": QColor("#5F2A80"),
+        "combo_text": QColor("#E6E6FA"),
+        "combo_border": QColor("#8A2BE2"),
+        "line_colors": {
+            "Temperature_C": QColor(255, 69, 0), # OrangeRed
+            "Humidity_perc": QColor(123, 104, 238), # MediumSlateBlue
+            "Ultrasonic_cm": QColor(0, 255, 127), # SpringGreen
+            "Sound_raw": QColor(255, 255, 0), # Yellow
+            "Light_raw": QColor(255, 99, 71), # Tomato
+            "Button_state": QColor(255, 20, 147), # DeepPink
+            "RotaryAngle_raw": QColor(255, 255, 255) # White
+        }
+    },
+    "light_modern_theme": {
+        "plot_bg": QColor(224, 224, 224), # Light Gray
+        "axis_text": QColor(51, 51, 51),
+        "grid_line": QColor(192, 192, 192),
+        "title_text": QColor(85, 85, 85),
+        "legend_text": QColor(51, 51, 51),
+        "export_button_bg": QColor(96, 125, 139),
+        "export_button_text": QColor(255, 255, 255),
+        "warning_text_color": QColor(239, 83, 80), # Red
+        "combo_bg": QColor("#FFFFFF"),
+        "combo_text": QColor("#333333"),
+        "combo_border": QColor("#C0C0C0"),
+        "line_colors": {
+            "Temperature_C": QColor(239, 83, 80),  # Red
+            "Humidity_perc": QColor(66, 165, 245),  # Blue
+            "Ultrasonic_cm": QColor(102, 187, 106), # Green
+            "Sound_raw": QColor(255, 213, 79),     # Amber
+            "Light_raw": QColor(77, 182, 172),     # Teal
+            "Button_state": QColor(171, 71, 188),  # Purple
+            "RotaryAngle_raw": QColor(158, 158, 158) # Grey
+        }
+    },
+    "high_contrast_theme": {
+        "plot_bg": QColor(0, 0, 0), # Black
+        "axis_text": QColor(255, 255, 0), # Yellow
+        "grid_line": QColor(255, 0, 255), # Magenta
+        "title_text": QColor(0, 255, 255), # Cyan
+        "legend_text": QColor(255, 255, 0), # Yellow
+        "export_button_bg": QColor(255, 0, 255),
+        "export_button_text": QColor(0, 0, 0),
+        "combo_bg": QColor("#222222"),
+        "combo_text": QColor("#FFFF00"),
+        "combo_border": QColor("#FF00FF"),
+        "warning_text_color": QColor(255, 0, 0), # Red
+        "line_colors": {
+            "Temperature_C": QColor(255, 0, 0),   # Red
+            "Humidity_perc": QColor(0, 0, 255),   # Blue
+            "Ultrasonic_cm": QColor(0, 255, 0),   # Green
+            "Sound_raw": QColor(255, 255, 0),     # Yellow
+            "Light_raw": QColor(0, 255, 255),     # Cyan
+            "Button_state": QColor(255, 0, 255),  # Magenta
+            "RotaryAngle_raw": QColor(255, 255, 255) # White
+        }
+    }
+}
+
+# "#rrggbb" names of the palette colors above (line colors excepted, they are only used as
+# pens), so theme changes and replots pass strings without converting QColors each time
+_THEME_HEX = {
+    theme: {key: color.name() for key, color in palette.items() if key != "line_colors"}
+    for theme, palette in _THEME_PALETTES.items()
+}
+
+# Palette-independent part of the tab stylesheet, applied once (see PlotsTab.__init__)
+_STATIC_QSS = """
+    QWidget#PlotsTab {
+        background-color: transparent;
+    }
+    QFrame#groupFrame {
+        border: 1px solid #555;
+        border-radius: 10px;
+        background-color: rgba(40, 40, 40, 0.7);
+        margin: 5px;
+        padding: 10px;
+    }
+    QLabel {
+        color: #EEE; /* Default text color */
+    }
+    QLabel:hover {
+        color: #FFD700;
+    }
+    QCheckBox {
+        color: #EEE;
+    }
+    QPushButton {
+        background-color: #4CAF50; /* Green */
+        color: white;
+        border-radius: 5px;
+        padding: 5px 10px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    /* Table Widget Styling */
+    QTableView {
+        background-color: #282c34;
+        alternate-background-color: #21252b;
+        color: #abb2bf;
+        border: 1px solid #444;
+        gridline-color: #555;
+    }
+    QTableView::item {
+        padding: 5px;
+    }
+    QHeaderView::section {
+        background-color: #3a3f4b;
+        color: #abb2bf;
+        padding: 5px;
+        border: 1px solid #444;
+    }
+    QTableView::item:selected {
+        background-color: #61afef;
+        color: white;
+    }
+"""
+
+# Stylesheet for the time range combo box, filled in by PlotsTab.set_style from the theme
+# palette. Only this part changes with the theme, so only the combo is restyled.
+_COMBO_QSS_TEMPLATE = """
+    QComboBox {{
+        background-color: {combo_bg}; /* Dynamic background from theme_palette */
+        color: {combo_text}; /* Dynamic text color from theme_palette */
+        border: 1px solid {combo_border}; /* Dynamic border color from theme_palette */
+        border-radius: 5px;
+        padding: 5px;
+    }}
+    QComboBox::drop-down {{
+        border: 0px;
+    }}
+    QComboBox::down-arrow {{
+        image: url(icons/arrow_down_light.png);
+        width: 16px;
+        height: 16px;
+    }}
+    QComboBox QAbstractItemView {{ /* Style for the dropdown list */
+        background-color: {combo_bg}; /* Same as combo box background */
+        color: {combo_text}; /* Same as combo box text color */
+        selection-background-color: {selection_bg}; /* Highlight color */
+        selection-color: {selection_text}; /* Highlighted text color */
+        border: 1px solid {combo_border}; /* Border for the dropdown */
+    }}
+"""
 
 
 class PlotsTab(QWidget):
@@ -24,6 +387,9 @@ class PlotsTab(QWidget):
     A tab dedicated to displaying sensor data plots for analysis.
     Allows selection of sensors, time ranges, and features legends and theme awareness.
     """
+    _shared_qss = {} # Rendered combo box stylesheet per theme name
+    _shared_pens = {} # Pens by (rgba, width); themes mostly reuse the same colors
+
     SENSOR_COLUMNS = {
         "Temperature_C": "Temperature (°C)",
         "Humidity_perc": "Humidity (%)",
@@ -57,248 +423,76 @@ class PlotsTab(QWidget):
         super(PlotsTab, self).__init__(parent)
         self.logger = Logger.get_logger()
         self.config = config_manager
-        self.data = pd.DataFrame() # Holds the loaded sensor data
+        self.data = None # Holds the loaded sensor data, sorted by Timestamp (a DataFrame once built)
+        self._ts_ns = np.empty(0, dtype=np.int64) # self.data's timestamps as int64 ns, for searchsorted
+        self._ts_s = np.empty(0, dtype=np.float64) # The same timestamps as epoch seconds, the plot's x values
         self.current_plot_items = {} # To store plot data items for updating colors
+        # Every plot item built for the current data and time range, shown or not, so
+        # checkbox toggles can add/remove an existing item instead of replotting
+        self._plot_cache = {}
+        self._last_pen_colors = {} # Line color each cached item is currently drawn in, by sensor key
+        self._view_x = None # Epoch-second x values of the currently plotted time range
+        self._view_slice = None # Row slice of self.data in the currently plotted time range
         self.original_plot_title = "Sensor Data Plot" # Store the original title text
+        self._export_task = None # Background image save started by _export_plot_view, if any
+
+        # Coalesces bursts of plot update requests (see _update_plot) into one redraw
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(50)
+        self._update_timer.timeout.connect(self._do_update_plot)
 
-        self._set_theme_colors() # Set initial theme colors FIRST
         self.main_layout = QVBoxLayout(self)
         self.setLayout(self.main_layout)
+        self.setStyleSheet(_STATIC_QSS) # Before any children exist, so nothing is re-polished
+
+        # The plot, data and table are built on first show (see _build_ui); until then
+        # theme calls have nothing to restyle
+        self._ui_built = False
+        self._applied_qss = None # Combo box stylesheet last applied by set_style
+        self.logger.info("PlotsTab initialized.")
 
+    def showEvent(self, event):
+        """Builds the tab's contents the first time it is shown."""
+        if not self._ui_built:
+            self._build_ui()
+        super(PlotsTab, self).showEvent(event)
+
+    def _build_ui(self):
+        """Imports the plotting modules, then builds the UI and loads the sensor data."""
+        _import_plotting_modules()
+        self._configure_rendering() # Before the PlotWidget is created
+        self.data = pd.DataFrame()
+        self._set_theme_colors() # Set initial theme colors FIRST
         self._setup_ui() # Then setup UI, which uses theme colors
+        self._ui_built = True
         self._apply_theme_colors_to_plot() # Apply theme colors to plot
         self.set_style()
-        self.logger.info("PlotsTab initialized.")
+
+    def _configure_rendering(self):
+        """
+        Applies the plot rendering settings. With "plot_use_opengl" (the default) and PyOpenGL
+        installed, pyqtgraph rasterizes lines on the GPU instead of through QPainter;
+        "plot_cache_curves" additionally caches each drawn line and both axes as device pixmaps.
+        """
+        if self.config.get_setting("plot_use_opengl", True):
+            # Conditional import of PyOpenGL (pip install PyOpenGL)
+            try:
+                import OpenGL # noqa: F401
+                pg.setConfigOptions(useOpenGL=True, enableExperimental=True, antialias=False)
+                self.logger.info("Plots are rendered with OpenGL.")
+            except ImportError:
+                self.logger.debug("PyOpenGL not installed; plots are rendered without OpenGL.")
+        # Off by default: a cached line is redrawn only on resize and looks blurry while zooming
+        self._cache_curves = bool(self.config.get_setting("plot_cache_curves", False))
 
     def _set_theme_colors(self):
         """Sets internal color attributes based on the current theme for plot elements."""
         current_theme = self.config.get_setting("current_theme", "dark_theme")
 
-        # Define color palettes for various themes for plot elements
-        theme_palettes = {
-            "dark_theme": {
-                "plot_bg": QColor(40, 44, 52),      # Dark background
-                "axis_text": QColor(171, 178, 191), # Light gray
-                "grid_line": QColor(60, 65, 75),    # Slightly lighter dark gray
-                "title_text": QColor(97, 175, 239), # Blue
-                "legend_text": QColor(171, 178, 191),
-                "export_button_bg": QColor(97, 175, 239),
-                "export_button_text": QColor(255, 255, 255),
-                "warning_text_color": QColor(255, 100, 100), # Red for warnings
-                "combo_bg": QColor("#3e4451"), # ComboBox background
-                "combo_text": QColor("#abb2bf"), # ComboBox text
-                "combo_border": QColor("#5c6370"), # ComboBox border
-                "line_colors": { # Ensure enough distinct colors for all sensors
-                    "Temperature_C": QColor(224, 108, 117),  # Reddish
-                    "Humidity_perc": QColor(97, 175, 239),   # Bluish
-                    "Ultrasonic_cm": QColor(152, 195, 121),  # Greenish
-                    "Sound_raw": QColor(229, 192, 123),      # Yellowish
-                    "Light_raw": QColor(86, 182, 194),       # Cyan
-                    "Button_state": QColor(198, 120, 221),   # Purplish
-                    "RotaryAngle_raw": QColor(255, 255, 255) # White
-                }
-            },
-            "light_theme": {
-                "plot_bg": QColor(240, 240, 240),
-                "axis_text": QColor(51, 51, 51),
-                "grid_line": QColor(200, 200, 200),
-                "title_text": QColor(0, 123, 255),
-                "legend_text": QColor(51, 51, 51),
-                "export_button_bg": QColor(0, 123, 255),
-                "export_button_text": QColor(255, 255, 255),
-                "warning_text_color": QColor(220, 53, 69), # Red for warnings
-                "combo_bg": QColor("#f8f8f8"),
-                "combo_text": QColor("#333"),
-                "combo_border": QColor("#ccc"),
-                "line_colors": {
-                    "Temperature_C": QColor(220, 53, 69),
-                    "Humidity_perc": QColor(0, 123, 255),
-                    "Ultrasonic_cm": QColor(40, 167, 69),
-                    "Sound_raw": QColor(255, 193, 7),
-                    "Light_raw": QColor(23, 162, 184),
-                    "Button_state": QColor(108, 117, 125),
-                    "RotaryAngle_raw": QColor(0, 0, 0)
-                }
-            },
-            "blue_theme": {
-                "plot_bg": QColor(26, 42, 64),
-                "axis_text": QColor(224, 242, 247),
-                "grid_line": QColor(43, 74, 104),
-                "title_text": QColor(135, 206, 235),
-                "legend_text": QColor(224, 242, 247),
-                "export_button_bg": QColor(70, 130, 180),
-                "export_button_text": QColor(255, 255, 255),
-                "warning_text_color": QColor(255, 99, 71), # Tomato
-                "combo_bg": QColor("#223f5b"),
-                "combo_text": QColor("#e0f2f7"),
-                "combo_border": QColor("#4a6c8e"),
-                "line_colors": {
-                    "Temperature_C": QColor(255, 99, 71),
-                    "Humidity_perc": QColor(100, 149, 237),
-                    "Ultrasonic_cm": QColor(60, 179, 113),
-                    "Sound_raw": QColor(255, 215, 0),
-                    "Light_raw": QColor(123, 104, 238),
-                    "Button_state": QColor(218, 112, 214),
-                    "RotaryAngle_raw": QColor(255, 250, 205)
-                }
-            },
-            "dark_gray_theme": {
-                "plot_bg": QColor(50, 50, 50),
-                "axis_text": QColor(240, 240, 240),
-                "grid_line": QColor(80, 80, 80),
-                "title_text": QColor(121, 197, 255), # Lighter blue
-                "legend_text": QColor(240, 240, 240),
-                "export_button_bg": QColor(106, 115, 125),
-                "export_button_text": QColor(255, 255, 255),
-                "warning_text_color": QColor(255, 100, 100), # Red
-                "combo_bg": QColor("#4b4f52"),
-                "combo_text": QColor("#fdfdfd"),
-                "combo_border": QColor("#6c7072"),
-                "line_colors": {
-                    "Temperature_C": QColor(255, 100, 100),
-                    "Humidity_perc": QColor(100, 150, 255),
-                    "Ultrasonic_cm": QColor(100, 255, 100),
-                    "Sound_raw": QColor(255, 255, 100),
-                    "Light_raw": QColor(100, 255, 255),
-                    "Button_state": QColor(255, 100, 255),
-                    "RotaryAngle_raw": QColor(200, 200, 200)
-                }
-            },
-            "forest_green_theme": {
-                "plot_bg": QColor(34, 139, 34), # Forest Green
-                "axis_text": QColor(255, 255, 255),
-                "grid_line": QColor(76, 175, 80),
-                "title_text": QColor(165, 214, 167),
-                "legend_text": QColor(255, 255, 255),
-                "export_button_bg": QColor(102, 187, 106),
-                "export_button_text": QColor(255, 255, 255),
-                "warning_text_color": QColor(255, 120, 120), # Red
-                "combo_bg": QColor("#339933"),
-                "combo_text": QColor("#FFFFFF"),
-                "combo_border": QColor("#4CAF50"),
-                "line_colors": {
-                    "Temperature_C": QColor(255, 120, 120),
-                    "Humidity_perc": QColor(120, 120, 255),
-                    "Ultrasonic_cm": QColor(255, 255, 120),
-                    "Sound_raw": QColor(120, 255, 255),
-                    "Light_raw": QColor(255, 120, 255),
-                    "Button_state": QColor(255, 160, 120),
-                    "RotaryAngle_raw": QColor(200, 200, 200)
-                }
-            },
-            "warm_sepia_theme": {
-                "plot_bg": QColor(112, 66, 20), # Sepia Brown
-                "axis_text": QColor(245, 222, 179), # Wheat
-                "grid_line": QColor(139, 69, 19),
-                "title_text": QColor(222, 184, 135), # BurlyWood
-                "legend_text": QColor(245, 222, 179),
-                "export_button_bg": QColor(160, 82, 45),
-                "export_button_text": QColor(255, 255, 255),
-                "warning_text_color": QColor(205, 92, 92), # IndianRed
-                "combo_bg": QColor("#7C4F2A"),
-                "combo_text": QColor("#F5DEB3"),
-                "combo_border": QColor("#A0522D"),
-                "line_colors": {
-                    "Temperature_C": QColor(205, 92, 92), # IndianRed
-                    "Humidity_perc": QColor(100, 149, 237), # CornflowerBlue
-                    "Ultrasonic_cm": QColor(107, 142, 35), # OliveDrab
-                    "Sound_raw": QColor(255, 215, 0), # Gold
-                    "Light_raw": QColor(188, 143, 143), # RosyBrown
-                    "Button_state": QColor(210, 105, 30), # Chocolate
-                    "RotaryAngle_raw": QColor(240, 230, 140) # Khaki
-                }
-            },
-            "ocean_blue_theme": {
-                "plot_bg": QColor(0, 51, 102), # Dark Ocean Blue
-                "axis_text": QColor(224, 255, 255), # Light Cyan
-                "grid_line": QColor(0, 80, 153),
-                "title_text": QColor(135, 206, 250), # Light Sky Blue
-                "legend_text": QColor(224, 255, 255),
-                "export_button_bg": QColor(70, 130, 180),
-                "export_button_text": QColor(255, 255, 255),
-                "warning_text_color": QColor(255, 99, 71), # Tomato
-                "combo_bg": QColor("#004080"),
-                "combo_text": QColor("#E0FFFF"),
-                "combo_border": QColor("#005099"),
-                "line_colors": {
-                    "Temperature_C": QColor(255, 99, 71), # Tomato
-                    "Humidity_perc": QColor(100, 149, 237), # CornflowerBlue
-                    "Ultrasonic_cm": QColor(95, 158, 160), # CadetBlue
-                    "Sound_raw": QColor(255, 255, 0), # Yellow
-                    "Light_raw": QColor(0, 255, 255), # Cyan
-                    "Button_state": QColor(255, 0, 255), # Magenta
-                    "RotaryAngle_raw": QColor(255, 255, 255) # White
-                }
-            },
-            "vibrant_purple_theme": {
-                "plot_bg": QColor(75, 0, 130), # Indigo
-                "axis_text": QColor(230, 230, 250), # Lavender
-                "grid_line": QColor(106, 13, 173),
-                "title_text": QColor(221, 160, 221), # Plum
-                "legend_text": QColor(230, 230, 250),
-                "export_button_bg": QColor(138, 43, 226),
-                "export_button_text": QColor(255, 255, 255),
-                "warning_text_color": QColor(255, 69, 0), # OrangeRed
-                "combo_bg": QColor("#5F2A80"),
-                "combo_text": QColor("#E6E6FA"),
-                "combo_border": QColor("#8A2BE2"),
-                "line_colors": {
-                    "Temperature_C": QColor(255, 69, 0), # OrangeRed
-                    "Humidity_perc": QColor(123, 104, 238), # MediumSlateBlue
-                    "Ultrasonic_cm": QColor(0, 255, 127), # SpringGreen
-                    "Sound_raw": QColor(255, 255, 0), # Yellow
-                    "Light_raw": QColor(255, 99, 71), # Tomato
-                    "Button_state": QColor(255, 20, 147), # DeepPink
-                    "RotaryAngle_raw": QColor(255, 255, 255) # White
-                }
-            },
-            "light_modern_theme": {
-                "plot_bg": QColor(224, 224, 224), # Light Gray
-                "axis_text": QColor(51, 51, 51),
-                "grid_line": QColor(192, 192, 192),
-                "title_text": QColor(85, 85, 85),
-                "legend_text": QColor(51, 51, 51),
-                "export_button_bg": QColor(96, 125, 139),
-                "export_button_text": QColor(255, 255, 255),
-                "warning_text_color": QColor(239, 83, 80), # Red
-                "combo_bg": QColor("#FFFFFF"),
-                "combo_text": QColor("#333333"),
-                "combo_border": QColor("#C0C0C0"),
-                "line_colors": {
-                    "Temperature_C": QColor(239, 83, 80),  # Red
-                    "Humidity_perc": QColor(66, 165, 245),  # Blue
-                    "Ultrasonic_cm": QColor(102, 187, 106), # Green
-                    "Sound_raw": QColor(255, 213, 79),     # Amber
-                    "Light_raw": QColor(77, 182, 172),     # Teal
-                    "Button_state": QColor(171, 71, 188),  # Purple
-                    "RotaryAngle_raw": QColor(158, 158, 158) # Grey
-                }
-            },
-            "high_contrast_theme": {
-                "plot_bg": QColor(0, 0, 0), # Black
-                "axis_text": QColor(255, 255, 0), # Yellow
-                "grid_line": QColor(255, 0, 255), # Magenta
-                "title_text": QColor(0, 255, 255), # Cyan
-                "legend_text": QColor(255, 255, 0), # Yellow
-                "export_button_bg": QColor(255, 0, 255),
-                "export_button_text": QColor(0, 0, 0),
-                "combo_bg": QColor("#222222"),
-                "combo_text": QColor("#FFFF00"),
-                "combo_border": QColor("#FF00FF"),
-                "warning_text_color": QColor(255, 0, 0), # Red
-                "line_colors": {
-                    "Temperature_C": QColor(255, 0, 0),   # Red
-                    "Humidity_perc": QColor(0, 0, 255),   # Blue
-                    "Ultrasonic_cm": QColor(0, 255, 0),   # Green
-                    "Sound_raw": QColor(255, 255, 0),     # Yellow
-                    "Light_raw": QColor(0, 255, 255),     # Cyan
-                    "Button_state": QColor(255, 0, 255),  # Magenta
-                    "RotaryAngle_raw": QColor(255, 255, 255) # White
-                }
-            }
-        }
-
-        self.theme_palette = theme_palettes.get(current_theme, theme_palettes["dark_theme"]) # Fallback to dark
+        self.theme_palette = _THEME_PALETTES.get(current_theme, _THEME_PALETTES["dark_theme"]) # Fallback to dark
+        self._palette_theme = current_theme # Theme the attributes below were resolved for
+        self._hex = _THEME_HEX.get(current_theme, _THEME_HEX["dark_theme"]) # Color names, for APIs taking strings
 
         # Assign colors to instance variables for easy access
         self.plot_bg_color = self.theme_palette["plot_bg"]
@@ -312,6 +506,26 @@ class PlotsTab(QWidget):
         self.combo_text_color = self.theme_palette["combo_text"] # For combo box text
         self.combo_border_color = self.theme_palette["combo_border"] # For combo box border
 
+        # Pens depend only on the theme, so look them up here once rather than on every plot
+        self._line_pens = {key: self._pen(self.line_colors.get(key, QColor(255, 255, 255)), 2) # Default to white if not in theme map
+                           for key in self.SENSOR_COLUMNS.keys()}
+        self._axis_pen = self._pen(self.axis_text_color)
+
+    @staticmethod
+    def _pen(color, width=1):
+        """
+        Returns the pen for a color and width, shared by all instances and created on first
+        use, so switching themes does not rebuild pens for colors already seen.
+
+        :param color: QColor of the pen.
+        :param width: Pen width in pixels.
+        """
+        key = (color.rgba(), width)
+        pen = PlotsTab._shared_pens.get(key)
+        if pen is None:
+            pen = PlotsTab._shared_pens[key] = pg.mkPen(color, width=width)
+        return pen
+
 
     def _setup_ui(self):
         """Sets up the UI elements for the plots tab."""
@@ -340,7 +554,7 @@ class PlotsTab(QWidget):
             checkbox = QCheckBox(name)
             checkbox.setFont(QFont("Inter", 10))
             checkbox.setChecked(True) # Default to all selected
-            checkbox.stateChanged.connect(self._update_plot)
+            checkbox.stateChanged.connect(functools.partial(self._toggle_sensor, key))
             self.sensor_checkboxes[key] = checkbox
             sensor_group_layout.addWidget(checkbox)
         controls_layout.addWidget(sensor_group_frame)
@@ -374,10 +588,10 @@ class PlotsTab(QWidget):
         load_button.clicked.connect(self._load_data_from_csv)
         data_controls_layout.addWidget(load_button)
 
-        export_button = QPushButton("Export Current View")
-        export_button.setFont(QFont("Inter", 10, QFont.Bold))
-        export_button.clicked.connect(self._export_plot_view)
-        data_controls_layout.addWidget(export_button)
+        self.export_button = QPushButton("Export Current View")
+        self.export_button.setFont(QFont("Inter", 10, QFont.Bold))
+        self.export_button.clicked.connect(self._export_plot_view)
+        data_controls_layout.addWidget(self.export_button)
         data_controls_layout.addStretch(1)
         controls_layout.addWidget(data_controls_group_frame)
         
@@ -387,22 +601,29 @@ class PlotsTab(QWidget):
 
         # Plot Widget
         self.plot_widget = pg.PlotWidget()
-        self.plot_widget.setBackground(self.plot_bg_color.name()) # Use themed background
+        self.plot_widget.setBackground(self._hex["plot_bg"]) # Use themed background
         self.plot_widget.showGrid(x=True, y=True, alpha=0.5)
-        self.plot_widget.addLegend()
+        self._legend = self.plot_widget.addLegend() # Kept so theme changes can recolor it in place
         self.plot_widget.getAxis('bottom').setLabel('Time')
         
-        # Set custom TimeAxisItem for bottom axis
+        # Set custom TimeAxisItem for bottom axis (its module imports pyqtgraph, hence imported here)
+        from ui.time_axis_item import TimeAxisItem
         self.plot_widget.setAxisItems({'bottom': TimeAxisItem(orientation='bottom')})
+        if self._cache_curves:
+            # The axes (tick labels and grid lines) only change with the view range, so cache
+            # them like the lines; repaints of a line then blit them instead of redrawing
+            for axis_name in ('left', 'bottom'):
+                self.plot_widget.getAxis(axis_name).setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
         self.main_layout.addWidget(self.plot_widget)
 
         # Data Table (Optional - for raw data display)
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(len(self.SENSOR_COLUMNS) + 1) # Timestamp + sensors
-        self.data_table.setHorizontalHeaderLabels(["Timestamp"] + list(self.SENSOR_COLUMNS.values()))
+        # A view over a model that reads self.data directly, so cells only exist while visible
+        self.data_table = QTableView()
+        self._table_model = _SensorTableModel(self.SENSOR_COLUMNS, self.data_table)
+        self.data_table.setModel(self._table_model)
         self.data_table.verticalHeader().setVisible(False) # Hide row numbers
-        self.data_table.setEditTriggers(QTableWidget.NoEditTriggers) # Make table read-only
+        self.data_table.setEditTriggers(QTableView.NoEditTriggers) # Make table read-only
         self.data_table.setAlternatingRowColors(True) # Visual improvement
         self.data_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.MinimumExpanding)
         self.data_table.hide() # Hidden by default, can be shown by a button if needed
@@ -411,7 +632,90 @@ class PlotsTab(QWidget):
 
         # Initialize plot with existing data if available (e.g., from sensor_readings.csv)
         self._load_initial_data()
-        self._update_plot()
+        self._do_update_plot() # Draw now rather than after the debounce delay
+
+    def _read_sensor_file(self, csv_path, use_cache=True):
+        """
+        Reads a sensor log CSV into a DataFrame with a datetime64 "Timestamp" column.
+        A parquet copy is kept in the plot cache directory (see _sensor_cache_paths), keyed
+        on the CSV's size and modification time, and read instead while the key matches,
+        which skips CSV parsing and date conversion entirely; otherwise the CSV is parsed
+        and the copy refreshed.
+
+        :param csv_path: Path to the CSV file.
+        :param use_cache: False to neither read nor write the parquet copy, e.g. for the
+                          live log, which changes between almost every load.
+        :return: The loaded DataFrame, or None if the CSV has no "Timestamp" column.
+        """
+        source_key = None
+        if PARQUET_AVAILABLE and use_cache:
+            cache_file, key_file = self._sensor_cache_paths(csv_path)
+            stat = os.stat(csv_path) # Taken before parsing, so a later append invalidates the copy
+            source_key = "{} {}".format(stat.st_size, stat.st_mtime_ns)
+            try:
+                with open(key_file, "r") as f:
+                    cached_key = f.read()
+                if cached_key == source_key:
+                    data = pd.read_parquet(cache_file)
+                    self.logger.debug("Loaded sensor data from cache {}".format(cache_file))
+                    return data
+            except (IOError, OSError):
+                pass # No copy cached yet
+            except Exception as e:
+                self.logger.warning("Ignoring unreadable sensor data cache {}: {}".format(cache_file, e))
+
+        read_kwargs = {"dtype": _CSV_DTYPES}
+        if PYARROW_AVAILABLE:
+            read_kwargs["engine"] = "pyarrow" # Multithreaded parser, also types the Timestamp column
+        try:
+            data = pd.read_csv(csv_path, **read_kwargs)
+        except ValueError: # e.g. blank cells in an integer column; read without the schema
+            data = pd.read_csv(csv_path)
+        if "Timestamp" not in data.columns:
+            return None
+        data["Timestamp"] = pd.to_datetime(data["Timestamp"])
+
+        if source_key is not None:
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                if os.path.exists(key_file):
+                    os.remove(key_file) # Invalidate the old copy while it is rewritten
+                data.to_parquet(cache_file, index=False)
+                with open(key_file, "w") as f:
+                    f.write(source_key)
+            except Exception as e: # e.g. read-only directory; the CSV is still usable
+                self.logger.warning("Could not write sensor data cache {}: {}".format(cache_file, e))
+        return data
+
+    def _sensor_cache_paths(self, csv_path):
+        """
+        Returns the (parquet file, key file) paths caching csv_path. They live in the app's
+        "plot_cache_directory", named by a hash of the CSV's absolute path, so CSVs loaded
+        from anywhere never get files written beside them.
+
+        :param csv_path: Path to the CSV file.
+        """
+        cache_dir = os.path.join(project_root, self.config.get_setting("plot_cache_directory", "Plot_Cache"))
+        name = hashlib.sha1(os.path.abspath(csv_path).encode("utf-8")).hexdigest()[:16]
+        base = os.path.join(cache_dir, name)
+        return base + ".parquet", base + ".key"
+
+    def _set_data(self, data):
+        """
+        Replaces the plotted data. Rows are sorted by Timestamp so time ranges can be
+        located with a binary search (see _do_update_plot) instead of boolean masks.
+
+        :param data: DataFrame with a datetime64 "Timestamp" column (may be empty).
+        """
+        if data.empty:
+            self.data = data
+            self._ts_ns = np.empty(0, dtype=np.int64)
+            self._ts_s = np.empty(0, dtype=np.float64)
+            return
+        self.data = data.sort_values("Timestamp", kind="stable").reset_index(drop=True)
+        self._ts_ns = np.asarray(self.data["Timestamp"], dtype="datetime64[ns]").view("int64")
+        # Converted once per load, so each redraw just slices it
+        self._ts_s = self._ts_ns / 1e9
 
     def _load_initial_data(self):
         """Loads data from the default sensor_readings.csv if it exists."""
@@ -421,15 +725,20 @@ class PlotsTab(QWidget):
 
         if os.path.exists(default_log_file):
             try:
-                self.data = pd.read_csv(default_log_file)
-                self.data["Timestamp"] = pd.to_datetime(self.data["Timestamp"])
+                # While sensor logging is on this is the live log, appended to on every read
+                # cycle; a parquet copy would be stale by the next load, so don't keep one
+                live_log = self.config.get_setting("enable_sensor_logging", True)
+                loaded_data = self._read_sensor_file(default_log_file, use_cache=not live_log)
+                if loaded_data is None:
+                    raise ValueError("missing 'Timestamp' column")
+                self._set_data(loaded_data)
                 self.logger.info("Loaded initial data from {}".format(default_log_file))
             except Exception as e:
                 self.logger.error("Error loading initial CSV data: {}".format(e))
-                self.data = pd.DataFrame() # Ensure data is empty if load fails
+                self._set_data(pd.DataFrame()) # Ensure data is empty if load fails
         else:
             self.logger.info("No default sensor data CSV found at {}".format(default_log_file))
-            self.data = pd.DataFrame(columns=["Timestamp"] + list(self.SENSOR_COLUMNS.keys())) # Create empty DataFrame with columns
+            self._set_data(pd.DataFrame(columns=["Timestamp"] + list(self.SENSOR_COLUMNS.keys()))) # Create empty DataFrame with columns
 
     def _load_data_from_csv(self):
         """Opens a file dialog to load sensor data from a CSV file."""
@@ -441,15 +750,14 @@ class PlotsTab(QWidget):
             if selected_files:
                 file_path = selected_files[0]
                 try:
-                    loaded_data = pd.read_csv(file_path)
-                    # Basic validation: check for 'Timestamp' column and at least one sensor column
-                    if "Timestamp" not in loaded_data.columns:
+                    # Parses Timestamp to datetime objects (or reuses the parquet cache)
+                    loaded_data = self._read_sensor_file(file_path)
+                    # Basic validation: check for 'Timestamp' column
+                    if loaded_data is None:
                         QMessageBox.warning(self, "Error", "Selected CSV must contain a 'Timestamp' column.")
                         return
 
-                    # Convert Timestamp to datetime objects
-                    loaded_data["Timestamp"] = pd.to_datetime(loaded_data["Timestamp"])
-                    self.data = loaded_data
+                    self._set_data(loaded_data)
                     self.logger.info("Successfully loaded data from: {}".format(file_path))
                     self._update_plot() # Redraw plot with new data
                     self._populate_data_table() # Update table as well
@@ -458,64 +766,54 @@ class PlotsTab(QWidget):
                     QMessageBox.critical(self, "Error", "Failed to load CSV data.\nError: {}".format(e))
 
     def _populate_data_table(self):
-        """Populates the QTableWidget with the loaded sensor data."""
+        """Points the data table at the loaded sensor data."""
+        self._table_model.set_data_frame(self.data)
         if self.data.empty:
-            self.data_table.setRowCount(0)
             return
 
-        self.data_table.setRowCount(len(self.data))
-        # Set column headers dynamically based on SENSOR_COLUMNS
-        headers = ["Timestamp"] + [self.SENSOR_COLUMNS[col] for col in self.SENSOR_COLUMNS.keys()]
-        self.data_table.setColumnCount(len(headers))
-        self.data_table.setHorizontalHeaderLabels(headers)
-
-        for row_idx, (index, row_data) in enumerate(self.data.iterrows()):
-            # Format timestamp for display
-            timestamp_str = row_data["Timestamp"].strftime("%Y-%m-%d %H:%M:%S")
-            self.data_table.setItem(row_idx, 0, QTableWidgetItem(timestamp_str))
-
-            col_offset = 1 # Start from second column for sensor data
-            for sensor_key in self.SENSOR_COLUMNS.keys():
-                if sensor_key in row_data:
-                    item_value = str(row_data[sensor_key])
-                    self.data_table.setItem(row_idx, col_offset, QTableWidgetItem(item_value))
-                else:
-                    self.data_table.setItem(row_idx, col_offset, QTableWidgetItem("N/A"))
-                col_offset += 1
-        
         self.data_table.resizeColumnsToContents()
 
     def _update_plot(self):
         """
-        Updates the plot based on selected sensors and time range.
+        Schedules a plot update. Requests arriving within 50 ms of each other (e.g. scrolling
+        through the time range combo) restart the timer, so only the last one redraws.
         """
-        if self.data.empty:
-            self.plot_widget.clear()
-            self.plot_widget.setTitle(self.original_plot_title, color=self.title_text_color.name())
-            self.plot_widget.setLabel('left', "Value")
-            return
+        self._update_timer.start()
 
+    def _do_update_plot(self):
+        """
+        Updates the plot based on selected sensors and time range.
+        """
         # Clear existing plot items but keep the background and grid settings
         self.plot_widget.clear()
         self.current_plot_items.clear() # Clear stored plot items
+        self._plot_cache.clear()
+        self._last_pen_colors.clear()
+        self._view_x = self._view_slice = None
 
-        # Apply theme colors again, in case the theme changed after data was loaded
-        self._set_theme_colors()
-        self._apply_theme_colors_to_plot()
+        if self.data.empty:
+            self.plot_widget.setTitle(self.original_plot_title, color=self._hex["title_text"])
+            self.plot_widget.setLabel('left', "Value")
+            return
 
         # Filter data by time range
         selected_range_text = self.time_range_combo.currentText()
         time_delta = self.TIME_RANGES.get(selected_range_text)
 
-        display_data = self.data.copy()
+        lo, hi = 0, len(self.data) # "All Data"
         if time_delta is not None:
-            end_time = datetime.now()
-            start_time = end_time - time_delta
-            display_data = display_data[(display_data["Timestamp"] >= start_time) & 
-                                        (display_data["Timestamp"] <= end_time)]
+            # Bounds as int64 ns, the same units as self._ts_ns, so nothing is coerced per element.
+            # The log stores naive local times, hence datetime.now() rather than a UTC clock
+            # such as np.datetime64("now").
+            end_ns = np.datetime64(datetime.now(), "ns").astype(np.int64)
+            start_ns = end_ns - np.int64(time_delta // timedelta(microseconds=1)) * 1000
+            # Rows are sorted by time, so the range is one contiguous slice found by binary search.
+            # Both bounds are looked up in one call; with integer ns, "left of end_ns + 1" is the
+            # same as "right of end_ns", so the end stays inclusive.
+            lo, hi = np.searchsorted(self._ts_ns, np.array([start_ns, end_ns + 1], dtype=np.int64), side="left")
         
-        if display_data.empty:
-            self.plot_widget.setTitle("No data for selected time range.", color=self.warning_text_color.name())
+        if hi <= lo:
+            self.plot_widget.setTitle("No data for selected time range.", color=self._hex["warning_text_color"])
             self.plot_widget.setLabel('left', "Value")
             return
 
@@ -525,46 +823,95 @@ class PlotsTab(QWidget):
         # However, since we're using a custom TimeAxisItem, we can directly pass timestamps.
         # Let's verify how TimeAxisItem expects `values` in tickStrings. It uses `fromtimestamp`.
         # So, converting to timestamp (seconds since epoch) is indeed the correct approach.
-        x_values = display_data["Timestamp"].apply(lambda x: x.timestamp()).values
+        # A view of the epoch seconds computed at load (see _set_data)
+        self._view_x = self._ts_s[lo:hi]
+        # Sensor columns are only read when plotted (see _show_sensor), so columns of
+        # unchecked sensors are never touched
+        self._view_slice = slice(lo, hi)
 
         # Plot selected sensors
-        for key, name in self.SENSOR_COLUMNS.items():
-            if self.sensor_checkboxes[key].isChecked() and key in display_data.columns:
-                line_color = self.line_colors.get(key, QColor(255, 255, 255)) # Default to white if not in theme map
-                
-                # Create a PlotDataItem and store it
-                plot_item = self.plot_widget.plot(
-                    x_values, display_data[key].values,
-                    pen=pg.mkPen(line_color, width=2),
-                    name=name
-                )
-                self.current_plot_items[key] = plot_item
+        for key in self.SENSOR_COLUMNS.keys():
+            if self.sensor_checkboxes[key].isChecked():
+                self._show_sensor(key)
 
         # Set labels and title with themed colors
         self.plot_widget.getAxis('left').setLabel('Sensor Value')
-        self.plot_widget.getAxis('left').setTextPen(self.axis_text_color)
-        self.plot_widget.getAxis('bottom').setTextPen(self.axis_text_color)
-        self.plot_widget.getAxis('left').setPen(self.axis_text_color)
-        self.plot_widget.getAxis('bottom').setPen(self.axis_text_color)
+        self.plot_widget.getAxis('left').setTextPen(self._axis_pen)
+        self.plot_widget.getAxis('bottom').setTextPen(self._axis_pen)
+        self.plot_widget.getAxis('left').setPen(self._axis_pen)
+        self.plot_widget.getAxis('bottom').setPen(self._axis_pen)
 
-        self.plot_widget.setTitle(self.original_plot_title, color=self.title_text_color.name())
+        self.plot_widget.setTitle(self.original_plot_title, color=self._hex["title_text"])
 
 
+    def _show_sensor(self, key):
+        """
+        Adds the plot item for one sensor in the current time range, building it on first use.
+
+        :param key: Sensor column name (a SENSOR_COLUMNS key).
+        """
+        plot_item = self._plot_cache.get(key)
+        if plot_item is None:
+            if self._view_slice is None or key not in self.data.columns:
+                return # Nothing plotted, or this sensor isn't in the loaded data
+
+            # More than ~2 points per horizontal pixel can't be seen, so long ranges are reduced
+            # to a min/max envelope of about that size before pyqtgraph builds the line path
+            n_buckets = max(self.plot_widget.width() * 2, 2000) // 2
+            # float32 is plenty at pixel resolution and halves the bytes pyqtgraph reads. x stays
+            # float64: epoch seconds (~1.7e9) would lose whole minutes in float32.
+            # Project just this sensor's column and take the time range as a view of it, then
+            # get a float32 NumPy array whatever the column's backing (NumPy, Arrow, masked);
+            # np.asarray rather than to_numpy(na_value=...), which needs pandas 1.0 (Python 3.6+)
+            y_values = np.asarray(self.data[key].iloc[self._view_slice], dtype=np.float32)
+            x_plot, y_plot = minmax_downsample(self._view_x, y_values, n_buckets)
+
+            # Create a PlotDataItem and store it
+            plot_item = pg.PlotDataItem(
+                x_plot, y_plot,
+                pen=self._line_pens[key],
+                name=self.SENSOR_COLUMNS[key]
+            )
+            if self._cache_curves:
+                plot_item.curve.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+            self._plot_cache[key] = plot_item
+            self._last_pen_colors[key] = self._line_pens[key].color()
+        self.plot_widget.addItem(plot_item)
+        self.current_plot_items[key] = plot_item
+
+    def _toggle_sensor(self, key, state):
+        """
+        Shows or hides one sensor's line when its checkbox changes, reusing the
+        already-built plot item rather than replotting everything.
+
+        :param key: Sensor column name (a SENSOR_COLUMNS key).
+        :param state: The checkbox's new Qt.CheckState.
+        """
+        if state == Qt.Checked:
+            if key not in self.current_plot_items:
+                self._show_sensor(key)
+        else:
+            plot_item = self.current_plot_items.pop(key, None)
+            if plot_item is not None:
+                self.plot_widget.removeItem(plot_item)
+
     def _apply_theme_colors_to_plot(self):
         """
         Applies the currently selected theme's colors to the pyqtgraph plot.
         This method should be called whenever the theme changes.
         """
+        if not self._ui_built:
+            return # Themed when built
         self._set_theme_colors() # Re-fetch current theme colors
 
         # Update plot background
-        self.plot_widget.setBackground(self.plot_bg_color.name())
+        self.plot_widget.setBackground(self._hex["plot_bg"])
 
         # Update axis text and line colors
-        self.plot_widget.getAxis('left').setTextPen(self.axis_text_color)
-        self.plot_widget.getAxis('bottom').setTextPen(self.axis_text_color)
-        self.plot_widget.getAxis('left').setPen(self.axis_text_color)
-        self.plot_widget.getAxis('bottom').setPen(self.axis_text_color)
+        self.plot_widget.getAxis('left').setTextPen(self._axis_pen)
+        self.plot_widget.getAxis('bottom').setTextPen(self._axis_pen)
+        self.plot_widget.getAxis('left').setPen(self._axis_pen)
+        self.plot_widget.getAxis('bottom').setPen(self._axis_pen)
 
         # Update grid line colors (need to redraw grid)
         # PyQtGraph's showGrid typically sets default colors. To update, we might need to
@@ -579,156 +926,204 @@ class PlotsTab(QWidget):
         # Update plot title color
         # The PlotWidget's setTitle method accepts a 'color' argument.
         # We use self.original_plot_title to set the title with the new color.
-        self.plot_widget.setTitle(self.original_plot_title, color=self.title_text_color.name())
+        self.plot_widget.setTitle(self.original_plot_title, color=self._hex["title_text"])
 
 
-        # Update legend text color
-        # Accessing the legend requires accessing the PlotItem's legend object
-        legend = self.plot_widget.addLegend() # This might add a new one if not careful, better to get existing
-        # A more robust way to get the existing legend is to iterate plot items or have a reference
-        # For simplicity, if we re-add legend every time, it might lead to duplicates.
-        # Better to access the existing legend directly if possible.
-        # For now, we will simply modify the style that *applies* to labels within the legend.
-        # Or, we can iterate through the existing plot items and update their names/colors in the legend.
-        
-        # This will iterate through existing plot items and update their line colors and legend names
-        for key, plot_item in self.current_plot_items.items():
-            line_color = self.line_colors.get(key, QColor(255, 255, 255))
-            plot_item.setPen(pg.mkPen(line_color, width=2))
-            # The legend automatically updates if the plot item's name is set.
-            # To specifically color the legend text, we'd need to access the QLabel elements
-            # within the legend layout, which is more complex.
-            # PyQtGraph's legend items are usually LabelItem objects.
-            # A simpler workaround is to ensure the QSS for QLabel affects them.
-            # Or, for explicit control, you can create a custom legend.
-            # Let's set a global QSS for QLabel that affects legend items.
-            # This is already handled by the main window's QSS.
-            pass # No direct change to legend item color here, relies on global QSS.
+        # Update legend text color on the legend created in _setup_ui (calling addLegend()
+        # again would stack a new legend on top of it)
+        self._legend.setLabelTextColor(self.legend_text_color)
+
+        # Recolor the existing plot items in place; their data and paths are left untouched
+        # Includes hidden cached items, so they have the right colors when shown again
+        for key, plot_item in self._plot_cache.items():
+            self._set_pen_if_changed(key, plot_item)
+
+    def _set_pen_if_changed(self, key, plot_item):
+        """
+        Gives a plot item the current theme's pen for its sensor. Most themes share line
+        colors, and setPen repaints the curve and its legend sample even when nothing changed,
+        so items already drawn in the pen's color are left alone.
+
+        :param key: Sensor column name (a SENSOR_COLUMNS key).
+        :param plot_item: The sensor's PlotDataItem.
+        """
+        pen = self._line_pens[key]
+        color = pen.color()
+        if self._last_pen_colors.get(key) == color:
+            return
+        plot_item.setPen(pen) # The legend sample follows the pen
+        self._last_pen_colors[key] = color
 
 
     def _export_plot_view(self):
-        """Exports the current plot view to a PNG image."""
+        """
+        Exports the current plot view to a PNG or JPEG image. The view is grabbed from the
+        widget's own rendering here (pixmaps are GUI-thread only); encoding and writing the
+        file run on the global thread pool and finish in _on_export_finished.
+        """
         file_dialog = QFileDialog(self)
         file_dialog.setAcceptMode(QFileDialog.AcceptSave)
-        file_dialog.setNameFilter("PNG image (*.png)")
+        file_dialog.setNameFilters(["PNG image (*.png)", "JPEG image (*.jpg *.jpeg)"])
         file_dialog.setDefaultSuffix("png")
+        file_dialog.filterSelected.connect(
+            lambda name_filter: file_dialog.setDefaultSuffix("jpg" if "*.jpg" in name_filter else "png"))
 
         if file_dialog.exec_():
             file_path = file_dialog.selectedFiles()[0]
-            exporter = pg.exporters.ImageExporter(self.plot_widget.plotItem)
-            exporter.export(file_path)
-            self.logger.info("Plot exported to: {}".format(file_path))
-            QMessageBox.information(self, "Export Successful", "Plot saved to:\n{}".format(file_path))
+            if file_path.lower().endswith((".jpg", ".jpeg")):
+                file_format, quality = "JPEG", _JPEG_SAVE_QUALITY
+            else:
+                file_format, quality = "PNG", _PNG_SAVE_QUALITY
+            image = self.plot_widget.grab().toImage() # QImage, which may be saved from another thread
+
+            self.export_button.setEnabled(False) # One export in flight at a time
+            QApplication.setOverrideCursor(Qt.BusyCursor)
+            self._export_task = _ImageSaveTask(image, file_path, file_format, quality)
+            self._export_task.signals.finished.connect(self._on_export_finished)
+            QThreadPool.globalInstance().start(self._export_task)
+
+    def _on_export_finished(self, file_path, ok):
+        """Reports the result of a background export started by _export_plot_view."""
+        self._export_task = None
+        QApplication.restoreOverrideCursor()
+        self.export_button.setEnabled(True)
+        if not ok:
+            self.logger.error("Failed to write plot image: {}".format(file_path))
+            QMessageBox.critical(self, "Error", "Failed to save plot to:\n{}".format(file_path))
+            return
+        self.logger.info("Plot exported to: {}".format(file_path))
+        QMessageBox.information(self, "Export Successful", "Plot saved to:\n{}".format(file_path))
 
 
+    def apply_theme(self):
+        """
+        Re-applies the current theme: the plot colors, then the tab stylesheet built from them.
+        Called by MainWindow._apply_theme.
+        """
+        self._apply_theme_colors_to_plot()
+        self.set_style()
+
     def set_style(self):
-        """Applies specific styling for the plots tab."""
-        self.setStyleSheet("""
-            QWidget#PlotsTab {
-                background-color: transparent;
-            }
-            QFrame#groupFrame {
-                border: 1px solid #555;
-                border-radius: 10px;
-                background-color: rgba(40, 40, 40, 0.7);
-                margin: 5px;
-                padding: 10px;
-            }
-            QLabel {
-                color: #EEE; /* Default text color */
-            }
-            QLabel:hover {
-                color: #FFD700;
-            }
-            QCheckBox {
-                color: #EEE;
-            }
-            QComboBox {
-                background-color: %s; /* Dynamic background from theme_palette */
-                color: %s; /* Dynamic text color from theme_palette */
-                border: 1px solid %s; /* Dynamic border color from theme_palette */
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QComboBox::drop-down {
-                border: 0px;
-            }
-            QComboBox::down-arrow {
-                image: url(icons/arrow_down_light.png);
-                width: 16px;
-                height: 16px;
-            }
-            QComboBox QAbstractItemView { /* Style for the dropdown list */
-                background-color: %s; /* Same as combo box background */
-                color: %s; /* Same as combo box text color */
-                selection-background-color: %s; /* Highlight color */
-                selection-color: %s; /* Highlighted text color */
-                border: 1px solid %s; /* Border for the dropdown */
-            }
-            QPushButton {
-                background-color: #4CAF50; /* Green */
-                color: white;
-                border-radius: 5px;
-                padding: 5px 10px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            /* Table Widget Styling */
-            QTableWidget {
-                background-color: #282c34;
-                alternate-background-color: #21252b;
-                color: #abb2bf;
-                border: 1px solid #444;
-                gridline-color: #555;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QHeaderView::section {
-                background-color: #3a3f4b;
-                color: #abb2bf;
-                padding: 5px;
-                border: 1px solid #444;
-            }
-            QTableWidget::item:selected {
-                background-color: #61afef;
-                color: white;
-            }
-        """ % (
-            self.combo_bg_color.name(),
-            self.combo_text_color.name(),
-            self.combo_border_color.name(),
-            self.combo_bg_color.name(), # Dropdown background
-            self.combo_text_color.name(), # Dropdown text
-            self.theme_palette["export_button_bg"].name(), # Using export button color for selection
-            self.theme_palette["export_button_text"].name(), # Using export button text for selection
-            self.combo_border_color.name() # Dropdown border
-        ))
-
-
-class TimeAxisItem(pg.AxisItem):
+        """
+        Applies the theme-dependent styling for the plots tab: the time range combo box's
+        stylesheet. The rest of the tab's styling is static (_STATIC_QSS).
+        """
+        if not self._ui_built:
+            return # Styled when built
+        # Rendered once per theme and shared by all instances
+        qss = PlotsTab._shared_qss.get(self._palette_theme)
+        if qss is None:
+            qss = _COMBO_QSS_TEMPLATE.format_map({
+                "combo_bg": self._hex["combo_bg"],
+                "combo_text": self._hex["combo_text"],
+                "combo_border": self._hex["combo_border"],
+                "selection_bg": self._hex["export_button_bg"], # Using export button color for selection
+                "selection_text": self._hex["export_button_text"] # Using export button text for selection
+            })
+            PlotsTab._shared_qss[self._palette_theme] = qss
+        # setStyleSheet re-parses the sheet and re-polishes the widget, so skip it when the
+        # resolved stylesheet is the one already applied
+        if qss == self._applied_qss:
+            return
+        self.time_range_combo.setStyleSheet(qss)
+        self._applied_qss = qss
+
+
+class _SensorTableModel(QAbstractTableModel):
     """
-    Custom AxisItem for displaying timestamps on the x-axis.
+    Read-only table model over a sensor DataFrame: a Timestamp column followed by one
+    column per sensor. Cell text is produced on demand, so only the rows Qt actually
+    displays are ever formatted.
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    _BLOCK_ROWS = 256 # Rows formatted together, in one vectorized call per column
 
-    def tickStrings(self, values, scale, spacing):
+    def __init__(self, sensor_columns, parent=None):
         """
-        Return the strings that should be placed beside each tick mark.
+        :param sensor_columns: Ordered mapping of sensor column name -> header text.
+        :param parent: Parent QObject.
         """
-        strings = []
-        for val in values:
-            try:
-                # Convert timestamp (seconds since epoch) to datetime object
-                dt_object = datetime.fromtimestamp(val)
-                # Format based on the range (e.g., show date for longer ranges)
-                if self.range[1] - self.range[0] > (2 * 24 * 3600): # More than 2 days
-                    strings.append(dt_object.strftime('%Y-%m-%d\n%H:%M'))
-                else:
-                    strings.append(dt_object.strftime('%H:%M:%S'))
-            except (ValueError, OSError): # Handle cases where timestamp might be out of range
-                strings.append('') # Append empty string for invalid values
-        return strings
+        super(_SensorTableModel, self).__init__(parent)
+        self._sensor_keys = list(sensor_columns.keys())
+        self._headers = ["Timestamp"] + list(sensor_columns.values())
+        self._row_count = 0
+        self._timestamps = None
+        self._columns = [] # One array per sensor column, or None if missing from the data
+        self._text_blocks = {} # (column, block index) -> array of cell strings for that block
+
+    def set_data_frame(self, data):
+        """
+        Replaces the displayed data.
 
+        :param data: DataFrame with a datetime64 "Timestamp" column (may be empty).
+        """
+        self.beginResetModel()
+        if data.empty:
+            self._row_count = 0
+            self._timestamps = None
+            self._columns = []
+        else:
+            self._row_count = len(data)
+            self._timestamps = np.asarray(data["Timestamp"])
+            self._columns = [np.asarray(data[key]) if key in data.columns else None for key in self._sensor_keys]
+        self._text_blocks = {}
+        self.endResetModel()
+
+    def _cell_text(self, row, column):
+        """
+        Returns the display string for one cell, formatting the _BLOCK_ROWS rows around it
+        in a single NumPy call the first time any of them is needed.
+        """
+        block = row // self._BLOCK_ROWS
+        texts = self._text_blocks.get((column, block))
+        if texts is None:
+            start = block * self._BLOCK_ROWS
+            stop = start + self._BLOCK_ROWS
+            if column == 0:
+                # Format timestamps for display ("YYYY-MM-DD HH:MM:SS")
+                texts = np.char.replace(np.datetime_as_string(self._timestamps[start:stop], unit="s"), "T", " ")
+            else:
+                texts = self._columns[column - 1][start:stop].astype(str)
+            self._text_blocks[(column, block)] = texts
+        return str(texts[row - block * self._BLOCK_ROWS])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        column = index.column()
+        if column > 0 and self._columns[column - 1] is None:
+            return "N/A"
+        return self._cell_text(index.row(), column)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+
+class _ImageSaveSignals(QObject):
+    """Signals for _ImageSaveTask; QRunnable is not a QObject and cannot define its own."""
+    finished = pyqtSignal(str, bool) # (file path, whether the write succeeded)
+
+
+class _ImageSaveTask(QRunnable):
+    """
+    Writes an already rendered QImage to disk on a QThreadPool thread, so the PNG encode
+    and file write do not block the GUI.
+    """
+    def __init__(self, image, file_path, file_format, quality):
+        super(_ImageSaveTask, self).__init__()
+        self.image = image
+        self.file_path = file_path
+        self.file_format = file_format
+        self.quality = quality
+        self.signals = _ImageSaveSignals()
+
+    def run(self):
+        ok = self.image.save(self.file_path, self.file_format, self.quality)
+        self.signals.finished.emit(self.file_path, ok) # Queued to the GUI thread
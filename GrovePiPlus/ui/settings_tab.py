@@ -2,7 +2,7 @@
 import os
 import sys
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QGroupBox, QFormLayout, QCheckBox, QLineEdit, QPushButton, QHBoxLayout, QFileDialog, QMessageBox, QScrollArea, QSizePolicy
-from PyQt5.QtCore import Qt, pyqtSignal # Import pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal # Import pyqtSignal
 from PyQt5.QtGui import QFont, QColor
 
 # Ensure SensorApp root is in path for imports
@@ -15,6 +15,337 @@ from utils.logger import Logger
 from utils.config_manager import ConfigManager
 from utils.storage_monitor import StorageMonitor
 
+# Color palettes for the various themes, built once at import
+_THEME_PALETTES = {
+    "dark_theme": {
+        "normal_text": QColor("#abb2bf"), # Light gray
+        "warning_text": QColor("#FF4500"), # OrangeRed
+        "success_text": QColor("#7CFC00"), # LimeGreen
+        "group_box_border": QColor("#555"),
+        "group_box_bg": QColor("rgba(40, 40, 40, 0.7)"),
+        "group_box_title": QColor("#61afef"), # Blue for titles
+        "checkbox_color": QColor("#EEE"),
+        "checkbox_indicator_unchecked_bg": QColor("#444444"), # Dark gray for unchecked
+        "checkbox_indicator_checked_bg": QColor("#61afef"),   # Blue for checked
+        "checkbox_indicator_border": QColor("#777777"),    # Medium gray border
+        "line_edit_bg": QColor("#333"),
+        "line_edit_text": QColor("#EEE"),
+        "line_edit_border": QColor("#666"),
+        "button_bg": QColor("#1E90FF"), # DodgerBlue
+        "button_hover_bg": QColor("#1C86EE"),
+        "button_text": QColor("white"),
+        "scrollbar_trough": QColor("#333"), # Dark gray for scrollbar trough
+        "scrollbar_handle": QColor("#61afef"), # Blue for scrollbar handle
+        "scrollbar_button": QColor("#1E90FF"), # DodgerBlue for scrollbar buttons
+    },
+    "light_theme": {
+        "normal_text": QColor("#333333"),
+        "warning_text": QColor("#FF4500"),
+        "success_text": QColor("#28A745"), # Green
+        "group_box_border": QColor("#ccc"),
+        "group_box_bg": QColor("rgba(255, 255, 255, 0.9)"),
+        "group_box_title": QColor("#007bff"),
+        "checkbox_color": QColor("#333333"),
+        "checkbox_indicator_unchecked_bg": QColor("#E0E0E0"), # Light gray for unchecked
+        "checkbox_indicator_checked_bg": QColor("#007bff"),   # Blue for checked
+        "checkbox_indicator_border": QColor("#AAAAAA"),    # Medium gray border
+        "line_edit_bg": QColor("#f8f8f8"),
+        "line_edit_text": QColor("#333"),
+        "line_edit_border": QColor("#ccc"),
+        "button_bg": QColor("#007bff"),
+        "button_hover_bg": QColor("#0056b3"),
+        "button_text": QColor("white"),
+        "scrollbar_trough": QColor("#f0f0f0"),
+        "scrollbar_handle": QColor("#007bff"),
+        "scrollbar_button": QColor("#007bff"),
+    },
+    "blue_theme": {
+        "normal_text": QColor("#e0f2f7"),
+        "warning_text": QColor("#FF6347"), # Tomato
+        "success_text": QColor("#3CB371"), # MediumSeaGreen
+        "group_box_border": QColor("#3c6595"),
+        "group_box_bg": QColor("rgba(26, 42, 64, 0.7)"),
+        "group_box_title": QColor("#87CEEB"),
+        "checkbox_color": QColor("#e0f2f7"),
+        "checkbox_indicator_unchecked_bg": QColor("#2b4a68"),
+        "checkbox_indicator_checked_bg": QColor("#4682B4"),
+        "checkbox_indicator_border": QColor("#5a7c9f"),
+        "line_edit_bg": QColor("#223f5b"),
+        "line_edit_text": QColor("#e0f2f7"),
+        "line_edit_border": QColor("#4a6c8e"),
+        "button_bg": QColor("#4682B4"),
+        "button_hover_bg": QColor("#3a719d"),
+        "button_text": QColor("white"),
+        "scrollbar_trough": QColor("#2b4a68"),
+        "scrollbar_handle": QColor("#4682B4"),
+        "scrollbar_button": QColor("#4682B4"),
+    },
+    "dark_gray_theme": {
+        "normal_text": QColor("#fdfdfd"),
+        "warning_text": QColor("#FF6347"),
+        "success_text": QColor("#3CB371"),
+        "group_box_border": QColor("#666"),
+        "group_box_bg": QColor("rgba(60, 63, 65, 0.7)"),
+        "group_box_title": QColor("#79c0ff"),
+        "checkbox_color": QColor("#fdfdfd"),
+        "checkbox_indicator_unchecked_bg": QColor("#4b4f52"),
+        "checkbox_indicator_checked_bg": QColor("#6a737d"),
+        "checkbox_indicator_border": QColor("#888888"),
+        "line_edit_bg": QColor("#4b4f52"),
+        "line_edit_text": QColor("#fdfdfd"),
+        "line_edit_border": QColor("#6c7072"),
+        "button_bg": QColor("#6a737d"),
+        "button_hover_bg": QColor("#586069"),
+        "button_text": QColor("white"),
+        "scrollbar_trough": QColor("#444"),
+        "scrollbar_handle": QColor("#6a737d"),
+        "scrollbar_button": QColor("#6a737d"),
+    },
+    "forest_green_theme": {
+        "normal_text": QColor("#FFFFFF"),
+        "warning_text": QColor("#FF6347"),
+        "success_text": QColor("#9ACD32"), # YellowGreen
+        "group_box_border": QColor("#66BB6A"),
+        "group_box_bg": QColor("rgba(34, 139, 34, 0.7)"),
+        "group_box_title": QColor("#A5D6A7"),
+        "checkbox_color": QColor("#FFFFFF"),
+        "checkbox_indicator_unchecked_bg": QColor("#339933"),
+        "checkbox_indicator_checked_bg": QColor("#66BB6A"),
+        "checkbox_indicator_border": QColor("#88CC88"),
+        "line_edit_bg": QColor("#339933"),
+        "line_edit_text": QColor("#FFFFFF"),
+        "line_edit_border": QColor("#4CAF50"),
+        "button_bg": QColor("#66BB6A"),
+        "button_hover_bg": QColor("#4CAF50"),
+        "button_text": QColor("white"),
+        "scrollbar_trough": QColor("#388E3C"),
+        "scrollbar_handle": QColor("#66BB6A"),
+        "scrollbar_button": QColor("#66BB6A"),
+    },
+    "warm_sepia_theme": {
+        "normal_text": QColor("#F5DEB3"), # Wheat
+        "warning_text": QColor("#CD5C5C"), # IndianRed
+        "success_text": QColor("#6B8E23"), # OliveDrab
+        "group_box_border": QColor("#A0522D"),
+        "group_box_bg": QColor("rgba(112, 66, 20, 0.7)"),
+        "group_box_title": QColor("#DEB887"),
+        "checkbox_color": QColor("#F5DEB3"),
+        "checkbox_indicator_unchecked_bg": QColor("#7C4F2A"),
+        "checkbox_indicator_checked_bg": QColor("#A0522D"),
+        "checkbox_indicator_border": QColor("#C08040"),
+        "line_edit_bg": QColor("#7C4F2A"),
+        "line_edit_text": QColor("#F5DEB3"),
+        "line_edit_border": QColor("#A0522D"),
+        "button_bg": QColor("#A0522D"),
+        "button_hover_bg": QColor("#8B4513"),
+        "button_text": QColor("white"),
+        "scrollbar_trough": QColor("#8B4513"),
+        "scrollbar_handle": QColor("#A0522D"),
+        "scrollbar_button": QColor("#A0522D"),
+    },
+    "ocean_blue_theme": {
+        "normal_text": QColor("#E0FFFF"), # Light Cyan
+        "warning_text": QColor("#FF6347"),
+        "success_text": QColor("#66CDAA"), # MediumAquamarine
+        "group_box_border": QColor("#0066CC"),
+        "group_box_bg": QColor("rgba(0, 51, 102, 0.7)"),
+        "group_box_title": QColor("#87CEEB"),
+        "checkbox_color": QColor("#E0FFFF"),
+        "checkbox_indicator_unchecked_bg": QColor("#004080"),
+        "checkbox_indicator_checked_bg": QColor("#4682B4"),
+        "checkbox_indicator_border": QColor("#0077CC"),
+        "line_edit_bg": QColor("#004080"),
+        "line_edit_text": QColor("#E0FFFF"),
+        "line_edit_border": QColor("#005099"),
+        "button_bg": QColor("#4682B4"),
+        "button_hover_bg": QColor("#3A719D"),
+        "button_text": QColor("white"),
+        "scrollbar_trough": QColor("#004488"),
+        "scrollbar_handle": QColor("#4682B4"),
+        "scrollbar_button": QColor("#4682B4"),
+    },
+    "vibrant_purple_theme": {
+        "normal_text": QColor("#E6E6FA"), # Lavender
+        "warning_text": QColor("#FF6347"),
+        "success_text": QColor("#7FFF00"), # Chartreuse
+        "group_box_border": QColor("#8A2BE2"),
+        "group_box_bg": QColor("rgba(75, 0, 130, 0.7)"),
+        "group_box_title": QColor("#DDA0DD"),
+        "checkbox_color": QColor("#E6E6FA"),
+        "checkbox_indicator_unchecked_bg": QColor("#5F2A80"),
+        "checkbox_indicator_checked_bg": QColor("#8A2BE2"),
+        "checkbox_indicator_border": QColor("#B266FF"),
+        "line_edit_bg": QColor("#5F2A80"),
+        "line_edit_text": QColor("#E6E6FA"),
+        "line_edit_border": QColor("#8A2BE2"),
+        "button_bg": QColor("#8A2BE2"),
+        "button_hover_bg": QColor("#7B1BE0"),
+        "button_text": QColor("white"),
+        "scrollbar_trough": QColor("#6A0DAD"),
+        "scrollbar_handle": QColor("#8A2BE2"),
+        "scrollbar_button": QColor("#8A2BE2"),
+    },
+    "light_modern_theme": {
+        "normal_text": QColor("#333333"),
+        "warning_text": QColor("#FF4500"),
+        "success_text": QColor("#28A745"),
+        "group_box_border": QColor("#A0A0A0"),
+        "group_box_bg": QColor("rgba(248, 248, 248, 0.9)"),
+        "group_box_title": QColor("#555555"),
+        "checkbox_color": QColor("#333333"),
+        "checkbox_indicator_unchecked_bg": QColor("#CCCCCC"),
+        "checkbox_indicator_checked_bg": QColor("#607D8B"),
+        "checkbox_indicator_border": QColor("#999999"),
+        "line_edit_bg": QColor("#FFFFFF"),
+        "line_edit_text": QColor("#333333"),
+        "line_edit_border": QColor("#C0C0C0"),
+        "button_bg": QColor("#607D8B"),
+        "button_hover_bg": QColor("#455A64"),
+        "button_text": QColor("white"),
+        "scrollbar_trough": QColor("#E8E8E8"),
+        "scrollbar_handle": QColor("#607D8B"),
+        "scrollbar_button": QColor("#607D8B"),
+    },
+    "high_contrast_theme": {
+        "normal_text": QColor("#FFFF00"), # Yellow
+        "warning_text": QColor("#FF0000"), # Red
+        "success_text": QColor("#00FF00"), # Green
+        "group_box_border": QColor("#00FFFF"), # Cyan
+        "group_box_bg": QColor("rgba(0, 0, 0, 0.9)"),
+        "group_box_title": QColor("#FF0000"),
+        "checkbox_color": QColor("#FFFF00"),
+        "checkbox_indicator_unchecked_bg": QColor("#555555"),
+        "checkbox_indicator_checked_bg": QColor("#FFFF00"),
+        "checkbox_indicator_border": QColor("#00FFFF"),
+        "line_edit_bg": QColor("#222222"),
+        "line_edit_text": QColor("#FFFF00"),
+        "line_edit_border": QColor("#FF00FF"),
+        "button_bg": QColor("#FF00FF"),
+        "button_hover_bg": QColor("#CC00CC"),
+        "button_text": QColor("white"),
+        "scrollbar_trough": QColor("#333333"),
+        "scrollbar_handle": QColor("#FFFF00"),
+        "scrollbar_button": QColor("#FF00FF"),
+    }
+}
+
+# "#rrggbb" names of the palette colors above, so styling formats strings without converting
+# QColors on every theme change or storage refresh
+_THEME_HEX = {
+    theme: {key: color.name() for key, color in palette.items()}
+    for theme, palette in _THEME_PALETTES.items()
+}
+
+# Stylesheet template for the tab, filled in from a theme's _THEME_HEX entry (see SettingsTab._qss_for)
+_QSS_TEMPLATE = """
+    QWidget#SettingsTab {{
+        background-color: transparent;
+    }}
+    QLabel#settingsTabTitleLabel {{
+        color: {normal_text};
+    }}
+    QLabel#settingsLabel {{ /* General QLabel style within this tab, applied via objectName */
+        color: {normal_text};
+    }}
+    QLabel#settingsLabel:hover {{
+        color: {normal_text}; /* Keep same or define a hover color */
+    }}
+    QLabel#settingsLabel[storage="low"] {{ /* Storage status labels, driven by their "storage" property */
+        color: {warning_text};
+    }}
+    QLabel#settingsLabel[storage="ok"] {{
+        color: {success_text};
+    }}
+    /* Apply normal_text to all QLabels that are direct children of QGroupBoxes */
+    QGroupBox QLabel {{
+        color: {normal_text};
+    }}
+    QGroupBox#settingsGroupBox {{
+        border: 1px solid {group_box_border};
+        border-radius: 10px;
+        margin-top: 10px;
+        background-color: {group_box_bg};
+        padding: 20px 10px 10px 10px; /* Increased top padding to make space for title */
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: padding; /* Origin from padding area */
+        subcontrol-position: top left; /* Position at top left */
+        margin-top: -10px; /* Pull the title up to overlap the border */
+        padding: 0 5px; /* Adjust padding around title text */
+        color: {group_box_title};
+    }}
+    QCheckBox#settingsCheckBox {{
+        color: {checkbox_color}; /* Dynamic color for checkboxes text */
+    }}
+    QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+        border: 1px solid {checkbox_indicator_border}; /* Dynamic border color */
+        border-radius: 3px; /* Slightly rounded corners for indicator */
+    }}
+    QCheckBox::indicator:unchecked {{
+        background-color: {checkbox_indicator_unchecked_bg}; /* Dynamic unchecked background */
+    }}
+    QCheckBox::indicator:checked {{
+        background-color: {checkbox_indicator_checked_bg}; /* Dynamic checked background */
+        image: url(icons/checkbox_checked_tick.png); /* You might need to provide a tick icon */
+        /* A simple white/theme-appropriate checkmark can be drawn using image property or by a separate font icon */
+    }}
+    QLineEdit#settingsLineEdit {{
+        background-color: {line_edit_bg};
+        color: {line_edit_text};
+        border: 1px solid {line_edit_border};
+        border-radius: 5px;
+        padding: 5px;
+    }}
+    QPushButton#settingsButton {{
+        background-color: {button_bg};
+        color: {button_text};
+        border-radius: 5px;
+        padding: 5px 10px;
+    }}
+    QPushButton#settingsButton:hover {{
+        background-color: {button_hover_bg};
+    }}
+    QScrollArea#settingsScrollArea {{
+        border: none;
+        background-color: transparent;
+    }}
+    QWidget#settingsContentWidget {{ /* Targets the content widget inside the scroll area */
+        background-color: transparent;
+    }}
+    /* Scrollbar styling */
+    QScrollBar:vertical {{
+        border: 1px solid {scrollbar_trough};
+        background: {scrollbar_trough};
+        width: 10px;
+        margin: 20px 0 20px 0; /* Space for buttons */
+        border-radius: 5px;
+    }}
+    QScrollBar::handle:vertical {{
+        background: {scrollbar_handle};
+        min-height: 20px;
+        border-radius: 5px;
+    }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        border: 1px solid {scrollbar_button};
+        background: {scrollbar_button};
+        height: 20px;
+        subcontrol-origin: margin;
+        border-radius: 5px;
+    }}
+    QScrollBar::add-line:vertical {{
+        subcontrol-position: bottom;
+    }}
+    QScrollBar::sub-line:vertical {{
+        subcontrol-position: top;
+    }}
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+        background: none;
+    }}
+"""
+
+
 class SettingsTab(QWidget):
     """
     Separate tab for application settings:
@@ -24,6 +355,7 @@ class SettingsTab(QWidget):
     - Mock/Live Sensor Mode
     """
     settings_updated = pyqtSignal() # Define a signal that indicates settings have been updated
+    _shared_qss = {} # Rendered stylesheet per theme name
 
     def __init__(self, config_manager, sensor_manager, storage_monitor, parent=None):
         super(SettingsTab, self).__init__(parent)
@@ -34,265 +366,39 @@ class SettingsTab(QWidget):
 
         self.main_layout = QVBoxLayout(self)
         self.setLayout(self.main_layout)
-        
+        self._applied_qss = None # Stylesheet last applied by set_style
+
         self._set_theme_colors() # Set initial theme colors for dynamic elements
-        self._setup_ui()
-        self.set_style() # Apply QSS for static elements
+        self.set_style() # Apply QSS before any children exist, so nothing is re-polished
+        # The widgets and the storage check are built on first show (see showEvent)
+        self._ui_built = False
+        self._storage_probe = None # Background storage check in flight, if any
+        self._storage_probe_id = 0 # Id of the latest storage check; older results are ignored
+
+        # Coalesces the text fields' saves: tabbing through several fields writes the config
+        # (and emits settings_updated) once per burst instead of once per field
+        self._pending_saves = set() # Save methods requested since the last flush
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(200)
+        self._save_timer.timeout.connect(self._flush_pending_saves)
         self.logger.info("SettingsTab initialized.")
 
+    def showEvent(self, event):
+        """Builds the tab's contents the first time it is shown."""
+        if not self._ui_built:
+            self._setup_ui()
+            self._ui_built = True
+        super(SettingsTab, self).showEvent(event)
+
     def _set_theme_colors(self):
-        """Sets internal color attributes based on the current theme for dynamic elements."""
+        """Selects the current theme's palette; set_style applies it."""
         current_theme = self.config.get_setting("current_theme", "dark_theme")
-
-        # Define color palettes for various themes
-        theme_palettes = {
-            "dark_theme": {
-                "normal_text": QColor("#abb2bf"), # Light gray
-                "warning_text": QColor("#FF4500"), # OrangeRed
-                "success_text": QColor("#7CFC00"), # LimeGreen
-                "group_box_border": QColor("#555"),
-                "group_box_bg": QColor("rgba(40, 40, 40, 0.7)"),
-                "group_box_title": QColor("#61afef"), # Blue for titles
-                "checkbox_color": QColor("#EEE"),
-                "checkbox_indicator_unchecked_bg": QColor("#444444"), # Dark gray for unchecked
-                "checkbox_indicator_checked_bg": QColor("#61afef"),   # Blue for checked
-                "checkbox_indicator_border": QColor("#777777"),    # Medium gray border
-                "line_edit_bg": QColor("#333"),
-                "line_edit_text": QColor("#EEE"),
-                "line_edit_border": QColor("#666"),
-                "button_bg": QColor("#1E90FF"), # DodgerBlue
-                "button_hover_bg": QColor("#1C86EE"),
-                "button_text": QColor("white"),
-                "scrollbar_trough": QColor("#333"), # Dark gray for scrollbar trough
-                "scrollbar_handle": QColor("#61afef"), # Blue for scrollbar handle
-                "scrollbar_button": QColor("#1E90FF"), # DodgerBlue for scrollbar buttons
-            },
-            "light_theme": {
-                "normal_text": QColor("#333333"),
-                "warning_text": QColor("#FF4500"),
-                "success_text": QColor("#28A745"), # Green
-                "group_box_border": QColor("#ccc"),
-                "group_box_bg": QColor("rgba(255, 255, 255, 0.9)"),
-                "group_box_title": QColor("#007bff"),
-                "checkbox_color": QColor("#333333"),
-                "checkbox_indicator_unchecked_bg": QColor("#E0E0E0"), # Light gray for unchecked
-                "checkbox_indicator_checked_bg": QColor("#007bff"),   # Blue for checked
-                "checkbox_indicator_border": QColor("#AAAAAA"),    # Medium gray border
-                "line_edit_bg": QColor("#f8f8f8"),
-                "line_edit_text": QColor("#333"),
-                "line_edit_border": QColor("#ccc"),
-                "button_bg": QColor("#007bff"),
-                "button_hover_bg": QColor("#0056b3"),
-                "button_text": QColor("white"),
-                "scrollbar_trough": QColor("#f0f0f0"),
-                "scrollbar_handle": QColor("#007bff"),
-                "scrollbar_button": QColor("#007bff"),
-            },
-            "blue_theme": {
-                "normal_text": QColor("#e0f2f7"),
-                "warning_text": QColor("#FF6347"), # Tomato
-                "success_text": QColor("#3CB371"), # MediumSeaGreen
-                "group_box_border": QColor("#3c6595"),
-                "group_box_bg": QColor("rgba(26, 42, 64, 0.7)"),
-                "group_box_title": QColor("#87CEEB"),
-                "checkbox_color": QColor("#e0f2f7"),
-                "checkbox_indicator_unchecked_bg": QColor("#2b4a68"),
-                "checkbox_indicator_checked_bg": QColor("#4682B4"),
-                "checkbox_indicator_border": QColor("#5a7c9f"),
-                "line_edit_bg": QColor("#223f5b"),
-                "line_edit_text": QColor("#e0f2f7"),
-                "line_edit_border": QColor("#4a6c8e"),
-                "button_bg": QColor("#4682B4"),
-                "button_hover_bg": QColor("#3a719d"),
-                "button_text": QColor("white"),
-                "scrollbar_trough": QColor("#2b4a68"),
-                "scrollbar_handle": QColor("#4682B4"),
-                "scrollbar_button": QColor("#4682B4"),
-            },
-            "dark_gray_theme": {
-                "normal_text": QColor("#fdfdfd"),
-                "warning_text": QColor("#FF6347"),
-                "success_text": QColor("#3CB371"),
-                "group_box_border": QColor("#666"),
-                "group_box_bg": QColor("rgba(60, 63, 65, 0.7)"),
-                "group_box_title": QColor("#79c0ff"),
-                "checkbox_color": QColor("#fdfdfd"),
-                "checkbox_indicator_unchecked_bg": QColor("#4b4f52"),
-                "checkbox_indicator_checked_bg": QColor("#6a737d"),
-                "checkbox_indicator_border": QColor("#888888"),
-                "line_edit_bg": QColor("#4b4f52"),
-                "line_edit_text": QColor("#fdfdfd"),
-                "line_edit_border": QColor("#6c7072"),
-                "button_bg": QColor("#6a737d"),
-                "button_hover_bg": QColor("#586069"),
-                "button_text": QColor("white"),
-                "scrollbar_trough": QColor("#444"),
-                "scrollbar_handle": QColor("#6a737d"),
-                "scrollbar_button": QColor("#6a737d"),
-            },
-            "forest_green_theme": {
-                "normal_text": QColor("#FFFFFF"),
-                "warning_text": QColor("#FF6347"),
-                "success_text": QColor("#9ACD32"), # YellowGreen
-                "group_box_border": QColor("#66BB6A"),
-                "group_box_bg": QColor("rgba(34, 139, 34, 0.7)"),
-                "group_box_title": QColor("#A5D6A7"),
-                "checkbox_color": QColor("#FFFFFF"),
-                "checkbox_indicator_unchecked_bg": QColor("#339933"),
-                "checkbox_indicator_checked_bg": QColor("#66BB6A"),
-                "checkbox_indicator_border": QColor("#88CC88"),
-                "line_edit_bg": QColor("#339933"),
-                "line_edit_text": QColor("#FFFFFF"),
-                "line_edit_border": QColor("#4CAF50"),
-                "button_bg": QColor("#66BB6A"),
-                "button_hover_bg": QColor("#4CAF50"),
-                "button_text": QColor("white"),
-                "scrollbar_trough": QColor("#388E3C"),
-                "scrollbar_handle": QColor("#66BB6A"),
-                "scrollbar_button": QColor("#66BB6A"),
-            },
-            "warm_sepia_theme": {
-                "normal_text": QColor("#F5DEB3"), # Wheat
-                "warning_text": QColor("#CD5C5C"), # IndianRed
-                "success_text": QColor("#6B8E23"), # OliveDrab
-                "group_box_border": QColor("#A0522D"),
-                "group_box_bg": QColor("rgba(112, 66, 20, 0.7)"),
-                "group_box_title": QColor("#DEB887"),
-                "checkbox_color": QColor("#F5DEB3"),
-                "checkbox_indicator_unchecked_bg": QColor("#7C4F2A"),
-                "checkbox_indicator_checked_bg": QColor("#A0522D"),
-                "checkbox_indicator_border": QColor("#C08040"),
-                "line_edit_bg": QColor("#7C4F2A"),
-                "line_edit_text": QColor("#F5DEB3"),
-                "line_edit_border": QColor("#A0522D"),
-                "button_bg": QColor("#A0522D"),
-                "button_hover_bg": QColor("#8B4513"),
-                "button_text": QColor("white"),
-                "scrollbar_trough": QColor("#8B4513"),
-                "scrollbar_handle": QColor("#A0522D"),
-                "scrollbar_button": QColor("#A0522D"),
-            },
-            "ocean_blue_theme": {
-                "normal_text": QColor("#E0FFFF"), # Light Cyan
-                "warning_text": QColor("#FF6347"),
-                "success_text": QColor("#66CDAA"), # MediumAquamarine
-                "group_box_border": QColor("#0066CC"),
-                "group_box_bg": QColor("rgba(0, 51, 102, 0.7)"),
-                "group_box_title": QColor("#87CEEB"),
-                "checkbox_color": QColor("#E0FFFF"),
-                "checkbox_indicator_unchecked_bg": QColor("#004080"),
-                "checkbox_indicator_checked_bg": QColor("#4682B4"),
-                "checkbox_indicator_border": QColor("#0077CC"),
-                "line_edit_bg": QColor("#004080"),
-                "line_edit_text": QColor("#E0FFFF"),
-                "line_edit_border": QColor("#005099"),
-                "button_bg": QColor("#4682B4"),
-                "button_hover_bg": QColor("#3A719D"),
-                "button_text": QColor("white"),
-                "scrollbar_trough": QColor("#004488"),
-                "scrollbar_handle": QColor("#4682B4"),
-                "scrollbar_button": QColor("#4682B4"),
-            },
-            "vibrant_purple_theme": {
-                "normal_text": QColor("#E6E6FA"), # Lavender
-                "warning_text": QColor("#FF6347"),
-                "success_text": QColor("#7FFF00"), # Chartreuse
-                "group_box_border": QColor("#8A2BE2"),
-                "group_box_bg": QColor("rgba(75, 0, 130, 0.7)"),
-                "group_box_title": QColor("#DDA0DD"),
-                "checkbox_color": QColor("#E6E6FA"),
-                "checkbox_indicator_unchecked_bg": QColor("#5F2A80"),
-                "checkbox_indicator_checked_bg": QColor("#8A2BE2"),
-                "checkbox_indicator_border": QColor("#B266FF"),
-                "line_edit_bg": QColor("#5F2A80"),
-                "line_edit_text": QColor("#E6E6FA"),
-                "line_edit_border": QColor("#8A2BE2"),
-                "button_bg": QColor("#8A2BE2"),
-                "button_hover_bg": QColor("#7B1BE0"),
-                "button_text": QColor("white"),
-                "scrollbar_trough": QColor("#6A0DAD"),
-                "scrollbar_handle": QColor("#8A2BE2"),
-                "scrollbar_button": QColor("#8A2BE2"),
-            },
-            "light_modern_theme": {
-                "normal_text": QColor("#333333"),
-                "warning_text": QColor("#FF4500"),
-                "success_text": QColor("#28A745"),
-                "group_box_border": QColor("#A0A0A0"),
-                "group_box_bg": QColor("rgba(248, 248, 248, 0.9)"),
-                "group_box_title": QColor("#555555"),
-                "checkbox_color": QColor("#333333"),
-                "checkbox_indicator_unchecked_bg": QColor("#CCCCCC"),
-                "checkbox_indicator_checked_bg": QColor("#607D8B"),
-                "checkbox_indicator_border": QColor("#999999"),
-                "line_edit_bg": QColor("#FFFFFF"),
-                "line_edit_text": QColor("#333333"),
-                "line_edit_border": QColor("#C0C0C0"),
-                "button_bg": QColor("#607D8B"),
-                "button_hover_bg": QColor("#455A64"),
-                "button_text": QColor("white"),
-                "scrollbar_trough": QColor("#E8E8E8"),
-                "scrollbar_handle": QColor("#607D8B"),
-                "scrollbar_button": QColor("#607D8B"),
-            },
-            "high_contrast_theme": {
-                "normal_text": QColor("#FFFF00"), # Yellow
-                "warning_text": QColor("#FF0000"), # Red
-                "success_text": QColor("#00FF00"), # Green
-                "group_box_border": QColor("#00FFFF"), # Cyan
-                "group_box_bg": QColor("rgba(0, 0, 0, 0.9)"),
-                "group_box_title": QColor("#FF0000"),
-                "checkbox_color": QColor("#FFFF00"),
-                "checkbox_indicator_unchecked_bg": QColor("#555555"),
-                "checkbox_indicator_checked_bg": QColor("#FFFF00"),
-                "checkbox_indicator_border": QColor("#00FFFF"),
-                "line_edit_bg": QColor("#222222"),
-                "line_edit_text": QColor("#FFFF00"),
-                "line_edit_border": QColor("#FF00FF"),
-                "button_bg": QColor("#FF00FF"),
-                "button_hover_bg": QColor("#CC00CC"),
-                "button_text": QColor("white"),
-                "scrollbar_trough": QColor("#333333"),
-                "scrollbar_handle": QColor("#FFFF00"),
-                "scrollbar_button": QColor("#FF00FF"),
-            }
-        }
-
-        self.theme_palette = theme_palettes.get(current_theme, theme_palettes["dark_theme"]) # Fallback to dark
-        
-        self.normal_text_color = self.theme_palette["normal_text"]
-        self.warning_text_color = self.theme_palette["warning_text"]
-        self.success_text_color = self.theme_palette["success_text"]
-        self.group_box_border_color = self.theme_palette["group_box_border"]
-        self.group_box_bg_color = self.theme_palette["group_box_bg"]
-        self.group_box_title_color = self.theme_palette["group_box_title"]
-        self.checkbox_color = self.theme_palette["checkbox_color"]
-        self.checkbox_indicator_unchecked_bg_color = self.theme_palette["checkbox_indicator_unchecked_bg"]
-        self.checkbox_indicator_checked_bg_color = self.theme_palette["checkbox_indicator_checked_bg"]
-        self.checkbox_indicator_border_color = self.theme_palette["checkbox_indicator_border"]
-        self.line_edit_bg_color = self.theme_palette["line_edit_bg"]
-        self.line_edit_text_color = self.theme_palette["line_edit_text"]
-        self.line_edit_border_color = self.theme_palette["line_edit_border"]
-        self.button_bg_color = self.theme_palette["button_bg"]
-        self.button_hover_bg_color = self.theme_palette["button_hover_bg"]
-        self.button_text_color = self.theme_palette["button_text"]
-        self.scrollbar_trough_color = self.theme_palette["scrollbar_trough"]
-        self.scrollbar_handle_color = self.theme_palette["scrollbar_handle"]
-        self.scrollbar_button_color = self.theme_palette["scrollbar_button"]
-
-        # Update dynamic elements
-        # Using a guard clause here to prevent errors if widgets are not yet initialized
-        if hasattr(self, 'title_label'):
-            self.title_label.setStyleSheet("color: {};".format(self.normal_text_color.name()))
-        
-        if hasattr(self, 'log_dir_space_label'):
-            # These are updated in _update_storage_status_display, but ensure initial color is set
-            self.log_dir_space_label.setStyleSheet("color: {};".format(self.normal_text_color.name()))
-            self.archive_dir_space_label.setStyleSheet("color: {};".format(self.normal_text_color.name()))
-            self.sensor_log_space_label.setStyleSheet("color: {};".format(self.normal_text_color.name()))
-                
-        # Re-apply stylesheet to ensure all QSS rules with dynamic colors are updated
-        self.set_style()
+        # Colors are read from the palette by key where used; no per-color attributes
+        self.theme_palette = _THEME_PALETTES.get(current_theme, _THEME_PALETTES["dark_theme"]) # Fallback to dark
+        self._palette_theme = current_theme # Theme the palette above was resolved for
+        # Every themed color, the title and storage labels included, comes from the tab
+        # stylesheet through object names and properties; no widget gets an inline stylesheet
 
 
     def _setup_ui(self):
@@ -415,18 +521,18 @@ class SettingsTab(QWidget):
         self.api_key_edit = QLineEdit(self.config.get_setting("openweathermap_api_key", ""))
         self.api_key_edit.setObjectName("settingsLineEdit")
         self.api_key_edit.setPlaceholderText("Enter OpenWeatherMap API Key")
-        self.api_key_edit.editingFinished.connect(self._save_weather_settings) # Save when editing finishes
+        self.api_key_edit.editingFinished.connect(lambda: self._schedule_save(self._save_weather_settings)) # Save when editing finishes
         weather_layout.addRow("OpenWeatherMap API Key:", self.api_key_edit)
 
         self.city_edit = QLineEdit(self.config.get_setting("weather_city", "Frisco"))
         self.city_edit.setObjectName("settingsLineEdit")
-        self.city_edit.editingFinished.connect(self._save_weather_settings)
+        self.city_edit.editingFinished.connect(lambda: self._schedule_save(self._save_weather_settings))
         weather_layout.addRow("City:", self.city_edit)
 
         self.country_code_edit = QLineEdit(self.config.get_setting("weather_country_code", "US"))
         self.country_code_edit.setObjectName("settingsLineEdit")
         self.country_code_edit.setPlaceholderText("e.g., US, GB, DE")
-        self.country_code_edit.editingFinished.connect(self._save_weather_settings)
+        self.country_code_edit.editingFinished.connect(lambda: self._schedule_save(self._save_weather_settings))
         weather_layout.addRow("Country Code:", self.country_code_edit)
         
         content_layout.addWidget(weather_group)
@@ -441,7 +547,7 @@ class SettingsTab(QWidget):
         self.sensor_interval_edit = QLineEdit(str(self.config.get_setting("sensor_read_interval", 2)))
         self.sensor_interval_edit.setObjectName("settingsLineEdit")
         self.sensor_interval_edit.setToolTip("Interval in seconds for reading sensors.")
-        self.sensor_interval_edit.editingFinished.connect(self._save_sensor_interval)
+        self.sensor_interval_edit.editingFinished.connect(lambda: self._schedule_save(self._save_sensor_interval))
         sensor_interval_layout.addRow("Read Interval (seconds):", self.sensor_interval_edit)
 
         content_layout.addWidget(sensor_interval_group)
@@ -567,6 +673,24 @@ class SettingsTab(QWidget):
         self.logger.info("Archive settings saved.")
         self.settings_updated.emit() # Emit signal
 
+    def _schedule_save(self, save_method):
+        """
+        Queues a save method to run when the save timer fires (see __init__), restarting
+        the timer so a burst of edits is saved together.
+
+        :param save_method: One of the _save_* methods.
+        """
+        self._pending_saves.add(save_method)
+        self._save_timer.start()
+
+    def _flush_pending_saves(self):
+        """Runs each save method queued by _schedule_save once."""
+        self._save_timer.stop() # No-op when called by the timer; cancels it on an early flush
+        pending, self._pending_saves = self._pending_saves, set()
+        for save_method in (self._save_weather_settings, self._save_sensor_interval): # Fixed order
+            if save_method in pending:
+                save_method()
+
     def _save_weather_settings(self):
         """Saves weather API and location settings."""
         self.config.set_setting("openweathermap_api_key", self.api_key_edit.text().strip())
@@ -595,10 +719,11 @@ class SettingsTab(QWidget):
             QMessageBox.critical(self, "Error", "Failed to save sensor interval: {}".format(e))
 
     def _update_storage_status_display(self):
-        """Updates the labels displaying free storage space."""
+        """
+        Refreshes the labels displaying free storage space. The directories are created
+        and checked on the global thread pool; the labels update in _on_storage_probed.
+        """
         # This method is called both on initial setup and when refreshing storage.
-        # Ensure theme colors are re-applied to handle potential theme changes while app is running.
-        self._set_theme_colors() 
 
         # Resolve to absolute paths for storage check, then check
         project_root_abs = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
@@ -607,157 +732,111 @@ class SettingsTab(QWidget):
         archive_dir = self.config.get_setting("archive_directory", "Archive_Sensor_Logs")
         sensor_log_dir = self.config.get_setting("sensor_log_directory", "Sensor_Logs")
 
-        # Construct absolute paths
-        log_abs_path = os.path.join(project_root_abs, log_dir)
-        archive_abs_path = os.path.join(project_root_abs, archive_dir)
-        sensor_log_abs_path = os.path.join(project_root_abs, sensor_log_dir)
-
-        # Ensure directories exist before checking space
-        for path in [log_abs_path, archive_abs_path, sensor_log_abs_path]:
-            if not os.path.exists(path):
-                try:
-                    os.makedirs(path)
-                except Exception as e:
-                    self.logger.error("Failed to create directory {}: {}".format(path, e))
-
-        log_free_gb = self.storage_monitor.get_free_space_gb(log_abs_path)
-        archive_free_gb = self.storage_monitor.get_free_space_gb(archive_abs_path)
-        sensor_log_free_gb = self.storage_monitor.get_free_space_gb(sensor_log_abs_path)
-
-        self.log_dir_space_label.setText("Debug Log Dir ({}): {:.2f} GB free".format(os.path.basename(log_abs_path), log_free_gb))
-        self.archive_dir_space_label.setText("Archive Dir ({}): {:.2f} GB free".format(os.path.basename(archive_abs_path), archive_free_gb))
-        self.sensor_log_space_label.setText("Sensor Log Dir ({}): {:.2f} GB free".format(os.path.basename(sensor_log_abs_path), sensor_log_free_gb))
+        # Construct absolute paths, in label order
+        paths = [os.path.join(project_root_abs, log_dir),
+                 os.path.join(project_root_abs, archive_dir),
+                 os.path.join(project_root_abs, sensor_log_dir)]
+
+        self._storage_probe_id += 1
+        self._storage_probe = _StorageProbeTask(self._storage_probe_id, self.storage_monitor, paths)
+        self._storage_probe.signals.finished.connect(self._on_storage_probed)
+        QThreadPool.globalInstance().start(self._storage_probe)
+
+    def _on_storage_probed(self, probe_id, paths, free_gbs):
+        """
+        Shows the result of a storage check started by _update_storage_status_display.
+
+        :param probe_id: Id of the check; results of superseded checks are dropped.
+        :param paths: The checked directories (debug log, archive, sensor log).
+        :param free_gbs: Free space in GB for each of paths.
+        """
+        if probe_id != self._storage_probe_id:
+            return # A newer check (e.g. after a directory change) is on its way
+        self._storage_probe = None
+        log_free_gb, archive_free_gb, sensor_log_free_gb = free_gbs
+
+        self.log_dir_space_label.setText("Debug Log Dir ({}): {:.2f} GB free".format(os.path.basename(paths[0]), log_free_gb))
+        self.archive_dir_space_label.setText("Archive Dir ({}): {:.2f} GB free".format(os.path.basename(paths[1]), archive_free_gb))
+        self.sensor_log_space_label.setText("Sensor Log Dir ({}): {:.2f} GB free".format(os.path.basename(paths[2]), sensor_log_free_gb))
 
         # Apply color warnings based on theme colors
         min_space = self.config.get_setting("min_free_space_gb", 0.5)
-        
-        if log_free_gb < min_space: self.log_dir_space_label.setStyleSheet("color: {};".format(self.warning_text_color.name()))
-        else: self.log_dir_space_label.setStyleSheet("color: {};".format(self.success_text_color.name()))
 
-        if archive_free_gb < min_space: self.archive_dir_space_label.setStyleSheet("color: {};".format(self.warning_text_color.name()))
-        else: self.archive_dir_space_label.setStyleSheet("color: {};".format(self.success_text_color.name()))
-        
-        if sensor_log_free_gb < min_space: self.sensor_log_space_label.setStyleSheet("color: {};".format(self.warning_text_color.name()))
-        else: self.sensor_log_space_label.setStyleSheet("color: {};".format(self.success_text_color.name()))
+        # The tab stylesheet's [storage=...] rules hold the colors, so they follow theme changes
+        self._set_storage_property(self.log_dir_space_label, log_free_gb < min_space)
+        self._set_storage_property(self.archive_dir_space_label, archive_free_gb < min_space)
+        self._set_storage_property(self.sensor_log_space_label, sensor_log_free_gb < min_space)
+
+    @staticmethod
+    def _set_storage_property(label, low):
+        """
+        Sets a storage label's "storage" dynamic property and re-polishes it, so only the
+        tab stylesheet's matching [storage=...] rule is re-evaluated instead of parsing a
+        new inline stylesheet.
+        """
+        label.setProperty("storage", "low" if low else "ok")
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+
+    def apply_theme(self):
+        """
+        Re-applies the current theme to the tab stylesheet.
+        Called by MainWindow._apply_theme.
+        """
+        self._set_theme_colors()
+        self.set_style()
 
     def set_style(self):
-        """Applies specific styling for the tab."""
-        self.setStyleSheet("""
-            QWidget#SettingsTab {{
-                background-color: transparent;
-            }}
-            QLabel#settingsTabTitleLabel {{
-                color: {normal_text_color};
-            }}
-            QLabel#settingsLabel {{ /* General QLabel style within this tab, applied via objectName */
-                color: {normal_text_color};
-            }}
-            QLabel#settingsLabel:hover {{
-                color: {normal_text_color}; /* Keep same or define a hover color */
-            }}
-            /* Apply normal_text_color to all QLabels that are direct children of QGroupBoxes */
-            QGroupBox QLabel {{
-                color: {normal_text_color};
-            }}
-            QGroupBox#settingsGroupBox {{
-                border: 1px solid {group_box_border_color};
-                border-radius: 10px;
-                margin-top: 10px;
-                background-color: {group_box_bg_color};
-                padding: 20px 10px 10px 10px; /* Increased top padding to make space for title */
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: padding; /* Origin from padding area */
-                subcontrol-position: top left; /* Position at top left */
-                margin-top: -10px; /* Pull the title up to overlap the border */
-                padding: 0 5px; /* Adjust padding around title text */
-                color: {group_box_title_color};
-            }}
-            QCheckBox#settingsCheckBox {{
-                color: {checkbox_color}; /* Dynamic color for checkboxes text */
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 1px solid {checkbox_indicator_border_color}; /* Dynamic border color */
-                border-radius: 3px; /* Slightly rounded corners for indicator */
-            }}
-            QCheckBox::indicator:unchecked {{
-                background-color: {checkbox_indicator_unchecked_bg_color}; /* Dynamic unchecked background */
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {checkbox_indicator_checked_bg_color}; /* Dynamic checked background */
-                image: url(icons/checkbox_checked_tick.png); /* You might need to provide a tick icon */
-                /* A simple white/theme-appropriate checkmark can be drawn using image property or by a separate font icon */
-            }}
-            QLineEdit#settingsLineEdit {{
-                background-color: {line_edit_bg_color};
-                color: {line_edit_text_color};
-                border: 1px solid {line_edit_border_color};
-                border-radius: 5px;
-                padding: 5px;
-            }}
-            QPushButton#settingsButton {{
-                background-color: {button_bg_color};
-                color: {button_text_color};
-                border-radius: 5px;
-                padding: 5px 10px;
-            }}
-            QPushButton#settingsButton:hover {{
-                background-color: {button_hover_bg_color};
-            }}
-            QScrollArea#settingsScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            QWidget#settingsContentWidget {{ /* Targets the content widget inside the scroll area */
-                background-color: transparent;
-            }}
-            /* Scrollbar styling */
-            QScrollBar:vertical {{
-                border: 1px solid {scrollbar_trough_color};
-                background: {scrollbar_trough_color};
-                width: 10px;
-                margin: 20px 0 20px 0; /* Space for buttons */
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {scrollbar_handle_color};
-                min-height: 20px;
-                border-radius: 5px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                border: 1px solid {scrollbar_button_color};
-                background: {scrollbar_button_color};
-                height: 20px;
-                subcontrol-origin: margin;
-                border-radius: 5px;
-            }}
-            QScrollBar::add-line:vertical {{
-                subcontrol-position: bottom;
-            }}
-            QScrollBar::sub-line:vertical {{
-                subcontrol-position: top;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-        """.format(
-            normal_text_color=self.normal_text_color.name(),
-            group_box_border_color=self.group_box_border_color.name(),
-            group_box_bg_color=self.group_box_bg_color.name(),
-            group_box_title_color=self.group_box_title_color.name(),
-            checkbox_color=self.checkbox_color.name(),
-            checkbox_indicator_unchecked_bg_color=self.checkbox_indicator_unchecked_bg_color.name(),
-            checkbox_indicator_checked_bg_color=self.checkbox_indicator_checked_bg_color.name(),
-            checkbox_indicator_border_color=self.checkbox_indicator_border_color.name(),
-            line_edit_bg_color=self.line_edit_bg_color.name(),
-            line_edit_text_color=self.line_edit_text_color.name(),
-            line_edit_border_color=self.line_edit_border_color.name(),
-            button_bg_color=self.button_bg_color.name(),
-            button_hover_bg_color=self.button_hover_bg_color.name(),
-            button_text_color=self.button_text_color.name(),
-            scrollbar_trough_color=self.scrollbar_trough_color.name(),
-            scrollbar_handle_color=self.scrollbar_handle_color.name(),
-            scrollbar_button_color=self.scrollbar_button_color.name()
-        ))
+        """Applies specific styling for the tab: the current theme's stylesheet (see _qss_for)."""
+        qss = SettingsTab._qss_for(self._palette_theme)
+        # setStyleSheet re-parses the sheet and re-polishes every child widget, so skip it
+        # when the stylesheet is the one already applied
+        if qss == self._applied_qss:
+            return
+        self.setStyleSheet(qss)
+        self._applied_qss = qss
+
+    @classmethod
+    def _qss_for(cls, theme):
+        """
+        Returns the tab stylesheet for a theme, rendered from _QSS_TEMPLATE on first use and
+        shared by all instances.
+
+        :param theme: Theme name, e.g. "dark_theme" (unknown names use the dark palette).
+        """
+        qss = cls._shared_qss.get(theme)
+        if qss is None:
+            qss = cls._shared_qss[theme] = _QSS_TEMPLATE.format_map(_THEME_HEX.get(theme, _THEME_HEX["dark_theme"]))
+        return qss
+
+
+class _StorageProbeSignals(QObject):
+    """Signals for _StorageProbeTask; QRunnable is not a QObject and cannot define its own."""
+    finished = pyqtSignal(int, object, object) # (probe id, paths, free GB per path)
+
+
+class _StorageProbeTask(QRunnable):
+    """
+    Creates any missing directories and reads their free space on a QThreadPool thread,
+    so a slow disk (SD card, network mount) does not block the GUI.
+    """
+    def __init__(self, probe_id, storage_monitor, paths):
+        super(_StorageProbeTask, self).__init__()
+        self.probe_id = probe_id
+        self.storage_monitor = storage_monitor
+        self.paths = paths
+        self.signals = _StorageProbeSignals()
+
+    def run(self):
+        logger = Logger.get_logger()
+        free_gbs = []
+        for path in self.paths:
+            # Ensure directories exist before checking space
+            if not os.path.exists(path):
+                try:
+                    os.makedirs(path)
+                except Exception as e:
+                    logger.error("Failed to create directory {}: {}".format(path, e))
+            free_gbs.append(self.storage_monitor.get_free_space_gb(path))
+        self.signals.finished.emit(self.probe_id, self.paths, free_gbs) # Queued to the GUI thread
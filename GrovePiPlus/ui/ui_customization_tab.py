@@ -1196,13 +1196,17 @@ class UICustomizationTab(QWidget):
         selected_type = self.sensor_type_combo.currentText()
         self.config.set_setting("sensor_display_type", selected_type)
         self.logger.info("Sensor display type set to: {}".format(selected_type))
+        # MainWindow rebuilds the gauges on this signal, and each tab themes the gauges it builds
         self.sensor_display_type_changed.emit(selected_type) # Emit new signal
-        # Re-apply theme to trigger all tabs to redraw their gauges with the new type
-        if hasattr(self.main_window_ref, '_apply_theme'):
-            current_theme = self.config.get_setting("current_theme", "dark_theme")
-            self.main_window_ref._apply_theme(current_theme) # Re-apply current theme to trigger tab updates
 
 
+    def apply_theme(self):
+        """
+        Re-applies the current theme to the tab stylesheet.
+        Called by MainWindow._apply_theme.
+        """
+        self.set_style()
+
     def set_style(self):
         """Applies specific styling for the tab."""
         self.setStyleSheet("""
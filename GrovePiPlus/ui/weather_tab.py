@@ -501,6 +501,16 @@ class WeatherTab(QWidget):
             self.daily_forecast_layout.addStretch(1) # Push error message to left
 
 
+    def apply_theme(self):
+        """
+        Re-applies the current theme without re-fetching the weather: the tab stylesheet,
+        the current-weather label colors and the existing forecast cards.
+        Called by MainWindow._apply_theme.
+        """
+        self.set_style()
+        self._set_theme_colors()
+        self._update_forecast_card_styles()
+
     def set_style(self):
         """Applies specific styling for the tab."""
         self.setStyleSheet("""
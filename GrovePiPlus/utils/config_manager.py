@@ -86,6 +86,11 @@ class ConfigManager:
         self.config.setdefault("min_free_space_gb", 0.5) # Minimum free space before warning (GB)
         self.config.setdefault("system_check_interval_ms", 60000) # How often to check system status (ms)
 
+        # Plot rendering settings
+        self.config.setdefault("plot_use_opengl", True) # Draw plots with OpenGL when PyOpenGL is installed
+        self.config.setdefault("plot_cache_curves", False) # Cache plot lines and axes as pixmaps (blurs while zooming)
+        self.config.setdefault("plot_cache_directory", "Plot_Cache") # Parquet copies of loaded sensor CSVs
+
         # Save defaults immediately if they were just set (i.e., new file)
         if not os.path.exists(ConfigManager._config_file_path):
             self._save_config()
@@ -0,0 +1,83 @@
+# utils/fastmath.py
+"""
+Numeric helpers for plotting sensor data.
+
+Kernels are compiled with numba when it is installed (pip install numba); otherwise
+an equivalent vectorized NumPy version is used, so numba stays an optional dependency.
+"""
+import numpy as np
+
+# Conditional import of numba
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, nogil=True)
+    def minmax_bucket(y, out_min, out_max, bucket):
+        """
+        Computes the minimum and maximum of each consecutive run of `bucket` samples in y,
+        both in the same pass, with buckets spread across threads.
+
+        :param y: 1-D input array; only the first out_min.size * bucket samples are read.
+        :param out_min: Preallocated 1-D output array for the bucket minimums.
+        :param out_max: Preallocated 1-D output array for the bucket maximums (same size).
+        :param bucket: Samples per bucket (>= 1).
+        """
+        for b in prange(out_min.size):
+            start = b * bucket
+            lo = y[start]
+            hi = lo
+            for j in range(start + 1, start + bucket):
+                v = y[j]
+                if v < lo:
+                    lo = v
+                elif v > hi:
+                    hi = v
+            out_min[b] = lo
+            out_max[b] = hi
+else:
+    def minmax_bucket(y, out_min, out_max, bucket):
+        """NumPy fallback for minmax_bucket when numba is not installed (same contract)."""
+        blocks = y[:out_min.size * bucket].reshape(out_min.size, bucket)
+        np.min(blocks, axis=1, out=out_min)
+        np.max(blocks, axis=1, out=out_max)
+
+
+def minmax_downsample(x, y, n_buckets):
+    """
+    Decimates a trace to at most about 2 * n_buckets points for drawing. The samples are
+    split into n_buckets equal runs and each run is replaced by its minimum and maximum,
+    so the visible envelope (including single-sample spikes) is preserved.
+
+    :param x: 1-D array of monotonically increasing x values.
+    :param y: 1-D array of y values, same size as x.
+    :param n_buckets: Number of buckets to reduce to (e.g. half the plot width in pixels).
+    :return: (x, y) decimated, or the inputs unchanged if they are already small enough.
+    """
+    n = y.size
+    bucket = n // n_buckets if n_buckets > 0 else 0
+    if bucket < 2:
+        return x, y
+
+    n_full = n_buckets * bucket # Leftover tail samples (< bucket) are kept as-is
+    n_out = 2 * n_buckets
+    y = np.ascontiguousarray(y)
+    bucket_min = np.empty(n_buckets, dtype=y.dtype)
+    bucket_max = np.empty(n_buckets, dtype=y.dtype)
+    minmax_bucket(y, bucket_min, bucket_max, bucket)
+
+    y_out = np.empty(n_out + (n - n_full), dtype=y.dtype)
+    y_out[0:n_out:2] = bucket_min
+    y_out[1:n_out:2] = bucket_max
+    y_out[n_out:] = y[n_full:]
+
+    # Min at the bucket's first x, max at its last, so x stays increasing
+    x_out = np.empty(y_out.size, dtype=x.dtype)
+    x_out[0:n_out:2] = x[0:n_full:bucket]
+    x_out[1:n_out:2] = x[bucket - 1:n_full:bucket]
+    x_out[n_out:] = x[n_full:]
+    return x_out, y_out